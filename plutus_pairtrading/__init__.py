@@ -5,8 +5,20 @@ from .data_acquisitions.data_acquisition import (
     combine_dataframes,
     fetch_and_store_tickers,
     read_and_combine_ticker_files,
+    load_data,
+    store_data,
 )
 
+from .data_acquisitions.storage import (
+    StorageBackend,
+    CSVStorage,
+    ParquetStorage,
+    FeatherStorage,
+    register_storage_backend,
+)
+
+from .data_acquisitions.panel_store import PanelStore
+
 from .data_generations.data_generation import (
     compute_returns,
     return_logs,
@@ -17,6 +29,9 @@ from .data_generations.data_generation import (
     compute_correlation_dataframe,
     slice_data_with_dates,
     pairs_identification,
+    iter_pairs_identification,
+    basket_identification,
+    iter_basket_identification,
 )
 
 from .data_visualizations.plots import (
@@ -31,12 +46,34 @@ from .tests.stationarity_tests import (
     augmented_dickey_fuller_test,
     philips_perron_test,
     KPSS_test,
+    enable_stationarity_cache,
+    disable_stationarity_cache,
+    stationarity_cache_info,
+    batch_augmented_dickey_fuller_test,
+    batch_philips_perron_test,
+    batch_KPSS_test,
 )
 
 from .tests.cointegration_tests import (
     engle_granger_cointegration_test,
     phillips_ouliaris_cointegration_test,
     johansen_cointegration_test,
+    batch_engle_granger_cointegration_test,
+    batch_johansen_cointegration_test,
+    gregory_hansen_cointegration_test,
+    hatemi_j_cointegration_test,
+    IncrementalEngleGranger,
+    rolling_cointegration,
+    CointegrationResult,
+    enable_cointegration_store,
+    disable_cointegration_store,
+    cointegration_store_info,
+)
+
+from .utils.precision import (
+    set_precision,
+    get_precision,
+    compute_precision,
 )
 
 from .utils.performance import _log_execution_time
@@ -64,6 +101,14 @@ __all__ = [
     "combine_dataframes",
     "fetch_and_store_tickers",
     "read_and_combine_ticker_files",
+    "load_data",
+    "store_data",
+    "StorageBackend",
+    "CSVStorage",
+    "ParquetStorage",
+    "FeatherStorage",
+    "register_storage_backend",
+    "PanelStore",
     "compute_returns",
     "return_logs",
     "return_exps",
@@ -73,6 +118,9 @@ __all__ = [
     "compute_correlation_dataframe",
     "slice_data_with_dates",
     "pairs_identification",
+    "iter_pairs_identification",
+    "basket_identification",
+    "iter_basket_identification",
     "plot_timeseries",
     "plot_dual_timeseries",
     "plot_correlation_matrix",
@@ -81,9 +129,28 @@ __all__ = [
     "augmented_dickey_fuller_test",
     "philips_perron_test",
     "KPSS_test",
+    "enable_stationarity_cache",
+    "disable_stationarity_cache",
+    "stationarity_cache_info",
+    "batch_augmented_dickey_fuller_test",
+    "batch_philips_perron_test",
+    "batch_KPSS_test",
     "engle_granger_cointegration_test",
     "phillips_ouliaris_cointegration_test",
     "johansen_cointegration_test",
+    "batch_engle_granger_cointegration_test",
+    "batch_johansen_cointegration_test",
+    "gregory_hansen_cointegration_test",
+    "hatemi_j_cointegration_test",
+    "IncrementalEngleGranger",
+    "rolling_cointegration",
+    "CointegrationResult",
+    "enable_cointegration_store",
+    "disable_cointegration_store",
+    "cointegration_store_info",
+    "set_precision",
+    "get_precision",
+    "compute_precision",
 ]
 
 __version__ = "0.1.0"
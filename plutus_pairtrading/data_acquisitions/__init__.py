@@ -4,6 +4,14 @@ from .data_acquisition import fetch_yahoo_finance_data
 from .data_acquisition import combine_dataframes
 from .data_acquisition import fetch_and_store_tickers
 from .data_acquisition import read_and_combine_ticker_files
+from .data_acquisition import load_data
+from .data_acquisition import store_data
+from .storage import StorageBackend
+from .storage import CSVStorage
+from .storage import ParquetStorage
+from .storage import FeatherStorage
+from .storage import register_storage_backend
+from .panel_store import PanelStore
 
 # Define what should be accessible at the data_acquisitions level
 __all__ = [
@@ -13,4 +21,12 @@ __all__ = [
     "combine_dataframes",
     "fetch_and_store_tickers",
     "read_and_combine_ticker_files",
+    "load_data",
+    "store_data",
+    "StorageBackend",
+    "CSVStorage",
+    "ParquetStorage",
+    "FeatherStorage",
+    "register_storage_backend",
+    "PanelStore",
 ]
@@ -1,10 +1,17 @@
 import os
+import time
+import threading
+import numpy as np
 import pandas as pd
 import yfinance as yf
+from pandas.errors import MergeError
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, List, Optional, Tuple, Dict, Union
 from functools import reduce
 
+from .panel_store import PanelStore
+from .storage import StorageBackend, get_storage_backend, _backend_from_path
 from ..utils.performance import _log_execution_time
 import logging
 
@@ -64,6 +71,67 @@ def store_data_as_csv(
     data.to_csv(file_path, index=include_index)
 
 
+@_log_execution_time
+def load_data(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    date_column: str = "date",
+    storage_format: Optional[Union[str, StorageBackend]] = None,
+) -> pd.DataFrame:
+    """
+    Load a time series file of any storage format into a DataFrame.
+
+    Args:
+        file_path (str): Path to the file.
+        columns (Optional[List[str]], optional): Columns to read; missing ones are ignored. Defaults to None (all columns).
+        start_date (Optional[str], optional): First date to read, inclusive. Defaults to None.
+        end_date (Optional[str], optional): Last date to read, inclusive. Defaults to None.
+        date_column (str, optional): Name of the date column to set as index. Defaults to "date".
+        storage_format (Optional[Union[str, StorageBackend]], optional): "csv", "parquet", "feather" or a
+            backend. Defaults to None (from the file extension).
+
+    Returns:
+        pd.DataFrame: Loaded DataFrame.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} does not exist.")
+    backend = (
+        _backend_from_path(file_path)
+        if storage_format is None
+        else get_storage_backend(storage_format)
+    )
+    return backend.read(file_path, columns, start_date, end_date, date_column)
+
+
+@_log_execution_time
+def store_data(
+    data: pd.DataFrame,
+    file_path: str,
+    storage_format: Optional[Union[str, StorageBackend]] = None,
+) -> None:
+    """
+    Save a time series DataFrame in any storage format, its index stored as a column.
+
+    Args:
+        data (pd.DataFrame): DataFrame to save.
+        file_path (str): Destination file path.
+        storage_format (Optional[Union[str, StorageBackend]], optional): "csv", "parquet", "feather" or a
+            backend. Defaults to None (from the file extension).
+    """
+    ensure_directory_exists(os.path.dirname(file_path))
+    backend = (
+        _backend_from_path(file_path)
+        if storage_format is None
+        else get_storage_backend(storage_format)
+    )
+    backend.write(data, file_path)
+
+
 @_log_execution_time
 def fetch_yahoo_finance_data(
     ticker: str,
@@ -92,6 +160,33 @@ def fetch_yahoo_finance_data(
     if end_date is None:
         end_date = date.today().strftime("%Y-%m-%d")
 
+    # Fetch data from Yahoo Finance
+    raw_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+    return _format_yahoo_data(raw_data, ticker, ticker_prefix, column_mapping)
+
+
+def _format_yahoo_data(
+    raw_data: pd.DataFrame,
+    ticker: str,
+    ticker_prefix: bool = True,
+    column_mapping: Dict[str, str] = None,
+) -> pd.DataFrame:
+    """
+    Renames and selects the columns of a ticker downloaded from Yahoo Finance.
+
+    Args:
+        raw_data (pd.DataFrame): Data of the ticker as returned by Yahoo Finance.
+        ticker (str): Stock ticker symbol.
+        ticker_prefix (bool, optional): If True, prefixes columns with the ticker name. Defaults to True.
+        column_mapping (Dict[str, str], optional): Mapping of Yahoo Finance's column names to desired names.
+            Defaults to None (close, open, high, low and volume).
+
+    Returns:
+        pd.DataFrame: DataFrame containing historical data.
+
+    Raises:
+        ValueError: If none of the expected columns are found in the data.
+    """
     # Default column mapping
     if column_mapping is None:
         column_mapping = {
@@ -102,9 +197,6 @@ def fetch_yahoo_finance_data(
             "Volume": "volume",
         }
 
-    # Fetch data from Yahoo Finance
-    raw_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-
     # Handle MultiIndex columns
     if isinstance(raw_data.columns, pd.MultiIndex):
         raw_data.columns = raw_data.columns.get_level_values(0)
@@ -133,6 +225,87 @@ def fetch_yahoo_finance_data(
     return renamed_data
 
 
+def _combined_columns(
+    dataframes: List[pd.DataFrame], suffixes: Tuple[str, str]
+) -> List[str]:
+    """
+    Column names of the successive joins of the DataFrames, with the join's suffix rules.
+
+    At every join, the columns shared by the joined frame and the columns so far get the
+    left suffix on the left side and the right suffix on the right side.
+
+    Args:
+        dataframes (List[pd.DataFrame]): DataFrames in join order.
+        suffixes (Tuple[str, str]): Suffixes of the overlapping columns.
+
+    Returns:
+        List[str]: Combined column names, in order.
+
+    Raises:
+        ValueError: If columns overlap and no suffix is specified.
+        MergeError: If the suffixes create duplicated columns.
+    """
+    names = list(dataframes[0].columns)
+    seen = set(names)
+    for df in dataframes[1:]:
+        overlap = seen.intersection(df.columns)
+        if overlap:
+            if not suffixes[0] and not suffixes[1]:
+                raise ValueError(
+                    f"columns overlap but no suffix specified: {sorted(overlap)}"
+                )
+            left = [
+                f"{name}{suffixes[0]}" if name in overlap else name for name in names
+            ]
+            right = [
+                f"{col}{suffixes[1]}" if col in overlap else col for col in df.columns
+            ]
+            duplicates = [
+                label
+                for labels, original in ((left, names), (right, list(df.columns)))
+                for label in pd.Index(labels)[
+                    pd.Index(labels).duplicated() & ~pd.Index(original).duplicated()
+                ]
+            ]
+            if duplicates:
+                raise MergeError(
+                    f"Passing 'suffixes' which cause duplicate columns {set(duplicates)} is not allowed."
+                )
+            names = left
+            seen = set(names)
+        else:
+            right = list(df.columns)
+        names.extend(right)
+        seen.update(right)
+    return names
+
+
+def _single_pass_supported(dataframes: List[pd.DataFrame], join_type: str) -> bool:
+    """
+    Whether the DataFrames can be combined by position into preallocated blocks.
+
+    Requires an inner, outer or left join (successive right joins drop the rows missing from
+    any later index), unique indexes (joins on duplicated labels multiply rows) and numeric
+    NumPy columns (other dtypes keep their own missing-value handling).
+
+    Args:
+        dataframes (List[pd.DataFrame]): DataFrames to combine.
+        join_type (str): Type of join.
+
+    Returns:
+        bool: True if the single-pass combination applies.
+    """
+    if join_type not in ("inner", "outer", "left"):
+        return False
+    for df in dataframes:
+        if not df.index.is_unique:
+            return False
+        for dtype in df.dtypes:
+            if not isinstance(dtype, np.dtype) or dtype.kind not in "iufc":
+                return False
+    return True
+
+
 @_log_execution_time
 def combine_dataframes(
     dataframes: List[pd.DataFrame],
@@ -142,6 +315,11 @@ def combine_dataframes(
     """
     Combine multiple DataFrames by joining on their indices.
 
+    The result is the one of joining the DataFrames one after the other, but the combined
+    index is built once and each DataFrame's columns are written by position into one
+    preallocated block per dtype, so the data is copied once instead of at every join.
+    Right joins, duplicated index labels and non-numeric columns fall back to successive joins.
+
     Args:
         dataframes (List[pd.DataFrame]): List of DataFrames to combine.
         join_type (str, optional): Type of join to perform ('inner', 'outer', etc.). Defaults to "inner".
@@ -158,17 +336,399 @@ def combine_dataframes(
         if not df.index.name:
             df.index.name = "date"
 
-    # Combine dataframes using reduce and join
-    combined = reduce(
-        lambda left, right: left.join(
-            right, how=join_type, lsuffix=suffixes[0], rsuffix=suffixes[1]
-        ),
-        dataframes,
-    )
+    if len(dataframes) == 1:
+        return dataframes[0]
+
+    if not _single_pass_supported(dataframes, join_type):
+        # Combine dataframes using reduce and join
+        return reduce(
+            lambda left, right: left.join(
+                right, how=join_type, lsuffix=suffixes[0], rsuffix=suffixes[1]
+            ),
+            dataframes,
+        )
+
+    columns = _combined_columns(dataframes, suffixes)
+    index = dataframes[0].index
+    for df in dataframes[1:]:
+        index = index.join(df.index, how=join_type)
+
+    # Rows of the combined index in each DataFrame, None where the index is the same
+    row_indexers, missing_rows = [], []
+    for df in dataframes:
+        rows = None if df.index.equals(index) else df.index.get_indexer(index)
+        missing = None if rows is None else np.flatnonzero(rows < 0)
+        row_indexers.append(rows)
+        missing_rows.append(missing if missing is not None and len(missing) else None)
+
+    # Integer columns with missing rows become float, as in a join
+    dtypes = []
+    for df, missing in zip(dataframes, missing_rows):
+        for dtype in df.dtypes:
+            dtypes.append(
+                np.dtype(np.float64)
+                if missing is not None and dtype.kind in "iu"
+                else dtype
+            )
 
+    # One block per dtype, stored column by column
+    positions = {}
+    for position, dtype in enumerate(dtypes):
+        positions.setdefault(dtype, []).append(position)
+    blocks = {
+        dtype: np.empty((len(block_positions), len(index)), dtype=dtype)
+        for dtype, block_positions in positions.items()
+    }
+    block_rows = np.empty(len(dtypes), dtype=np.intp)
+    for block_positions in positions.values():
+        block_rows[block_positions] = np.arange(len(block_positions))
+
+    # Fill each DataFrame's columns of every dtype at once
+    start = 0
+    for df, rows, missing in zip(dataframes, row_indexers, missing_rows):
+        frame_positions = np.arange(start, start + df.shape[1])
+        frame_dtypes = df.dtypes.to_numpy()
+        for dtype in pd.unique(frame_dtypes):
+            columns_of_dtype = np.flatnonzero(frame_dtypes == dtype)
+            targets = frame_positions[columns_of_dtype]
+            block = blocks[dtypes[targets[0]]]
+            # An empty DataFrame has nothing to take, all its rows are missing
+            if len(df):
+                if len(columns_of_dtype) == df.shape[1]:
+                    values = df.to_numpy()
+                else:
+                    values = df.iloc[:, columns_of_dtype].to_numpy()
+                if rows is not None:
+                    values = values.take(rows, axis=0)
+                block[block_rows[targets]] = values.T
+            if missing is not None:
+                block[np.ix_(block_rows[targets], missing)] = np.nan
+        start += df.shape[1]
+
+    parts = [
+        pd.DataFrame(block.T, index=index, copy=False) for block in blocks.values()
+    ]
+    combined = parts[0]
+    if len(parts) > 1:
+        order = np.concatenate(list(positions.values()))
+        combined = pd.concat(parts, axis=1).iloc[:, np.argsort(order)]
+    combined.columns = pd.Index(columns)
+
+    nbytes = sum(block.nbytes for block in blocks.values())
+    logger.info(
+        "Combined %d DataFrames into %d rows x %d columns (%.1f MB in %d blocks)",
+        len(dataframes),
+        len(index),
+        len(columns),
+        nbytes / 2**20,
+        len(blocks),
+    )
     return combined
 
 
+class _RateLimiter:
+    """
+    Spaces requests evenly so that at most ``rate`` start per second, across threads.
+
+    Args:
+        rate (Optional[float]): Maximum number of requests per second. None disables the limit.
+    """
+
+    def __init__(self, rate: Optional[float]) -> None:
+        self.interval = 0.0 if rate is None else 1.0 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, requests: int = 1) -> None:
+        """
+        Blocks until the next ``requests`` requests are allowed to start.
+
+        Args:
+            requests (int, optional): Number of requests reserved. Defaults to 1.
+        """
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + requests * self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _download_batch(
+    download: Callable[..., pd.DataFrame],
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    timeout: Optional[float],
+    limiter: _RateLimiter,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Downloads several tickers with one multi-ticker request.
+
+    Args:
+        download (Callable[..., pd.DataFrame]): Download function with the signature of ``yf.download``.
+        tickers (List[str]): Ticker symbols to download.
+        start_date (str): Start date for the data.
+        end_date (str): End date for the data.
+        timeout (Optional[float]): Timeout in seconds of the request of each ticker.
+        limiter (_RateLimiter): Rate limiter shared by the downloads, one request per ticker.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Raw data of the tickers that returned any, by ticker.
+    """
+    limiter.acquire(len(tickers))
+    kwargs = {} if timeout is None else {"timeout": timeout}
+    raw_data = download(
+        list(tickers),
+        start=start_date,
+        end=end_date,
+        progress=False,
+        group_by="ticker",
+        threads=False,
+        multi_level_index=True,
+        **kwargs,
+    )
+    if raw_data is None or raw_data.empty:
+        return {}
+
+    frames = {}
+    for ticker in tickers:
+        if isinstance(raw_data.columns, pd.MultiIndex):
+            if ticker not in raw_data.columns.get_level_values(0):
+                continue
+            data = raw_data[ticker]
+        elif len(tickers) == 1:
+            data = raw_data
+        else:
+            continue
+        # Yahoo Finance returns empty columns for the tickers it failed to download
+        data = data.dropna(how="all")
+        if not data.empty:
+            frames[ticker] = data
+    return frames
+
+
+def _fetch_batch(
+    download: Callable[..., pd.DataFrame],
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    timeout: Optional[float],
+    limiter: _RateLimiter,
+    max_retries: int,
+    backoff: float,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    Downloads a batch of tickers, retrying the missing ones with exponential backoff.
+
+    Args:
+        download (Callable[..., pd.DataFrame]): Download function with the signature of ``yf.download``.
+        tickers (List[str]): Ticker symbols to download.
+        start_date (str): Start date for the data.
+        end_date (str): End date for the data.
+        timeout (Optional[float]): Timeout in seconds of the request of each ticker.
+        limiter (_RateLimiter): Rate limiter shared by the downloads.
+        max_retries (int): Number of retries of the tickers still missing.
+        backoff (float): Wait in seconds before the first retry, doubled at every retry.
+
+    Returns:
+        Tuple[Dict[str, pd.DataFrame], Dict[str, str]]: Raw data of the downloaded tickers, and
+            the last error of the tickers that could not be downloaded.
+    """
+    fetched, pending, errors = {}, list(tickers), {}
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            frames = _download_batch(
+                download, pending, start_date, end_date, timeout, limiter
+            )
+            error = "no data returned"
+        except Exception as e:
+            frames, error = {}, str(e)
+        fetched.update(frames)
+        pending = [ticker for ticker in pending if ticker not in frames]
+        errors.update({ticker: error for ticker in pending})
+        if not pending:
+            break
+    return fetched, {ticker: errors[ticker] for ticker in pending}
+
+
+def _download_tickers(
+    starts: Dict[str, str],
+    download: Callable[..., pd.DataFrame],
+    end_date: str,
+    ticker_prefix: bool,
+    column_mapping: Optional[Dict[str, str]],
+    max_workers: int,
+    batch_size: int,
+    limiter: _RateLimiter,
+    max_retries: int,
+    backoff: float,
+    timeout: Optional[float],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Downloads and formats many tickers in concurrent batches.
+
+    Tickers are batched with the tickers starting at the same date, in their order.
+
+    Args:
+        starts (Dict[str, str]): Start date of every ticker to download.
+        download (Callable[..., pd.DataFrame]): Download function with the signature of ``yf.download``.
+        end_date (str): End date for the data.
+        ticker_prefix (bool): If True, prefixes columns with ticker names.
+        column_mapping (Optional[Dict[str, str]]): Mapping of Yahoo Finance's column names to desired names.
+        max_workers (int): Number of download threads.
+        batch_size (int): Number of tickers per multi-ticker download.
+        limiter (_RateLimiter): Rate limiter shared by the downloads.
+        max_retries (int): Number of retries of a ticker that failed to download.
+        backoff (float): Wait in seconds before the first retry, doubled at every retry.
+        timeout (Optional[float]): Timeout in seconds of the request of each ticker.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Formatted data of the downloaded tickers, by ticker. Failures are logged.
+    """
+    groups: Dict[str, List[str]] = {}
+    for ticker, start in starts.items():
+        groups.setdefault(start, []).append(ticker)
+    batches = [
+        (start, group[first : first + batch_size])
+        for start, group in groups.items()
+        for first in range(0, len(group), batch_size)
+    ]
+
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _fetch_batch,
+                download,
+                batch,
+                start,
+                end_date,
+                timeout,
+                limiter,
+                max_retries,
+                backoff,
+            )
+            for start, batch in batches
+        ]
+        for future in as_completed(futures):
+            frames, errors = future.result()
+            for ticker, error in errors.items():
+                logger.warning(f"Failed to fetch data for {ticker}: {error}")
+
+            for ticker, raw_data in frames.items():
+                try:
+                    fetched[ticker] = _format_yahoo_data(
+                        raw_data, ticker, ticker_prefix, column_mapping
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to fetch data for {ticker}: {e}")
+    return fetched
+
+
+def _read_stored_ticker(
+    output_dir: str, ticker: str, backend: StorageBackend
+) -> Optional[pd.DataFrame]:
+    """
+    Reads the stored history of a ticker, if any.
+
+    Args:
+        output_dir (str): Directory of the ticker files.
+        ticker (str): Stock ticker symbol.
+        backend (StorageBackend): Storage backend of the files.
+
+    Returns:
+        Optional[pd.DataFrame]: Stored history, or None if the file is missing, empty or unreadable.
+    """
+    file_path = os.path.join(output_dir, f"{ticker}{backend.extension}")
+    if not os.path.exists(file_path):
+        return None
+    try:
+        stored = backend.read(file_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {file_path}: {e}")
+        return None
+    return stored if len(stored) else None
+
+
+def _merge_refresh(
+    stored: pd.DataFrame, fresh: pd.DataFrame, tolerance: float
+) -> Optional[pd.DataFrame]:
+    """
+    Appends a refreshed range to the stored history of a ticker.
+
+    The fresh data starts at the second-to-last stored date. Stored rows before the last one
+    are settled, so a difference on them means the history was restated (split or dividend
+    adjustment) and must be refetched. The last stored row may have been a partial session
+    and is replaced by the fresh one.
+
+    Args:
+        stored (pd.DataFrame): Stored history.
+        fresh (pd.DataFrame): Data downloaded from the second-to-last stored date.
+        tolerance (float): Relative difference above which a stored value counts as restated.
+
+    Returns:
+        Optional[pd.DataFrame]: Merged history, or None if the stored history must be refetched.
+    """
+    if list(stored.columns) != list(fresh.columns):
+        return None
+    settled = stored.index[:-1]
+    overlap = settled.intersection(fresh.index)
+    if len(settled) and not len(overlap):
+        return None
+    if not np.allclose(
+        fresh.loc[overlap].to_numpy(dtype=float),
+        stored.loc[overlap].to_numpy(dtype=float),
+        rtol=tolerance,
+        atol=0.0,
+        equal_nan=True,
+    ):
+        return None
+    merged = pd.concat([stored[stored.index < fresh.index[0]], fresh])
+    merged.index.name = "date"
+    return merged
+
+
+def _write_atomically(
+    data: pd.DataFrame, file_path: str, backend: StorageBackend
+) -> None:
+    """
+    Writes a file through a temporary file, so readers never see a partial file.
+
+    Args:
+        data (pd.DataFrame): DataFrame to save.
+        file_path (str): Destination file path.
+        backend (StorageBackend): Storage backend of the file.
+    """
+    temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        backend.write(data, temp_path)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _strip_ticker_prefixes(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Removes the ticker prefix of the columns of each ticker, as stored in a panel.
+
+    Args:
+        frames (Dict[str, pd.DataFrame]): Data by ticker.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Data by ticker with unprefixed field columns.
+    """
+    return {
+        ticker: data.rename(columns=lambda col: col.removeprefix(f"{ticker}_"))
+        for ticker, data in frames.items()
+    }
+
+
 @_log_execution_time
 def fetch_and_store_tickers(
     tickers: List[str],
@@ -178,57 +738,154 @@ def fetch_and_store_tickers(
     ticker_prefix: bool = True,
     column_mapping: Dict[str, str] = None,
     join_type: str = "inner",
+    max_workers: int = 1,
+    batch_size: int = 1,
+    requests_per_second: Optional[float] = None,
+    max_retries: int = 0,
+    backoff: float = 1.0,
+    timeout: Optional[float] = None,
+    download: Optional[Callable[..., pd.DataFrame]] = None,
+    incremental: bool = False,
+    restatement_tolerance: float = 1e-6,
+    storage_format: Union[str, StorageBackend] = "csv",
+    panel: bool = False,
 ) -> tuple[pd.DataFrame, List[str]]:
     """
     Fetch historical data for a list of tickers, save them as CSV files, and return combined data and failed tickers.
 
+    Tickers are downloaded in batches of ``batch_size`` with Yahoo Finance's multi-ticker
+    download, by a pool of ``max_workers`` threads. The requests of all threads share a rate
+    limit, and the tickers of a batch that return no data are retried with exponential backoff.
+
+    In incremental mode, a ticker with a stored file is only downloaded from its second-to-last
+    stored date and the new rows are merged into the file, which is replaced atomically. If the
+    overlapping stored values changed (e.g. adjusted prices restated after a split or dividend),
+    the ticker alone is refetched from ``start_date``.
+
+    With ``panel``, the data is appended to a single ``PanelStore`` in ``output_dir`` instead of
+    one file per ticker, and later read back with ``PanelStore(output_dir).read``.
+
     Args:
         tickers (List[str]): List of ticker symbols to fetch.
-        output_dir (str): Directory to save CSV files.
+        output_dir (str): Directory to save the ticker files.
         start_date (str, optional): Start date for fetching data. Defaults to "2010-01-01".
         end_date (Optional[str], optional): End date for fetching data. Defaults to None (current date).
         ticker_prefix (bool, optional): If True, prefixes columns with ticker names. Defaults to True.
         column_mapping (Dict[str, str], optional): Mapping of Yahoo Finance's column names to desired names.
             Example: {"Close": "close", "Open": "open", "High": "high", "Low": "low", "Volume": "volume"}.
         join_type (str, optional): Type of join operation for combining data ('inner', 'outer'). Defaults to "inner".
+        max_workers (int, optional): Number of download threads. Defaults to 1.
+        batch_size (int, optional): Number of tickers per multi-ticker download. Defaults to 1.
+        requests_per_second (Optional[float], optional): Maximum number of ticker requests started per second,
+            across threads. Defaults to None (no limit).
+        max_retries (int, optional): Number of retries of a ticker that failed to download. Defaults to 0.
+        backoff (float, optional): Wait in seconds before the first retry, doubled at every retry. Defaults to 1.0.
+        timeout (Optional[float], optional): Timeout in seconds of the request of each ticker.
+            Defaults to None (Yahoo Finance's default).
+        download (Optional[Callable[..., pd.DataFrame]], optional): Download function with the signature of
+            ``yf.download``, e.g. a local stand-in for tests. Defaults to None (``yf.download``).
+        incremental (bool, optional): If True, only fetches the dates missing from the stored files
+            and merges them in. Defaults to False (full download, files overwritten).
+        restatement_tolerance (float, optional): Relative difference between stored and refetched
+            values that triggers a full refetch in incremental mode. Defaults to 1e-6.
+        storage_format (Union[str, StorageBackend], optional): Format of the ticker files: "csv",
+            "parquet", "feather" or a backend instance. Defaults to "csv".
+        panel (bool, optional): If True, stores the data in a consolidated panel in ``output_dir``
+            (``storage_format`` is then ignored). Defaults to False.
 
     Returns:
         tuple[pd.DataFrame, List[str]]:
-            - Combined DataFrame of successfully fetched tickers.
+            - Combined DataFrame of successfully fetched tickers (full stored history in incremental
+              mode), in the order of ``tickers``.
             - List of tickers that failed to fetch data.
+
+    Raises:
+        ValueError: If ``max_workers`` or ``batch_size`` is not positive.
     """
+    if max_workers < 1 or batch_size < 1:
+        raise ValueError("max_workers and batch_size must be positive integers.")
     if end_date is None:
         end_date = date.today().strftime("%Y-%m-%d")
 
     # Ensure the output directory exists
     ensure_directory_exists(output_dir)
 
-    failed_tickers = []
-    dataframes = []
+    backend = get_storage_backend(storage_format)
+    download = yf.download if download is None else download
+    limiter = _RateLimiter(requests_per_second)
+    options = dict(
+        download=download,
+        end_date=end_date,
+        ticker_prefix=ticker_prefix,
+        column_mapping=column_mapping,
+        max_workers=max_workers,
+        batch_size=batch_size,
+        limiter=limiter,
+        max_retries=max_retries,
+        backoff=backoff,
+        timeout=timeout,
+    )
 
-    for ticker in tickers:
-        try:
-            # Fetch data for the ticker
-            data = fetch_yahoo_finance_data(
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-                ticker_prefix=ticker_prefix,
-                column_mapping=column_mapping,
-            )
+    # Incremental mode resumes every stored ticker from its second-to-last stored date
+    stored, starts = {}, {ticker: start_date for ticker in tickers}
+    panel_store = PanelStore(output_dir) if panel else None
+    if incremental and panel:
+        stored = panel_store.tails(tickers)
+        for ticker, stored_data in stored.items():
+            starts[ticker] = stored_data.index[0].strftime("%Y-%m-%d")
+    elif incremental:
+        for ticker in tickers:
+            stored_data = _read_stored_ticker(output_dir, ticker, backend)
+            if stored_data is not None:
+                stored[ticker] = stored_data
+                starts[ticker] = stored_data.index[max(len(stored_data) - 2, 0)]
+                starts[ticker] = starts[ticker].strftime("%Y-%m-%d")
+
+    fetched = _download_tickers(starts, **options)
+    if panel:
+        fetched = _strip_ticker_prefixes(fetched)
+
+    restated = []
+    for ticker in [ticker for ticker in stored if ticker in fetched]:
+        merged = _merge_refresh(stored[ticker], fetched[ticker], restatement_tolerance)
+        if merged is None:
+            restated.append(ticker)
+            del fetched[ticker]
+        else:
+            fetched[ticker] = merged
+    if restated:
+        logger.info(f"Stored history restated for {restated}, refetching in full.")
+        refetched = _download_tickers(
+            {ticker: start_date for ticker in restated}, **options
+        )
+        if panel:
+            refetched = _strip_ticker_prefixes(refetched)
+        fetched.update(refetched)
+
+    failed_tickers = [ticker for ticker in tickers if ticker not in fetched]
+    if panel:
+        # Full histories (new, non-incremental or restated tickers) replace the stored rows
+        full_histories = [
+            ticker for ticker in fetched if ticker not in stored or ticker in restated
+        ]
+        panel_store.append(fetched, replace=full_histories)
+        logger.info(f"Data for {len(fetched)} tickers saved to {output_dir}")
+        combined_data = panel_store.read(
+            [ticker for ticker in tickers if ticker in fetched],
+            join_type=join_type,
+            ticker_prefix=ticker_prefix,
+        )
+        return combined_data, failed_tickers
 
-            # Save to CSV
-            file_path = os.path.join(output_dir, f"{ticker}.csv")
-            data.to_csv(file_path)
+    for ticker in tickers:
+        if ticker in fetched:
+            # Save in the storage format
+            file_path = os.path.join(output_dir, f"{ticker}{backend.extension}")
+            _write_atomically(fetched[ticker], file_path, backend)
             logger.info(f"Data for {ticker} saved to {file_path}")
 
-            # Append to the list of DataFrames
-            dataframes.append(data)
-        except Exception as e:
-            logger.warning(f"Failed to fetch data for {ticker}: {e}")
-            failed_tickers.append(ticker)
-
-    # Combine all DataFrames
+    # Combine all DataFrames, in the order of the tickers
+    dataframes = [fetched[ticker] for ticker in tickers if ticker in fetched]
     combined_data = combine_dataframes(dataframes, join_type=join_type)
     return combined_data, failed_tickers
 
@@ -240,17 +897,27 @@ def read_and_combine_ticker_files(
     date_column: str = "date",
     column_mapping: Optional[Dict[str, str]] = None,
     join_type: str = "inner",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    storage_format: Union[str, StorageBackend] = "csv",
 ) -> pd.DataFrame:
     """
     Read and combine data files for specified tickers from a directory, selecting columns based on mapping.
 
+    Only the columns of ``column_mapping`` and the rows between ``start_date`` and ``end_date`` are
+    read; the Parquet and Feather backends skip the other columns (and Parquet row groups) on disk.
+
     Args:
-        directory_path (str): Path to the directory containing CSV files.
+        directory_path (str): Path to the directory containing the ticker files.
         tickers (List[str]): List of ticker symbols to combine.
         date_column (str, optional): Name of the date column to set as index. Defaults to "date".
         column_mapping (Optional[Dict[str, str]], optional): Mapping of column names to desired names. If None, uses all columns.
             Example: {"Close": "close", "Open": "open", "High": "high", "Low": "low", "Volume": "volume"}.
         join_type (str, optional): Type of join operation ('inner', 'outer', etc.). Defaults to "inner".
+        start_date (Optional[str], optional): First date to read, inclusive. Defaults to None.
+        end_date (Optional[str], optional): Last date to read, inclusive. Defaults to None.
+        storage_format (Union[str, StorageBackend], optional): Format of the ticker files: "csv",
+            "parquet", "feather" or a backend instance. Defaults to "csv".
 
     Returns:
         pd.DataFrame: Combined DataFrame from the specified ticker files.
@@ -262,18 +929,23 @@ def read_and_combine_ticker_files(
     if not os.path.exists(directory_path):
         raise FileNotFoundError(f"Directory {directory_path} does not exist.")
 
-    ticker_files = [os.path.join(directory_path, f"{ticker}.csv") for ticker in tickers]
+    backend = get_storage_backend(storage_format)
+    ticker_files = [
+        os.path.join(directory_path, f"{ticker}{backend.extension}")
+        for ticker in tickers
+    ]
     valid_files = [file for file in ticker_files if os.path.exists(file)]
     if not valid_files:
         raise FileNotFoundError(
-            f"No CSV files found for specified tickers in {directory_path}."
+            f"No {backend.extension} files found for specified tickers in {directory_path}."
         )
 
+    columns = list(column_mapping) if column_mapping else None
     dataframes = []
     for file_path in valid_files:
         try:
-            data = pd.read_csv(
-                file_path, parse_dates=[date_column], index_col=date_column
+            data = backend.read(
+                file_path, columns, start_date, end_date, date_column=date_column
             )
             if column_mapping:
                 # Dynamically map and filter columns based on column_mapping
@@ -0,0 +1,354 @@
+"""
+This module provides a consolidated on-disk panel of many tickers, replacing one file per
+ticker.
+
+The panel is a Parquet dataset (a directory holding one part file per append) of long rows
+keyed by (date, ticker, field). Part files are named by a nanosecond sequence number and a
+random suffix, so concurrent appends never collide and parts are read in append order.
+Each part is sorted by ticker, so ticker and date filters skip whole row groups from their
+statistics. A read scans only the requested tickers, fields and dates and fills a single
+preallocated wide matrix; later appends win over earlier ones for the same key, which is
+how new dates are added. A full history replacing the stored one drops the ticker's older
+rows. The panel needs the ``parquet`` extra (pyarrow).
+
+Classes:
+    - PanelStore: Append-only (date, ticker, field) panel with wide-matrix reads.
+"""
+
+import os
+import glob
+import time
+import uuid
+import logging
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils.dependencies import _require_pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+class PanelStore:
+    """
+    Consolidated panel of ticker data, stored as a Parquet dataset of (date, ticker, field) rows.
+
+    Args:
+        path (str): Directory of the Parquet dataset.
+        row_group_size (int, optional): Number of rows per row group. Smaller groups let ticker
+            and date filters skip more data. Defaults to 100_000.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Example:
+        panel = PanelStore("data/panel")
+        panel.append({"AAPL": aapl_data, "MSFT": msft_data})
+        panel.read(["AAPL"], fields=["close"], start_date="2020-01-01")
+    """
+
+    def __init__(self, path: str, row_group_size: int = 100_000) -> None:
+        _require_pyarrow("PanelStore")
+        self.path = path
+        self.row_group_size = row_group_size
+
+    @staticmethod
+    def _sequence(part: str) -> int:
+        """Sequence number embedded in a part file name."""
+        return int(os.path.basename(part).split("-")[1])
+
+    def _parts(self) -> List[str]:
+        """Part files of the dataset, in append order."""
+        parts = glob.glob(os.path.join(self.path, "part-*-*.parquet"))
+        return sorted(parts, key=lambda part: (self._sequence(part), part))
+
+    def _part_path(self, sequence: Optional[int] = None) -> str:
+        """Path of a new part file, by default sequenced after every existing part."""
+        if sequence is None:
+            parts = self._parts()
+            sequence = time.time_ns()
+            if parts:
+                sequence = max(sequence, self._sequence(parts[-1]) + 1)
+        return os.path.join(
+            self.path, f"part-{sequence:020d}-{uuid.uuid4().hex}.parquet"
+        )
+
+    def _write_part(self, frame: pd.DataFrame, part: str) -> None:
+        """Writes a part file through a temporary file."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        temporary = f"{part}.tmp"
+        pq.write_table(table, temporary, row_group_size=self.row_group_size)
+        os.replace(temporary, part)
+
+    def append(
+        self, frames: Dict[str, pd.DataFrame], replace: Optional[List[str]] = None
+    ) -> None:
+        """
+        Appends the data of several tickers as one part file.
+
+        Args:
+            frames (Dict[str, pd.DataFrame]): Data by ticker, indexed by date, with one column per
+                field. Columns prefixed with the ticker name (e.g. "AAPL_close") are stored
+                under the unprefixed field.
+            replace (Optional[List[str]], optional): Tickers whose appended data is their full
+                history. Their rows in earlier parts are dropped once the new part is written.
+                Defaults to None.
+        """
+        long_frames = []
+        for ticker in sorted(frames):
+            data = frames[ticker]
+            if data.empty:
+                continue
+            prefix = f"{ticker}_"
+            fields = [
+                col[len(prefix) :] if col.startswith(prefix) else col
+                for col in data.columns
+            ]
+            values = data.to_numpy(dtype=float)
+            long_frames.append(
+                pd.DataFrame(
+                    {
+                        "date": np.tile(data.index.to_numpy(), len(fields)),
+                        "ticker": ticker,
+                        "field": np.repeat(fields, len(data)),
+                        "value": values.ravel(order="F"),
+                    }
+                )
+            )
+        if not long_frames:
+            return
+
+        frame = pd.concat(long_frames, ignore_index=True)
+        frame["ticker"] = frame["ticker"].astype("category")
+        frame["field"] = frame["field"].astype("category")
+        os.makedirs(self.path, exist_ok=True)
+        previous = self._parts()
+        part = self._part_path()
+        self._write_part(frame, part)
+        logger.info(f"Appended {len(frame)} rows of {len(frames)} tickers to {part}")
+        if replace:
+            self._drop(replace, previous)
+
+    def _drop(self, tickers: List[str], parts: List[str]) -> None:
+        """
+        Rewrites the given parts without the rows of some tickers.
+
+        Args:
+            tickers (List[str]): Tickers to drop.
+            parts (List[str]): Part files to rewrite.
+        """
+        import pyarrow.parquet as pq
+
+        for part in parts:
+            frame = pq.read_table(part).to_pandas()
+            kept = frame[~frame["ticker"].isin(tickers)]
+            if len(kept) == len(frame):
+                continue
+            if len(kept):
+                kept = kept.copy()
+                kept["ticker"] = kept["ticker"].astype(str).astype("category")
+                kept["field"] = kept["field"].astype(str).astype("category")
+                self._write_part(kept, part)
+            else:
+                os.remove(part)
+        logger.info(f"Dropped the earlier rows of {len(tickers)} tickers")
+
+    def _scan(
+        self,
+        columns: List[str],
+        tickers: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        parts: Optional[List[str]] = None,
+    ) -> List[pd.DataFrame]:
+        """
+        Reads the matching rows of every part, in append order, with the filters pushed down.
+        """
+        import pyarrow.parquet as pq
+
+        filters = []
+        if tickers is not None:
+            filters.append(("ticker", "in", list(tickers)))
+        if fields is not None:
+            filters.append(("field", "in", list(fields)))
+        if start_date is not None:
+            filters.append(("date", ">=", pd.Timestamp(start_date)))
+        if end_date is not None:
+            filters.append(("date", "<=", pd.Timestamp(end_date)))
+
+        return [
+            pq.read_table(part, columns=columns, filters=filters or None).to_pandas()
+            for part in (self._parts() if parts is None else parts)
+        ]
+
+    def tickers(self) -> List[str]:
+        """
+        Returns the tickers stored in the panel.
+
+        Returns:
+            List[str]: Sorted ticker symbols.
+        """
+        scans = self._scan(["ticker"])
+        if not scans:
+            return []
+        return sorted(set().union(*(scan["ticker"].unique() for scan in scans)))
+
+    def read(
+        self,
+        tickers: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        join_type: str = "outer",
+        ticker_prefix: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Reads a ticker subset and date window as a single wide matrix.
+
+        Only the matching rows are read from disk, and the matrix is filled in place by
+        position, without joining per-ticker frames.
+
+        Args:
+            tickers (Optional[List[str]], optional): Tickers to read, in column order. Tickers without
+                data are dropped. Defaults to None (every stored ticker, sorted).
+            fields (Optional[List[str]], optional): Fields to read, in column order. Defaults to None
+                (every stored field, in storage order).
+            start_date (Optional[str], optional): First date to read, inclusive. Defaults to None.
+            end_date (Optional[str], optional): Last date to read, inclusive. Defaults to None.
+            join_type (str, optional): "outer" keeps every date with data for any ticker, "inner" only
+                the dates with data for every ticker. Defaults to "outer".
+            ticker_prefix (bool, optional): If True, columns are named "<ticker>_<field>"; otherwise
+                they are a (ticker, field) MultiIndex. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Wide DataFrame indexed by date.
+
+        Raises:
+            ValueError: If the join type is not "inner" or "outer".
+        """
+        if join_type not in ("inner", "outer"):
+            raise ValueError("Invalid join type. Options are: 'inner', 'outer'.")
+
+        scans = [
+            scan
+            for scan in self._scan(
+                ["date", "ticker", "field", "value"],
+                tickers,
+                fields,
+                start_date,
+                end_date,
+            )
+            if len(scan)
+        ]
+        if tickers is None:
+            tickers = sorted(set().union(*(scan["ticker"].unique() for scan in scans)))
+        if fields is None:
+            fields = list(
+                pd.unique(np.concatenate([scan["field"].to_numpy() for scan in scans]))
+                if scans
+                else []
+            )
+        dates = (
+            np.unique(np.concatenate([scan["date"].to_numpy() for scan in scans]))
+            if scans
+            else np.array([], dtype="datetime64[ns]")
+        )
+
+        # Fill one preallocated matrix, later parts overwriting earlier ones
+        ticker_index, field_index = pd.Index(tickers), pd.Index(fields)
+        matrix = np.full((len(dates), len(tickers) * len(fields)), np.nan)
+        present = np.zeros((len(dates), len(tickers)), dtype=bool)
+        stored = np.zeros(len(tickers) * len(fields), dtype=bool)
+        for scan in scans:
+            rows = np.searchsorted(dates, scan["date"].to_numpy())
+            ticker_codes = ticker_index.get_indexer(scan["ticker"].to_numpy())
+            field_codes = field_index.get_indexer(scan["field"].to_numpy())
+            columns = ticker_codes * len(fields) + field_codes
+            matrix[rows, columns] = scan["value"].to_numpy()
+            present[rows, ticker_codes] = True
+            stored[columns] = True
+
+        keep = present.any(axis=0)
+        if join_type == "inner":
+            matrix = matrix[present[:, keep].all(axis=1)]
+            dates = dates[present[:, keep].all(axis=1)]
+        columns = pd.MultiIndex.from_product(
+            [ticker_index, field_index], names=["ticker", "field"]
+        )
+        selected = stored & np.repeat(keep, len(fields))
+        data = pd.DataFrame(
+            matrix[:, selected],
+            index=pd.DatetimeIndex(dates, name="date"),
+            columns=columns[selected],
+        )
+        if ticker_prefix:
+            data.columns = [f"{ticker}_{field}" for ticker, field in data.columns]
+        return data
+
+    def tails(self, tickers: List[str], rows: int = 2) -> Dict[str, pd.DataFrame]:
+        """
+        Reads the last stored rows of each ticker.
+
+        Args:
+            tickers (List[str]): Tickers to read.
+            rows (int, optional): Number of trailing dates per ticker. Defaults to 2.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Last rows by ticker, with unprefixed field columns. Tickers
+                without data are omitted.
+        """
+        scans = self._scan(["date", "ticker"], tickers)
+        if not scans:
+            return {}
+        keys = pd.concat(scans, ignore_index=True).drop_duplicates()
+        cutoffs = (
+            keys.groupby("ticker", observed=True)["date"]
+            .apply(lambda dates: dates.nlargest(rows).min())
+            .to_dict()
+        )
+        if not cutoffs:
+            return {}
+
+        window = self.read(
+            list(cutoffs), start_date=min(cutoffs.values()), ticker_prefix=False
+        )
+        return {
+            ticker: window[ticker][window.index >= cutoff].dropna(how="all")
+            for ticker, cutoff in cutoffs.items()
+        }
+
+    def compact(self) -> None:
+        """
+        Rewrites the dataset as one part file, keeping the last appended value of every key.
+        """
+        parts = self._parts()
+        if len(parts) < 2:
+            return
+        frame = pd.concat(
+            self._scan(["date", "ticker", "field", "value"], parts=parts),
+            ignore_index=True,
+        )
+        frame = frame.drop_duplicates(["date", "ticker", "field"], keep="last")
+        frame = frame.sort_values(["ticker", "field", "date"], kind="stable")
+        frame["ticker"] = frame["ticker"].astype(str).astype("category")
+        frame["field"] = frame["field"].astype(str).astype("category")
+
+        # The compacted part takes the place of the newest compacted part, before any
+        # part appended meanwhile
+        self._write_part(frame, self._part_path(self._sequence(parts[-1])))
+        for part in parts:
+            os.remove(part)
+        logger.info(f"Compacted {len(parts)} parts of {self.path}")
+
+    def clear(self) -> None:
+        """
+        Deletes the stored data.
+        """
+        for part in self._parts():
+            os.remove(part)
@@ -0,0 +1,280 @@
+"""
+This module provides the on-disk storage backends of the ticker files.
+
+Every backend stores one table per ticker, with the date index as a regular column, and
+reads it back with an optional column projection and date window. The CSV backend
+parses the whole file and filters it; the Parquet and Feather (Arrow IPC) backends go
+through ``pyarrow.dataset``, so only the requested columns are decoded and, for
+Parquet, row groups outside the date window are skipped from their statistics. The
+Parquet and Feather backends need the ``parquet`` extra (pyarrow).
+
+Classes and Functions:
+    - StorageBackend: Base class of the storage backends.
+    - CSVStorage: Text CSV files.
+    - ParquetStorage: Parquet files.
+    - FeatherStorage: Feather (Arrow IPC) files.
+    - register_storage_backend: Registers a backend under a format name.
+    - get_storage_backend: Returns the backend of a format name or instance.
+"""
+
+import os
+import logging
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+from ..utils.dependencies import _require_pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+class StorageBackend(ABC):
+    """
+    Base class of the storage backends of the ticker files.
+
+    Subclasses set ``extension`` and implement ``write`` and ``read``.
+    """
+
+    extension = ""
+
+    @abstractmethod
+    def write(self, data: pd.DataFrame, file_path: str) -> None:
+        """
+        Writes a DataFrame, its index stored as a column.
+
+        Args:
+            data (pd.DataFrame): DataFrame to save.
+            file_path (str): Destination file path.
+        """
+
+    @abstractmethod
+    def read(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        date_column: str = "date",
+    ) -> pd.DataFrame:
+        """
+        Reads a file into a DataFrame indexed by its date column.
+
+        Args:
+            file_path (str): Path to the file.
+            columns (Optional[List[str]], optional): Columns to read. Requested columns missing from
+                the file are ignored. Defaults to None (all columns).
+            start_date (Optional[str], optional): First date to read, inclusive. Defaults to None.
+            end_date (Optional[str], optional): Last date to read, inclusive. Defaults to None.
+            date_column (str, optional): Name of the date column. Defaults to "date".
+
+        Returns:
+            pd.DataFrame: Loaded DataFrame.
+        """
+
+
+class CSVStorage(StorageBackend):
+    """
+    Text CSV files. Columns are projected while parsing; dates are filtered after parsing.
+    """
+
+    extension = ".csv"
+
+    def write(self, data: pd.DataFrame, file_path: str) -> None:
+        data.to_csv(file_path)
+
+    def read(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        date_column: str = "date",
+    ) -> pd.DataFrame:
+        usecols = None
+        if columns is not None:
+            usecols = lambda column: column == date_column or column in columns
+        data = pd.read_csv(
+            file_path, usecols=usecols, parse_dates=[date_column], index_col=date_column
+        )
+        if columns is not None:
+            data = data[[column for column in columns if column in data.columns]]
+        if start_date is not None:
+            data = data[data.index >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            data = data[data.index <= pd.Timestamp(end_date)]
+        return data
+
+
+class _ArrowStorage(StorageBackend):
+    """
+    Files read through ``pyarrow.dataset``, with column projection and date filters.
+    """
+
+    format = ""
+
+    def _restrict(self, dataset: Any, date_filter: Any) -> Any:
+        """
+        Restricts a dataset to the parts that can match the date filter.
+
+        Args:
+            dataset (Any): ``pyarrow.dataset.Dataset`` of the file.
+            date_filter (Any): ``pyarrow.dataset.Expression`` on the date column.
+
+        Returns:
+            Any: Dataset to scan.
+        """
+        return dataset
+
+    def read(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        date_column: str = "date",
+    ) -> pd.DataFrame:
+        _require_pyarrow(f"The {self.format} storage format")
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(file_path, format=self.format)
+        if columns is not None:
+            names = dataset.schema.names
+            columns = [date_column] + [
+                column
+                for column in columns
+                if column in names and column != date_column
+            ]
+
+        # Filters on the date column are pushed down to the scan
+        date_filter = None
+        if start_date is not None:
+            date_filter = ds.field(date_column) >= pd.Timestamp(start_date)
+        if end_date is not None:
+            end_filter = ds.field(date_column) <= pd.Timestamp(end_date)
+            date_filter = (
+                end_filter if date_filter is None else date_filter & end_filter
+            )
+
+        if date_filter is not None:
+            dataset = self._restrict(dataset, date_filter)
+        table = dataset.to_table(columns=columns, filter=date_filter)
+        data = table.to_pandas().set_index(date_column)
+        data.index = pd.DatetimeIndex(data.index)
+        return data
+
+
+class ParquetStorage(_ArrowStorage):
+    """
+    Parquet files, compressed by column, with row-group statistics for date pushdown.
+
+    Args:
+        row_group_size (Optional[int], optional): Number of rows per row group. Smaller
+            groups let date filters skip more data. Defaults to None (pyarrow's default).
+    """
+
+    extension = ".parquet"
+    format = "parquet"
+
+    def __init__(self, row_group_size: Optional[int] = None) -> None:
+        self.row_group_size = row_group_size
+
+    def write(self, data: pd.DataFrame, file_path: str) -> None:
+        _require_pyarrow("The parquet storage format")
+        data.reset_index().to_parquet(
+            file_path, index=False, row_group_size=self.row_group_size
+        )
+
+    def _restrict(self, dataset: Any, date_filter: Any) -> Any:
+        """
+        Keeps the row groups whose date statistics can match the filter.
+        """
+        import pyarrow.dataset as ds
+
+        row_groups = [
+            row_group
+            for fragment in dataset.get_fragments()
+            for row_group in fragment.split_by_row_group(date_filter)
+        ]
+        total = sum(fragment.num_row_groups for fragment in dataset.get_fragments())
+        logger.debug(f"Scanning {len(row_groups)} of {total} row groups")
+        return ds.FileSystemDataset(
+            row_groups, dataset.schema, dataset.format, dataset.filesystem
+        )
+
+
+class FeatherStorage(_ArrowStorage):
+    """
+    Feather (Arrow IPC) files, stored in the in-memory Arrow layout and read without parsing.
+    """
+
+    extension = ".feather"
+    format = "feather"
+
+    def write(self, data: pd.DataFrame, file_path: str) -> None:
+        _require_pyarrow("The feather storage format")
+        data.reset_index().to_feather(file_path)
+
+
+_STORAGE_BACKENDS: Dict[str, StorageBackend] = {
+    "csv": CSVStorage(),
+    "parquet": ParquetStorage(),
+    "feather": FeatherStorage(),
+}
+
+
+def register_storage_backend(name: str, backend: StorageBackend) -> None:
+    """
+    Registers a storage backend under a format name.
+
+    Args:
+        name (str): Format name, e.g. "parquet".
+        backend (StorageBackend): Backend used for that format.
+    """
+    _STORAGE_BACKENDS[name.lower()] = backend
+
+
+def get_storage_backend(
+    storage_format: Union[str, StorageBackend] = "csv",
+) -> StorageBackend:
+    """
+    Returns the storage backend of a format name.
+
+    Args:
+        storage_format (Union[str, StorageBackend], optional): Registered format name ("csv",
+            "parquet", "feather") or a backend instance. Defaults to "csv".
+
+    Returns:
+        StorageBackend: Storage backend.
+
+    Raises:
+        ValueError: If the format is not registered.
+    """
+    if isinstance(storage_format, StorageBackend):
+        return storage_format
+    backend = _STORAGE_BACKENDS.get(storage_format.lower())
+    if backend is None:
+        options = ", ".join(f"'{name}'" for name in _STORAGE_BACKENDS)
+        raise ValueError(f"Invalid storage format. Options are: {options}.")
+    return backend
+
+
+def _backend_from_path(file_path: str) -> StorageBackend:
+    """
+    Returns the registered backend of a file extension.
+
+    Args:
+        file_path (str): Path with a registered extension.
+
+    Returns:
+        StorageBackend: Storage backend.
+
+    Raises:
+        ValueError: If no registered backend uses the extension.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    for backend in _STORAGE_BACKENDS.values():
+        if backend.extension == extension:
+            return backend
+    raise ValueError(f"No storage backend for the extension '{extension}'.")
@@ -7,7 +7,9 @@ from .data_generation import compute_correlation_matrix
 from .data_generation import compute_correlation_dataframe
 from .data_generation import slice_data_with_dates
 from .data_generation import pairs_identification
-
+from .data_generation import iter_pairs_identification
+from .data_generation import basket_identification
+from .data_generation import iter_basket_identification
 
 # Define what should be accessible at the data_generations level
 __all__ = [
@@ -20,4 +22,7 @@ __all__ = [
     "compute_correlation_dataframe",
     "slice_data_with_dates",
     "pairs_identification",
+    "iter_pairs_identification",
+    "basket_identification",
+    "iter_basket_identification",
 ]
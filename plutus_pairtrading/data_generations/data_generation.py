@@ -7,7 +7,11 @@ import pandas as pd
 import numpy as np
 import re
 
-from typing import List, Optional, Tuple
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+
+from itertools import combinations
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..tests.stationarity_tests import augmented_dickey_fuller_test
 from ..tests.stationarity_tests import philips_perron_test
@@ -16,8 +20,20 @@ from ..tests.stationarity_tests import KPSS_test
 from ..tests.cointegration_tests import engle_granger_cointegration_test
 from ..tests.cointegration_tests import phillips_ouliaris_cointegration_test
 from ..tests.cointegration_tests import johansen_cointegration_test
-
+from ..tests.cointegration_tests import batch_johansen_cointegration_test
+from ..tests.cointegration_tests import gregory_hansen_cointegration_test
+from ..tests.cointegration_tests import hatemi_j_cointegration_test
+
+from ..utils.multiple_testing import (
+    _OnlineTesting,
+    _adjust_pvalues,
+    _validate_multiple_testing,
+)
 from ..utils.performance import _log_execution_time
+from ..utils.cache import _fingerprint, _make_key
+from ..utils.parallel import _parallel_imap, _parallel_map
+from ..utils.precision import _CORRELATION_MARGIN, _compute_dtype
+from ..utils.sink import ResultSink
 import logging
 
 logger = logging.getLogger(__name__)
@@ -215,6 +231,63 @@ def get_date_range(data: pd.DataFrame) -> Tuple[str, str]:
     return start_date, end_date
 
 
+def _correlation_matrix(
+    data: pd.DataFrame,
+    securities: List[str],
+    method: str,
+    thresholds: Tuple[float, ...] = (),
+) -> pd.DataFrame:
+    """
+    Correlation matrix of the securities in the package precision.
+
+    In float32 mode, Pearson and Spearman correlations of complete data come from one
+    single-precision product of the standardized (ranked) prices, and the entries within
+    ``_CORRELATION_MARGIN`` of one of the thresholds are recomputed in float64. Otherwise the
+    matrix comes from pandas.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        securities (List[str]): Securities to correlate.
+        method (str): Correlation method ('pearson', 'kendall', 'spearman').
+        thresholds (Tuple[float, ...], optional): Thresholds the correlations are compared to. Defaults to ().
+
+    Returns:
+        pd.DataFrame: Correlation matrix.
+    """
+    prices = data[securities]
+    if (
+        _compute_dtype() == np.float64
+        or method not in ("pearson", "spearman")
+        or prices.isna().to_numpy().any()
+    ):
+        return prices.corr(method=method)
+
+    if method == "spearman":
+        prices = prices.rank()
+    values = prices.to_numpy(dtype=_compute_dtype())
+    values = values - values.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values /= np.sqrt(np.einsum("tb,tb->b", values, values))
+    corr = np.clip(values.T @ values, -1.0, 1.0)
+    np.fill_diagonal(corr, 1.0)
+
+    if thresholds:
+        distance = np.min(
+            [np.abs(corr - threshold) for threshold in thresholds], axis=0
+        )
+        rows, cols = np.nonzero(np.triu(distance < _CORRELATION_MARGIN, k=1))
+        if len(rows):
+            # Rounding the exact values back to float32 could flip them again
+            corr = corr.astype(np.float64)
+        for i, j in zip(rows, cols):
+            corr[i, j] = corr[j, i] = data[securities[i]].corr(
+                data[securities[j]], method=method
+            )
+        if len(rows):
+            logger.info(f"Re-verified {len(rows)} correlations in float64.")
+    return pd.DataFrame(corr, index=securities, columns=securities)
+
+
 @_log_execution_time
 def compute_correlation_matrix(
     data: pd.DataFrame, securities: List[str], method: str = "spearman"
@@ -222,6 +295,9 @@ def compute_correlation_matrix(
     """
     Computes the correlation matrix for specified securities.
 
+    With ``set_precision("float32")``, Pearson and Spearman correlations of data without
+    missing values are computed and returned in single precision.
+
     Args:
         data (pd.DataFrame): Input dataset.
         securities (List[str]): List of securities to compute correlations for.
@@ -231,7 +307,7 @@ def compute_correlation_matrix(
         pd.DataFrame: Correlation matrix.
     """
     validate_securities(data, securities)
-    return data[securities].corr(method=method)
+    return _correlation_matrix(data, securities, method)
 
 
 @_log_execution_time
@@ -245,6 +321,9 @@ def compute_correlation_dataframe(
     """
     Computes correlations and filters results based on thresholds.
 
+    In float32 mode (see ``set_precision``), correlations close to a threshold are
+    recomputed in float64, so the filtered pairs do not depend on the precision.
+
     Args:
         data (pd.DataFrame): Input dataset.
         securities (List[str]): List of securities to include.
@@ -256,7 +335,9 @@ def compute_correlation_dataframe(
         Tuple[pd.DataFrame, np.ndarray]: Filtered correlation DataFrame and unique correlated securities.
     """
     validate_securities(data, securities)
-    corr_mat = data[securities].corr(method=method)
+    corr_mat = _correlation_matrix(
+        data, securities, method, (plus_threshold, minus_threshold)
+    )
 
     corr_df = corr_mat.stack().reset_index(name=f"{method}_correlation")
     corr_df = corr_df[corr_df["level_0"] != corr_df["level_1"]]
@@ -303,6 +384,670 @@ def slice_data_with_dates(
     return sliced_data
 
 
+def _enumerate_pairs(
+    securities: List[str],
+    both_directions: bool = False,
+    candidates: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[Tuple[str, str], ...]]:
+    """
+    Enumerates every unordered combination of securities exactly once.
+
+    Args:
+        securities (List[str]): Candidate securities.
+        both_directions (bool, optional): If True, each combination also carries its reverse orientation. Defaults to False.
+        candidates (Optional[np.ndarray], optional): Symmetric boolean matrix of the combinations to keep. Defaults to None (all).
+
+    Yields:
+        Tuple[Tuple[str, str], ...]: Orientations to test for one combination, e.g. (("A", "B"),) or (("A", "B"), ("B", "A")).
+    """
+    if candidates is None:
+        pairs = combinations(securities, 2)
+    else:
+        rows, cols = np.nonzero(np.triu(candidates, k=1))
+        pairs = ((securities[i], securities[j]) for i, j in zip(rows, cols))
+
+    for sec_i, sec_j in pairs:
+        if both_directions:
+            yield (sec_i, sec_j), (sec_j, sec_i)
+        else:
+            yield ((sec_i, sec_j),)
+
+
+def _correlation_candidates(
+    data: pd.DataFrame,
+    securities: List[str],
+    method: str = "spearman",
+    threshold: Optional[float] = 0.8,
+    top_k: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Selects the candidate pairs of securities from their correlation matrix.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        securities (List[str]): Securities to pair.
+        method (str, optional): Correlation method ('pearson', 'kendall', 'spearman'). Defaults to 'spearman'.
+        threshold (Optional[float], optional): Minimum absolute correlation of a pair. Defaults to 0.8.
+        top_k (Optional[int], optional): If set, keeps only the top_k most correlated partners (in absolute value) of every security;
+            a pair is kept if either security ranks the other among its top_k. Defaults to None.
+
+    Returns:
+        np.ndarray: Symmetric boolean matrix of the candidate pairs.
+    """
+    validate_securities(data, securities)
+    thresholds = () if threshold is None else (threshold, -threshold)
+    abs_corr = np.abs(
+        _correlation_matrix(data, securities, method, thresholds).to_numpy(
+            dtype=np.float64
+        )
+    )
+    np.fill_diagonal(abs_corr, np.nan)
+    abs_corr = np.nan_to_num(abs_corr, nan=-np.inf)
+
+    candidates = np.ones_like(abs_corr, dtype=bool)
+    if threshold is not None:
+        candidates &= abs_corr >= threshold
+    if top_k is not None and top_k < len(securities) - 1:
+        partners = np.argpartition(-abs_corr, top_k, axis=1)[:, :top_k]
+        ranked = np.zeros_like(candidates)
+        np.put_along_axis(ranked, partners, True, axis=1)
+        candidates &= ranked | ranked.T
+    np.fill_diagonal(candidates, False)
+    return candidates
+
+
+def _stationarity_report(
+    data: pd.DataFrame,
+    security: str,
+    stationarity_method: str,
+    trend: str,
+    significance_level: float,
+) -> dict:
+    """
+    Dispatches a single stationarity test by method name.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        security (str): Security to test.
+        stationarity_method (str): Stationarity test method, full name or short name.
+        trend (str): Trend assumption of the test.
+        significance_level (float): Significance level of the test.
+
+    Returns:
+        dict: Report of the selected stationarity test.
+
+    Raises:
+        ValueError: If the stationarity method is not supported.
+    """
+    method = STATIONARITY_METHODS.get(stationarity_method.lower())
+    if method is None:
+        raise ValueError(
+            "Method of stationarity is not supported please select from ['ADF', 'PP', 'KPSS']"
+        )
+    return method(
+        data,
+        security=security,
+        trend=trend,
+        significance_level=significance_level,
+    )
+
+
+def _cointegration_report(
+    data: pd.DataFrame,
+    securities: List[str],
+    cointegration_method: str,
+    trend: str,
+    significance_level: float,
+) -> dict:
+    """
+    Dispatches a single cointegration test by method name, without keeping its spread.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        securities (List[str]): Securities to test.
+        cointegration_method (str): Cointegration test method.
+        trend (str): Trend assumption of the test.
+        significance_level (float): Significance level of the test.
+
+    Returns:
+        dict: Report of the selected cointegration test, or its lightweight record.
+
+    Raises:
+        ValueError: If the cointegration method is not supported.
+    """
+    method = COINTEGRATION_METHODS.get(cointegration_method.lower())
+    if method is None:
+        raise ValueError(
+            "Method of cointegration is not supported please select from ['Engle-Granger', 'Phillips-Ouliaris', 'Johansen', 'Gregory-Hansen', 'Hatemi-J']"
+        )
+    return method(
+        data,
+        securities=securities,
+        trend=trend,
+        significance_level=significance_level,
+        return_spread=False,
+    )
+
+
+STATIONARITY_METHODS = {
+    "adf": augmented_dickey_fuller_test,
+    "augmented dickey-fuller": augmented_dickey_fuller_test,
+    "pp": philips_perron_test,
+    "philips-perron": philips_perron_test,
+    "kpss": KPSS_test,
+    "kwiatkowski-phillips-schmidt-shin": KPSS_test,
+}
+
+COINTEGRATION_METHODS = {
+    "engle-granger": engle_granger_cointegration_test,
+    "phillips-ouliaris": phillips_ouliaris_cointegration_test,
+    "johansen": johansen_cointegration_test,
+    "gregory-hansen": gregory_hansen_cointegration_test,
+    "hatemi-j": hatemi_j_cointegration_test,
+}
+
+# Cointegration tests reporting p-values, as needed by the multiple-testing corrections
+_PVALUE_METHODS = ("engle-granger", "phillips-ouliaris")
+
+
+def _stationarity_chunk(
+    data: pd.DataFrame,
+    securities: List[str],
+    stationarity_method: str,
+    trend: str,
+    significance_level: float,
+) -> List[bool]:
+    """
+    Runs the stationarity test for a chunk of securities.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        securities (List[str]): Securities to test.
+        stationarity_method (str): Stationarity test method.
+        trend (str): Trend assumption of the test.
+        significance_level (float): Significance level of the test.
+
+    Returns:
+        List[bool]: Stationarity flag of each security.
+    """
+    return [
+        _stationarity_report(
+            data,
+            security=sec,
+            stationarity_method=stationarity_method,
+            trend=trend,
+            significance_level=significance_level,
+        )["Stationary"]
+        for sec in securities
+    ]
+
+
+def _cointegration_chunk(
+    data: pd.DataFrame,
+    pairs: List[Tuple[Tuple[str, str], ...]],
+    cointegration_method: str,
+    trend: str,
+    significance_level: float,
+    all_orientations: bool = False,
+) -> List[dict]:
+    """
+    Runs the cointegration test for a chunk of pair combinations.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        pairs (List[Tuple[Tuple[str, str], ...]]): Combinations as yielded by ``_enumerate_pairs``.
+        cointegration_method (str): Cointegration test method.
+        trend (str): Trend assumption of the test.
+        significance_level (float): Significance level of the test.
+        all_orientations (bool, optional): If True, returns a row for every tested orientation,
+            cointegrated or not, with its "p_value". Defaults to False.
+
+    Returns:
+        List[dict]: Summary rows of the cointegrated (or all) orientations, in test order.
+    """
+    summary = []
+    for orientations in pairs:
+        # Both orientations share the same two-column slice
+        pair_data = data[list(orientations[0])]
+
+        for sec_i, sec_j in orientations:
+            cointegration_report = _cointegration_report(
+                pair_data,
+                securities=[sec_i, sec_j],
+                cointegration_method=cointegration_method,
+                trend=trend,
+                significance_level=significance_level,
+            )
+
+            if all_orientations:
+                summary.append(
+                    {
+                        "security_a": sec_i,
+                        "security_b": sec_j,
+                        f"cointegration_vector_{int(significance_level*100)}perc": cointegration_report[
+                            "Cointegrated Vector"
+                        ],
+                        "p_value": cointegration_report["p-Value"],
+                    }
+                )
+            elif cointegration_report["Cointegrated"] == True:
+                summary.append(
+                    {
+                        "security_a": sec_i,
+                        "security_b": sec_j,
+                        f"cointegration_vector_{int(significance_level*100)}perc": cointegration_report[
+                            "Cointegrated Vector"
+                        ],
+                    }
+                )
+    return summary
+
+
+def _multiple_testing_method(
+    multiple_testing: Optional[str], cointegration_method: str
+) -> Optional[str]:
+    """
+    Validates the multiple-testing option of a pairs screening.
+
+    Args:
+        multiple_testing (Optional[str]): Multiple-testing method, or None.
+        cointegration_method (str): Cointegration test method.
+
+    Returns:
+        Optional[str]: "benjamini-hochberg", "holm", or None.
+
+    Raises:
+        ValueError: If the method is not supported or the cointegration test has no p-values.
+    """
+    method = _validate_multiple_testing(multiple_testing)
+    if method is not None and cointegration_method.lower() not in _PVALUE_METHODS:
+        raise ValueError(
+            "Multiple testing requires p-values, only available with 'engle-granger' and 'phillips-ouliaris'."
+        )
+    return method
+
+
+def _adjusted_pairs(
+    rows: List[dict], num_tests: int, method: str, significance_level: float
+) -> pd.DataFrame:
+    """
+    Keeps the orientations still significant after a multiple-testing adjustment.
+
+    Args:
+        rows (List[dict]): Rows of every orientation with a p-value below the significance level, with their "p_value".
+        num_tests (int): Number of orientations tested.
+        method (str): "benjamini-hochberg" or "holm".
+        significance_level (float): Significance level of the adjusted p-values.
+
+    Returns:
+        pd.DataFrame: Rows of the significant orientations, with their "adjusted_p_value".
+    """
+    pairs = pd.DataFrame(rows)
+    if pairs.empty:
+        return pairs
+    pairs["adjusted_p_value"] = _adjust_pvalues(
+        pairs["p_value"].to_numpy(), num_tests, method
+    )
+    return pairs[pairs["adjusted_p_value"] < significance_level].reset_index(drop=True)
+
+
+def _nonstationary_securities(
+    data: pd.DataFrame,
+    stationarity_method: str,
+    stationarity_significance_level: float,
+    stationarity_trend: str,
+    n_jobs: int,
+    chunk_size: Optional[int],
+) -> List[str]:
+    """
+    Runs the stationarity stage of a screening, keeping the securities integrated of order one.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        stationarity_method (str): Stationarity test method.
+        stationarity_significance_level (float): Significance level of stationarity test.
+        stationarity_trend (str): Time trend for stationarity test.
+        n_jobs (int): Number of worker processes.
+        chunk_size (Optional[int]): Number of securities per parallel task.
+
+    Returns:
+        List[str]: Non-stationary securities, in column order.
+    """
+    securities = list(data.columns)
+    stationary = _parallel_map(
+        _stationarity_chunk,
+        data,
+        securities,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        stationarity_method=stationarity_method,
+        trend=stationarity_trend,
+        significance_level=stationarity_significance_level,
+    )
+    return [
+        sec for sec, is_stationary in zip(securities, stationary) if not is_stationary
+    ]
+
+
+def _screening_plan(
+    data: pd.DataFrame,
+    stationarity_method: str,
+    stationarity_significance_level: float,
+    stationarity_trend: str,
+    both_directions: bool,
+    n_jobs: int,
+    chunk_size: Optional[int],
+    correlation_method: Optional[str],
+    correlation_threshold: float,
+    correlation_top_k: Optional[int],
+) -> Tuple[List[str], List[Tuple[Tuple[str, str], ...]]]:
+    """
+    Runs the stationarity and correlation stages of the pairs screening.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        stationarity_method (str): Stationarity test method.
+        stationarity_significance_level (float): Significance level of stationarity test.
+        stationarity_trend (str): Time trend for stationarity test.
+        both_directions (bool): If True, each combination also carries its reverse orientation.
+        n_jobs (int): Number of worker processes.
+        chunk_size (Optional[int]): Number of securities per parallel task.
+        correlation_method (Optional[str]): Correlation method of the pre-filter stage, None to skip it.
+        correlation_threshold (float): Minimum absolute correlation of a pair.
+        correlation_top_k (Optional[int]): Number of most correlated partners kept per security.
+
+    Returns:
+        Tuple[List[str], List[Tuple[Tuple[str, str], ...]]]: Non-stationary securities and the
+            combinations reaching the cointegration test, in test order.
+    """
+    # Check for I(1)
+    nonstationary_securities = _nonstationary_securities(
+        data,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        n_jobs,
+        chunk_size,
+    )
+
+    # Correlation pre-filter
+    candidates = None
+    if correlation_method is not None:
+        candidates = _correlation_candidates(
+            data,
+            nonstationary_securities,
+            method=correlation_method,
+            threshold=correlation_threshold,
+            top_k=correlation_top_k,
+        )
+    pairs = list(
+        _enumerate_pairs(nonstationary_securities, both_directions, candidates)
+    )
+    return nonstationary_securities, pairs
+
+
+def _stream_cointegrated_pairs(
+    data: pd.DataFrame,
+    pairs: List[Tuple[Tuple[str, str], ...]],
+    cointegration_method: str,
+    coint_significance_level: float,
+    cointegration_trend: str,
+    n_jobs: int,
+    chunk_size: Optional[int],
+    sink: Optional[ResultSink],
+    job_key: str,
+    resume: bool,
+    checkpoint_every: int,
+    multiple_testing: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Tests the combinations for cointegration, yielding every cointegrated orientation as found.
+
+    With a sink, the rows are appended to it and the number of combinations tested is
+    checkpointed every ``checkpoint_every`` combinations, so an interrupted run can be resumed.
+
+    With a multiple-testing method, every orientation is decided in test order by the online
+    procedure of ``_OnlineTesting``, whose counters are checkpointed with the combinations,
+    together with the number of orientations significant before the procedure.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        pairs (List[Tuple[Tuple[str, str], ...]]): Combinations as yielded by ``_enumerate_pairs``.
+        cointegration_method (str): Cointegration test method.
+        coint_significance_level (float): Significance level of cointegration test.
+        cointegration_trend (str): Time trend for cointegration test.
+        n_jobs (int): Number of worker processes.
+        chunk_size (Optional[int]): Number of pair combinations per parallel task.
+        sink (Optional[ResultSink]): Sink receiving the rows, or None.
+        job_key (str): Identifier of the screening settings and data, stored in the checkpoint.
+        resume (bool): If True, skips the combinations tested before the last checkpoint.
+        checkpoint_every (int): Number of combinations tested between two checkpoints.
+        multiple_testing (Optional[str], optional): "benjamini-hochberg" (online LOND) or "holm"
+            (online alpha-spending). Defaults to None.
+
+    Yields:
+        Dict[str, Any]: Summary row of a cointegrated orientation, with its "p_value" and
+            "test_level" under multiple testing.
+
+    Raises:
+        ValueError: If the checkpoint to resume from belongs to another screening.
+    """
+    tested, significant, online = 0, 0, None
+    if multiple_testing is not None:
+        online = _OnlineTesting(multiple_testing, coint_significance_level)
+    if sink is not None:
+        checkpoint = sink.load_checkpoint() if resume else None
+        if checkpoint is None:
+            sink.clear()
+        elif checkpoint["state"].get("job") != job_key:
+            raise ValueError(
+                f"Checkpoint of {sink.path} belongs to another screening (data or settings changed)."
+            )
+        else:
+            tested = checkpoint["state"]["tested"]
+            if online is not None:
+                online = _OnlineTesting(
+                    multiple_testing,
+                    coint_significance_level,
+                    **checkpoint["state"]["online"],
+                )
+                significant = checkpoint["state"]["significant"]
+            sink.truncate()
+            logger.info(f"Resuming pairs identification after {tested} combinations.")
+
+    def state(**extra):
+        if online is None:
+            return {"job": job_key, "tested": tested, **extra}
+        return {
+            "job": job_key,
+            "tested": tested,
+            "significant": significant,
+            "online": online.state(),
+            **extra,
+        }
+
+    buffer, unsaved = [], 0
+    for chunk, rows in _parallel_imap(
+        _cointegration_chunk,
+        data,
+        pairs[tested:],
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        cointegration_method=cointegration_method,
+        trend=cointegration_trend,
+        significance_level=coint_significance_level,
+        all_orientations=online is not None,
+    ):
+        if online is not None:
+            significant += int(
+                sum(row["p_value"] < coint_significance_level for row in rows)
+            )
+            decided = []
+            for row in rows:
+                rejected, level = online.test(row["p_value"])
+                if rejected:
+                    decided.append({**row, "test_level": level})
+            rows = decided
+
+        yield from rows
+        if sink is None:
+            continue
+
+        buffer.extend(rows)
+        tested += len(chunk)
+        unsaved += len(chunk)
+        if unsaved >= checkpoint_every:
+            sink.append(buffer, state=state())
+            buffer, unsaved = [], 0
+
+    if sink is not None:
+        sink.append(buffer, state=state(complete=True))
+
+
+def _screening_job_key(
+    data: pd.DataFrame,
+    stationarity_method: str,
+    cointegration_method: str,
+    stationarity_significance_level: float,
+    coint_significance_level: float,
+    stationarity_trend: str,
+    cointegration_trend: str,
+    both_directions: bool,
+    correlation_method: Optional[str],
+    correlation_threshold: float,
+    correlation_top_k: Optional[int],
+    multiple_testing: Optional[str],
+) -> str:
+    """
+    Identifies a pairs screening by its data and settings, to validate checkpoints on resume.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        stationarity_method (str): Stationarity test method.
+        cointegration_method (str): Cointegration test method.
+        stationarity_significance_level (float): Significance level of stationarity test.
+        coint_significance_level (float): Significance level of cointegration test.
+        stationarity_trend (str): Time trend for stationarity test.
+        cointegration_trend (str): Time trend for cointegration test.
+        both_directions (bool): If True, both orientations of each combination are tested.
+        correlation_method (Optional[str]): Correlation method of the pre-filter stage.
+        correlation_threshold (float): Minimum absolute correlation of a pair.
+        correlation_top_k (Optional[int]): Number of most correlated partners kept per security.
+        multiple_testing (Optional[str]): Normalized multiple-testing method.
+
+    Returns:
+        str: Screening identifier.
+    """
+    return _make_key(
+        _fingerprint(data),
+        stationarity_method.lower(),
+        cointegration_method.lower(),
+        stationarity_significance_level,
+        coint_significance_level,
+        stationarity_trend,
+        cointegration_trend,
+        both_directions,
+        correlation_method,
+        correlation_threshold,
+        correlation_top_k,
+        multiple_testing,
+    )
+
+
+def iter_pairs_identification(
+    data,
+    stationarity_method="augmented dickey-fuller",
+    cointegration_method="phillips-ouliaris",
+    stationarity_significance_level=0.01,
+    coint_significance_level=0.01,
+    stationarity_trend="constant",
+    cointegration_trend="constant",
+    both_directions=False,
+    n_jobs=1,
+    chunk_size=None,
+    correlation_method=None,
+    correlation_threshold=0.8,
+    correlation_top_k=None,
+    sink=None,
+    resume=False,
+    checkpoint_every=1000,
+    multiple_testing=None,
+):
+    """
+    Streaming version of `pairs_identification`: yields each cointegrated pair as soon as it is found.
+
+    The stationarity and correlation stages run first; the cointegration tests are then
+    consumed lazily, with at most two chunks per worker in flight, so memory stays bounded
+    whatever the size of the universe.
+
+    Args:
+        data (DataFrame): Pandas dataframe
+        stationarity_method (str, optional): Stationarity test method, see `pairs_identification`. Defaults to 'ADF'
+        cointegration_method (str, optional): Method of cointegration, see `pairs_identification`. Defaults to 'phillips-ouliaris'
+        stationarity_significance_level (float, optional): Significance level of stationarity test. Defaults to 0.01
+        coint_significance_level (float, optional): Significance level of cointegration test. Defaults to 0.01
+        stationarity_trend (str, optional): Time trend for statioarity test. Defaults to 'constant'
+        cointegration_trend (str, optional): Time trend for cointegration test. Defaults to 'constant'
+        both_directions (bool, optional): If True, also tests the reverse regression of every combination. Defaults to False
+        n_jobs (int, optional): Number of worker processes. -1 uses all CPUs. Defaults to 1 (serial)
+        chunk_size (int, optional): Number of securities or pair combinations per parallel task. Defaults to None (an even split into four tasks per worker, at most 64 items each)
+        correlation_method (str, optional): Correlation method of the pre-filter stage. Defaults to None (no pre-filter)
+        correlation_threshold (float, optional): Minimum absolute correlation for a pair to reach the cointegration test. Defaults to 0.8
+        correlation_top_k (int, optional): If set, only the top_k most correlated partners of each security reach the cointegration test. Defaults to None
+        sink (str, optional): Path of a '.csv' file or '.parquet' dataset directory the pairs are also written to, with a checkpoint next to it. Defaults to None
+        resume (bool, optional): If True, resumes the screening from the checkpoint of `sink` and only yields the pairs found after it. Defaults to False (the sink is overwritten)
+        checkpoint_every (int, optional): Number of pair combinations tested between two writes to `sink`. Defaults to 1000
+        multiple_testing (str, optional): Online multiple-testing control of the cointegration stage, deciding every orientation in test order without holding the other results. 'benjamini-hochberg' (or 'bh') controls the false discovery rate with LOND, 'holm' the family-wise error rate with alpha-spending, both at `coint_significance_level`. Requires 'engle-granger' or 'phillips-ouliaris'. Defaults to None
+
+    Yields:
+        dict: Cointegrated pair, with the keys of the `pairs_identification` columns, plus "p_value" and the "test_level" it was compared to under multiple testing
+
+    Raises:
+        ValueError: If `resume` is set and the checkpoint belongs to another data set or other settings.
+    """
+    multiple_testing = _multiple_testing_method(multiple_testing, cointegration_method)
+    nonstationary_securities, pairs = _screening_plan(
+        data,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        both_directions,
+        n_jobs,
+        chunk_size,
+        correlation_method,
+        correlation_threshold,
+        correlation_top_k,
+    )
+    job_key = _screening_job_key(
+        data,
+        stationarity_method,
+        cointegration_method,
+        stationarity_significance_level,
+        coint_significance_level,
+        stationarity_trend,
+        cointegration_trend,
+        both_directions,
+        correlation_method,
+        correlation_threshold,
+        correlation_top_k,
+        multiple_testing,
+    )
+    yield from _stream_cointegrated_pairs(
+        data,
+        pairs,
+        cointegration_method,
+        coint_significance_level,
+        cointegration_trend,
+        n_jobs,
+        chunk_size,
+        None if sink is None else ResultSink(sink),
+        job_key,
+        resume,
+        checkpoint_every,
+        multiple_testing,
+    )
+
+
 @_log_execution_time
 def pairs_identification(
     data,
@@ -312,107 +1057,531 @@ def pairs_identification(
     coint_significance_level=0.01,
     stationarity_trend="constant",
     cointegration_trend="constant",
+    both_directions=False,
+    n_jobs=1,
+    chunk_size=None,
+    correlation_method=None,
+    correlation_threshold=0.8,
+    correlation_top_k=None,
+    sink=None,
+    resume=False,
+    checkpoint_every=1000,
+    multiple_testing=None,
 ):
     """
     This function identifies the pairs with cointegration method. The process is as follows:
 
     * Check if both candidates have integration order of one with stationarity test
+    * Optionally, keep only candidates whose correlation passes a pre-filter
     * Check if both candidates are cointegrated with Phillips-Ouliaris cointegration test
+    * Optionally, keep only pairs still significant after a multiple-testing correction
+
+    Each unordered combination of securities is tested once, as (security_a, security_b) in column order.
+    Use `iter_pairs_identification` to consume the pairs as they are found.
 
     Args:
         data (DataFrame): Pandas dataframe
         stationarity_method (str, optional): Stationarity test method. Options are ['Augmented Dickey-Fuller', 'Philips-Perron', 'Kwiatkowski-Phillips-Schmidt-Shin'] - for short: ["ADF", "PP", "KPSS"]. Defaults to 'ADF'
-        cointegration_method (str, optional): Method of cointegration. Options are ['phillips-ouliaris', 'engle-granger']. Defaults to 'phillips-ouliaris'
+        cointegration_method (str, optional): Method of cointegration. Options are ['phillips-ouliaris', 'engle-granger', 'johansen', 'gregory-hansen', 'hatemi-j']. The structural-break tests 'gregory-hansen' and 'hatemi-j' require a 'constant' trend. Defaults to 'phillips-ouliaris'
         stationarity_significance_level (float, optional): Significance level of stationarity test. Defaults to 0.01
         coint_significance_level (float, optional): Significance level of cointegration test. Defaults to 0.01
         stationarity_trend (str, optional): Time trend for statioarity test can be set. Options are ['no deterministic term', 'constant', 'constant and time trend]. Defaults to 'constant'
         cointegration_trend (str, optional): Time trend for cointegration test can be set. Options are ['no deterministic term', 'constant', 'constant and time trend']. Defaults to 'constant'
+        both_directions (bool, optional): If True, also tests the reverse regression (security_b on security_a) of every combination and reports both orientations. Defaults to False
+        n_jobs (int, optional): Number of worker processes. The price matrix is shared with the workers through shared memory and results are identical, in the same order, to the serial run. -1 uses all CPUs. Defaults to 1 (serial)
+        chunk_size (int, optional): Number of securities or pair combinations per parallel task. Defaults to None (an even split into four tasks per worker, at most 64 items each)
+        correlation_method (str, optional): Correlation method of the pre-filter stage. Options are ['pearson', 'kendall', 'spearman']. Defaults to None (no pre-filter)
+        correlation_threshold (float, optional): Minimum absolute correlation for a pair to reach the cointegration test. Defaults to 0.8
+        correlation_top_k (int, optional): If set, only the top_k most correlated partners of each security reach the cointegration test. Defaults to None
+        sink (str, optional): Path of a '.csv' file or '.parquet' dataset directory the pairs are written to while the screening runs, with a checkpoint next to it. Defaults to None
+        resume (bool, optional): If True, resumes an interrupted screening from the checkpoint of `sink`; pairs found before the interruption are read back from it. Defaults to False
+        checkpoint_every (int, optional): Number of pair combinations tested between two writes to `sink`. Defaults to 1000
+        multiple_testing (str, optional): Multiple-testing control of the cointegration stage at `coint_significance_level`. Options are ['benjamini-hochberg', 'holm'] (or 'bh'), controlling the false discovery rate and the family-wise error rate over every tested orientation. The adjusted p-values come from one vectorized pass over the p-values below the significance level and are reported in an "adjusted_p_value" column, next to "p_value". With a `sink`, the pairs are decided while streaming by the online procedures of `iter_pairs_identification` instead, reported with their "test_level". Requires 'engle-granger' or 'phillips-ouliaris'. Defaults to None
 
     Returns:
-        DataFrame: Dataframe of the cointegrated pairs
+        DataFrame: Dataframe of the cointegrated pairs. The number of pairs eliminated by each stage (stationarity, correlation, cointegration and multiple testing) is logged and stored in its `attrs["screening_report"]`
     """
+    multiple_testing = _multiple_testing_method(multiple_testing, cointegration_method)
+    nonstationary_securities, pairs = _screening_plan(
+        data,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        both_directions,
+        n_jobs,
+        chunk_size,
+        correlation_method,
+        correlation_threshold,
+        correlation_top_k,
+    )
 
-    # Check for I(1)
-    securities = data.columns
-    nonstationary_securities = []
+    # Pairs identification
+    if sink is None and multiple_testing is not None:
+        # Only p-values below the significance level can stay significant after adjustment
+        significant, num_tests = [], 0
+        for _, rows in _parallel_imap(
+            _cointegration_chunk,
+            data,
+            pairs,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            cointegration_method=cointegration_method,
+            trend=cointegration_trend,
+            significance_level=coint_significance_level,
+            all_orientations=True,
+        ):
+            num_tests += len(rows)
+            significant.extend(
+                row for row in rows if row["p_value"] < coint_significance_level
+            )
+        coint_pairs_df = _adjusted_pairs(
+            significant, num_tests, multiple_testing, coint_significance_level
+        )
+        num_significant = len(significant)
+    elif sink is None:
+        pairs_identification_summary = _parallel_map(
+            _cointegration_chunk,
+            data,
+            pairs,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            cointegration_method=cointegration_method,
+            trend=cointegration_trend,
+            significance_level=coint_significance_level,
+        )
+        coint_pairs_df = pd.DataFrame(pairs_identification_summary)
+        num_significant = len(coint_pairs_df)
+    else:
+        result_sink = ResultSink(sink)
+        job_key = _screening_job_key(
+            data,
+            stationarity_method,
+            cointegration_method,
+            stationarity_significance_level,
+            coint_significance_level,
+            stationarity_trend,
+            cointegration_trend,
+            both_directions,
+            correlation_method,
+            correlation_threshold,
+            correlation_top_k,
+            multiple_testing,
+        )
+        for _ in _stream_cointegrated_pairs(
+            data,
+            pairs,
+            cointegration_method,
+            coint_significance_level,
+            cointegration_trend,
+            n_jobs,
+            chunk_size,
+            result_sink,
+            job_key,
+            resume,
+            checkpoint_every,
+            multiple_testing,
+        ):
+            pass
+        coint_pairs_df = result_sink.read()
+        num_significant = len(coint_pairs_df)
+        if multiple_testing is not None:
+            num_significant = result_sink.load_checkpoint()["state"]["significant"]
+
+    # Pairs eliminated by each stage
+    securities = list(data.columns)
+    num_all = len(securities) * (len(securities) - 1) // 2
+    num_nonstationary = (
+        len(nonstationary_securities) * (len(nonstationary_securities) - 1) // 2
+    )
+    orientations = 2 if both_directions else 1
+    screening_report = {
+        "candidate_pairs": num_all * orientations,
+        "stationarity_eliminated": (num_all - num_nonstationary) * orientations,
+        "correlation_eliminated": (num_nonstationary - len(pairs)) * orientations,
+        "cointegration_eliminated": len(pairs) * orientations - num_significant,
+        "multiple_testing_eliminated": num_significant - len(coint_pairs_df),
+        "cointegrated_pairs": len(coint_pairs_df),
+    }
+    logger.info(f"Pairs identification screening report: {screening_report}")
+    coint_pairs_df.attrs["screening_report"] = screening_report
 
-    for sec in securities:
+    return coint_pairs_df
 
-        if stationarity_method.lower() == "adf":
-            stationarity_report = augmented_dickey_fuller_test(
-                data,
-                security=sec,
-                trend=stationarity_trend,
-                significance_level=stationarity_significance_level,
-            )
-        elif stationarity_method.lower() == "pp":
-            stationarity_report = philips_perron_test(
-                data,
-                security=sec,
-                trend=stationarity_trend,
-                significance_level=stationarity_significance_level,
-            )
-        elif stationarity_method.lower() == "kpss":
-            stationarity_report = KPSS_test(
-                data,
-                security=sec,
-                trend=stationarity_trend,
-                significance_level=stationarity_significance_level,
-            )
-        else:
-            logger.error(
-                "Method of stationarity is not supported please select from ['ADF', 'PP', 'KPSS']"
+
+def _basket_candidates(
+    data: pd.DataFrame,
+    securities: List[str],
+    method: Optional[str],
+    threshold: Optional[float],
+    cluster_threshold: Optional[float],
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Selects the pairs of securities allowed in a common basket.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        securities (List[str]): Candidate securities.
+        method (Optional[str]): Correlation method, None to skip the correlation and cluster gates.
+        threshold (Optional[float]): Minimum absolute correlation of two members of a basket.
+        cluster_threshold (Optional[float]): If set, members must fall in the same average-linkage
+            cluster of the 1 - |correlation| distance, cut at this distance.
+
+    Returns:
+        Tuple[np.ndarray, Optional[np.ndarray]]: Symmetric boolean matrix of the allowed pairs, and the
+            absolute correlation matrix (None without correlation method).
+    """
+    n_securities = len(securities)
+    if method is None:
+        candidates = np.ones((n_securities, n_securities), dtype=bool)
+        np.fill_diagonal(candidates, False)
+        return candidates, None
+
+    validate_securities(data, securities)
+    thresholds = () if threshold is None else (threshold, -threshold)
+    abs_corr = np.abs(
+        _correlation_matrix(data, securities, method, thresholds).to_numpy(
+            dtype=np.float64
+        )
+    )
+    abs_corr = np.nan_to_num(abs_corr, nan=0.0)
+    candidates = np.ones_like(abs_corr, dtype=bool)
+    if threshold is not None:
+        candidates &= abs_corr >= threshold
+    if cluster_threshold is not None and n_securities > 1:
+        distance = np.clip(1.0 - abs_corr, 0.0, None)
+        np.fill_diagonal(distance, 0.0)
+        clusters = fcluster(
+            linkage(squareform(distance, checks=False), method="average"),
+            t=cluster_threshold,
+            criterion="distance",
+        )
+        candidates &= clusters[:, None] == clusters[None, :]
+    np.fill_diagonal(candidates, False)
+    return candidates, abs_corr
+
+
+def _enumerate_baskets(
+    securities: List[str],
+    basket_size: int,
+    candidates: np.ndarray,
+    strength: Optional[np.ndarray] = None,
+    max_baskets_per_anchor: Optional[int] = None,
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Enumerates the baskets whose members are all allowed together, each exactly once.
+
+    Every basket is anchored on its first member in column order and extended one member at a
+    time with partners allowed with all current members, the strongest partners first.
+
+    Args:
+        securities (List[str]): Candidate securities.
+        basket_size (int): Number of securities per basket.
+        candidates (np.ndarray): Symmetric boolean matrix of the pairs allowed in a common basket.
+        strength (Optional[np.ndarray], optional): Pair strength ordering the partners of an anchor,
+            e.g. absolute correlations. Defaults to None (column order).
+        max_baskets_per_anchor (Optional[int], optional): Maximum number of baskets per anchor.
+            Defaults to None (no cap).
+
+    Yields:
+        Tuple[str, ...]: Securities of a basket, anchor first.
+    """
+
+    def extend(members, pool):
+        if len(members) == basket_size:
+            yield members
+            return
+        for position, partner in enumerate(pool):
+            yield from extend(
+                members + [partner],
+                [other for other in pool[position + 1 :] if candidates[partner, other]],
             )
 
-        if stationarity_report["Stationary"] == False:
-            nonstationary_securities.append(sec)
+    for anchor in range(len(securities)):
+        partners = np.flatnonzero(candidates[anchor, anchor + 1 :]) + anchor + 1
+        if strength is not None:
+            partners = partners[np.argsort(-strength[anchor, partners], kind="stable")]
+        for count, members in enumerate(extend([anchor], list(partners))):
+            if max_baskets_per_anchor is not None and count >= max_baskets_per_anchor:
+                break
+            yield tuple(securities[i] for i in members)
 
-    # Pairs identification
-    pairs_identification_summary = []
-
-    for sec_i in nonstationary_securities:
-
-        for sec_j in nonstationary_securities:
-            if sec_i != sec_j:
-                securities = [sec_i, sec_j]
-
-                if cointegration_method.lower() == "engle-granger":
-                    cointegration_report = engle_granger_cointegration_test(
-                        data,
-                        securities=securities,
-                        trend=cointegration_trend,
-                        significance_level=coint_significance_level,
-                    )
-                elif cointegration_method.lower() == "phillips-ouliaris":
-                    cointegration_report = phillips_ouliaris_cointegration_test(
-                        data,
-                        securities=securities,
-                        trend=cointegration_trend,
-                        significance_level=coint_significance_level,
-                    )
-                elif cointegration_method.lower() == "johansen":
-                    cointegration_report = johansen_cointegration_test(
-                        data,
-                        securities=securities,
-                        trend=cointegration_trend,
-                        significance_level=coint_significance_level,
-                    )
-                else:
-                    logger.error(
-                        "Method of cointegration is not supported please select from ['Engle-Granger', 'Phillips-Ouliaris', 'Johansen']"
-                    )
-
-                if cointegration_report["Cointegrated"] == True:
-                    pairs_identification_summary.append(
-                        {
-                            "security_a": sec_i,
-                            "security_b": sec_j,
-                            f"cointegration_vector_{int(coint_significance_level*100)}perc": cointegration_report[
-                                "Cointegrated Vector"
-                            ],
-                        }
-                    )
-
-    coint_pairs_df = pd.DataFrame(pairs_identification_summary)
 
-    return coint_pairs_df
+def _basket_chunk(
+    data: pd.DataFrame,
+    baskets: List[Tuple[str, ...]],
+    trend: str,
+    statistic: str,
+    num_lag_diff: int,
+    significance_level: float,
+) -> List[dict]:
+    """
+    Runs the batched Johansen test for a chunk of baskets.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        baskets (List[Tuple[str, ...]]): Baskets as yielded by ``_enumerate_baskets``.
+        trend (str): Trend assumption of the test.
+        statistic (str): Johansen statistic, "trace" or "eigenvalue".
+        num_lag_diff (int): Number of lag differences of the model.
+        significance_level (float): Significance level of the test.
+
+    Returns:
+        List[dict]: Summary rows of the cointegrated baskets, in test order.
+    """
+    result = batch_johansen_cointegration_test(
+        data,
+        baskets=[list(basket) for basket in baskets],
+        trend=trend,
+        statistic=statistic,
+        num_lag_diff=num_lag_diff,
+        significance_level=significance_level,
+    )
+    statistics = result[
+        "Trace Statistics" if statistic.lower() == "trace" else "Max-Eigen Statistics"
+    ]
+    scores = statistics[:, 0] / result["Critical Values"][0]
+
+    summary = []
+    for i in np.flatnonzero(result["Cointegrated"]):
+        row = {
+            f"security_{chr(ord('a') + position)}": security
+            for position, security in enumerate(result["Baskets"][i])
+        }
+        row["Statistic"] = statistics[i, 0]
+        row["Score"] = scores[i]
+        row["#Cointegrated Vectors"] = int(result["#Cointegrated Vectors"][i])
+        row[f"cointegration_vector_{int(significance_level*100)}perc"] = result[
+            "Cointegrated Vectors"
+        ][i]
+        summary.append(row)
+    return summary
+
+
+def _basket_plan(
+    data: pd.DataFrame,
+    basket_size: int,
+    stationarity_method: str,
+    stationarity_significance_level: float,
+    stationarity_trend: str,
+    correlation_method: Optional[str],
+    correlation_threshold: Optional[float],
+    cluster_threshold: Optional[float],
+    max_baskets_per_anchor: Optional[int],
+    n_jobs: int,
+    chunk_size: Optional[int],
+) -> Tuple[pd.DataFrame, List[Tuple[str, ...]]]:
+    """
+    Runs the stationarity and pruning stages of the basket screening.
+
+    Args:
+        data (pd.DataFrame): Input dataset.
+        basket_size (int): Number of securities per basket.
+        stationarity_method (str): Stationarity test method.
+        stationarity_significance_level (float): Significance level of stationarity test.
+        stationarity_trend (str): Time trend for stationarity test.
+        correlation_method (Optional[str]): Correlation method of the gates, None to skip them.
+        correlation_threshold (Optional[float]): Minimum absolute correlation of two members.
+        cluster_threshold (Optional[float]): Distance cut of the correlation clusters, None to skip it.
+        max_baskets_per_anchor (Optional[int]): Maximum number of baskets per anchor security.
+        n_jobs (int): Number of worker processes.
+        chunk_size (Optional[int]): Number of securities per parallel stationarity task.
+
+    Returns:
+        Tuple[pd.DataFrame, List[Tuple[str, ...]]]: Non-stationary securities, on the dates where
+            they are all priced, and the baskets reaching the Johansen test, in test order.
+
+    Raises:
+        ValueError: If the basket size is smaller than two.
+    """
+    if basket_size < 2:
+        raise ValueError("basket_size must be at least 2.")
+
+    nonstationary_securities = _nonstationary_securities(
+        data,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        n_jobs,
+        chunk_size,
+    )
+    # Every leg of a basket must be priced
+    basket_data = data[nonstationary_securities].dropna()
+
+    candidates, abs_corr = _basket_candidates(
+        basket_data,
+        nonstationary_securities,
+        correlation_method,
+        correlation_threshold,
+        cluster_threshold,
+    )
+    baskets = list(
+        _enumerate_baskets(
+            nonstationary_securities,
+            basket_size,
+            candidates,
+            abs_corr,
+            max_baskets_per_anchor,
+        )
+    )
+    return basket_data, baskets
+
+
+def iter_basket_identification(
+    data,
+    basket_size=3,
+    stationarity_method="augmented dickey-fuller",
+    stationarity_significance_level=0.01,
+    coint_significance_level=0.05,
+    stationarity_trend="constant",
+    cointegration_trend="constant",
+    statistic="trace",
+    num_lag_diff=1,
+    correlation_method="spearman",
+    correlation_threshold=0.8,
+    cluster_threshold=None,
+    max_baskets_per_anchor=None,
+    n_jobs=1,
+    chunk_size=None,
+):
+    """
+    Streaming version of `basket_identification`: yields each cointegrated basket as soon as it is found.
+
+    Baskets are tested chunk by chunk with the batched Johansen test, with at most two chunks per
+    worker in flight, so memory stays bounded whatever the number of baskets.
+
+    Args:
+        data (DataFrame): Pandas dataframe
+        basket_size (int, optional): Number of securities per basket, e.g. 3 for triplets or 4 for quadruplets. Defaults to 3
+        stationarity_method (str, optional): Stationarity test method, see `pairs_identification`. Defaults to 'ADF'
+        stationarity_significance_level (float, optional): Significance level of stationarity test. Defaults to 0.01
+        coint_significance_level (float, optional): Significance level of the Johansen test, one of 0.1, 0.05 or 0.01. Defaults to 0.05
+        stationarity_trend (str, optional): Time trend for statioarity test. Defaults to 'constant'
+        cointegration_trend (str, optional): Time trend for the Johansen test. Defaults to 'constant'
+        statistic (str, optional): Johansen statistic, 'trace' or 'eigenvalue'. Defaults to 'trace'
+        num_lag_diff (int, optional): Number of lag differences of the Johansen model. Defaults to 1
+        correlation_method (str, optional): Correlation method of the gates. Options are ['pearson', 'kendall', 'spearman'], or None to test every basket. Defaults to 'spearman'
+        correlation_threshold (float, optional): Minimum absolute correlation between any two members of a basket. Defaults to 0.8
+        cluster_threshold (float, optional): If set, all members must fall in the same average-linkage cluster of the 1 - |correlation| distance, cut at this distance. Defaults to None
+        max_baskets_per_anchor (int, optional): Maximum number of baskets tested per anchor (first member in column order), built from its most correlated partners first. Defaults to None (no cap)
+        n_jobs (int, optional): Number of worker processes. -1 uses all CPUs. Defaults to 1 (serial)
+        chunk_size (int, optional): Number of baskets per batched Johansen test and parallel task, also the number of securities per stationarity task. Defaults to None (256 baskets, and the `pairs_identification` default for securities)
+
+    Yields:
+        dict: Cointegrated basket, with the keys of the `basket_identification` columns
+    """
+    basket_data, baskets = _basket_plan(
+        data,
+        basket_size,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        correlation_method,
+        correlation_threshold,
+        cluster_threshold,
+        max_baskets_per_anchor,
+        n_jobs,
+        chunk_size,
+    )
+    for _, rows in _parallel_imap(
+        _basket_chunk,
+        basket_data,
+        baskets,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size or 256,
+        trend=cointegration_trend,
+        statistic=statistic,
+        num_lag_diff=num_lag_diff,
+        significance_level=coint_significance_level,
+    ):
+        yield from rows
+
+
+@_log_execution_time
+def basket_identification(
+    data,
+    basket_size=3,
+    stationarity_method="augmented dickey-fuller",
+    stationarity_significance_level=0.01,
+    coint_significance_level=0.05,
+    stationarity_trend="constant",
+    cointegration_trend="constant",
+    statistic="trace",
+    num_lag_diff=1,
+    correlation_method="spearman",
+    correlation_threshold=0.8,
+    cluster_threshold=None,
+    max_baskets_per_anchor=None,
+    n_jobs=1,
+    chunk_size=None,
+):
+    """
+    This function identifies baskets of more than two securities with the Johansen method. The process is as follows:
+
+    * Check if the candidates have integration order of one with stationarity test
+    * Keep only baskets whose members all pass the correlation (and optionally cluster) gates,
+      capped per anchor security
+    * Check if the basket is cointegrated with the batched Johansen test
+
+    Each basket is tested once, its members in column order. Use `iter_basket_identification`
+    to consume the baskets as they are found.
+
+    Args:
+        data (DataFrame): Pandas dataframe
+        basket_size (int, optional): Number of securities per basket, e.g. 3 for triplets or 4 for quadruplets. Defaults to 3
+        stationarity_method (str, optional): Stationarity test method, see `pairs_identification`. Defaults to 'ADF'
+        stationarity_significance_level (float, optional): Significance level of stationarity test. Defaults to 0.01
+        coint_significance_level (float, optional): Significance level of the Johansen test, one of 0.1, 0.05 or 0.01. Defaults to 0.05
+        stationarity_trend (str, optional): Time trend for statioarity test. Defaults to 'constant'
+        cointegration_trend (str, optional): Time trend for the Johansen test. Options are ['no deterministic term', 'constant', 'constant and time trend']. Defaults to 'constant'
+        statistic (str, optional): Johansen statistic, 'trace' or 'eigenvalue'. Defaults to 'trace'
+        num_lag_diff (int, optional): Number of lag differences of the Johansen model. Defaults to 1
+        correlation_method (str, optional): Correlation method of the gates. Options are ['pearson', 'kendall', 'spearman'], or None to test every basket. Defaults to 'spearman'
+        correlation_threshold (float, optional): Minimum absolute correlation between any two members of a basket. Defaults to 0.8
+        cluster_threshold (float, optional): If set, all members must fall in the same average-linkage cluster of the 1 - |correlation| distance, cut at this distance. Defaults to None
+        max_baskets_per_anchor (int, optional): Maximum number of baskets tested per anchor (first member in column order), built from its most correlated partners first. Defaults to None (no cap)
+        n_jobs (int, optional): Number of worker processes. -1 uses all CPUs. Defaults to 1 (serial)
+        chunk_size (int, optional): Number of baskets per batched Johansen test and parallel task, also the number of securities per stationarity task. Defaults to None (256 baskets, and the `pairs_identification` default for securities)
+
+    Returns:
+        DataFrame: Dataframe of the cointegrated baskets, ranked by "Score" (first Johansen statistic over its critical value)
+            in decreasing order. The number of tested baskets is stored in its `attrs["screening_report"]`
+    """
+    basket_data, baskets = _basket_plan(
+        data,
+        basket_size,
+        stationarity_method,
+        stationarity_significance_level,
+        stationarity_trend,
+        correlation_method,
+        correlation_threshold,
+        cluster_threshold,
+        max_baskets_per_anchor,
+        n_jobs,
+        chunk_size,
+    )
+    summary = _parallel_map(
+        _basket_chunk,
+        basket_data,
+        baskets,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size or 256,
+        trend=cointegration_trend,
+        statistic=statistic,
+        num_lag_diff=num_lag_diff,
+        significance_level=coint_significance_level,
+    )
+    baskets_df = pd.DataFrame(summary)
+    if len(baskets_df):
+        baskets_df = baskets_df.sort_values(
+            "Score", ascending=False, kind="stable"
+        ).reset_index(drop=True)
+
+    screening_report = {
+        "nonstationary_securities": basket_data.shape[1],
+        "tested_baskets": len(baskets),
+        "cointegrated_baskets": len(baskets_df),
+    }
+    logger.info(f"Basket identification screening report: {screening_report}")
+    baskets_df.attrs["screening_report"] = screening_report
+
+    return baskets_df
@@ -1,16 +1,48 @@
 from .stationarity_tests import augmented_dickey_fuller_test
 from .stationarity_tests import philips_perron_test
 from .stationarity_tests import KPSS_test
+from .stationarity_tests import enable_stationarity_cache
+from .stationarity_tests import disable_stationarity_cache
+from .stationarity_tests import stationarity_cache_info
+from .stationarity_tests import batch_augmented_dickey_fuller_test
+from .stationarity_tests import batch_philips_perron_test
+from .stationarity_tests import batch_KPSS_test
 from .cointegration_tests import engle_granger_cointegration_test
 from .cointegration_tests import phillips_ouliaris_cointegration_test
 from .cointegration_tests import johansen_cointegration_test
+from .cointegration_tests import batch_engle_granger_cointegration_test
+from .cointegration_tests import batch_johansen_cointegration_test
+from .cointegration_tests import gregory_hansen_cointegration_test
+from .cointegration_tests import hatemi_j_cointegration_test
+from .cointegration_tests import IncrementalEngleGranger
+from .cointegration_tests import rolling_cointegration
+from .cointegration_tests import CointegrationResult
+from .cointegration_tests import enable_cointegration_store
+from .cointegration_tests import disable_cointegration_store
+from .cointegration_tests import cointegration_store_info
 
 # Define what should be accessible at the tests level
 __all__ = [
     "augmented_dickey_fuller_test",
     "philips_perron_test",
     "KPSS_test",
+    "enable_stationarity_cache",
+    "disable_stationarity_cache",
+    "stationarity_cache_info",
+    "batch_augmented_dickey_fuller_test",
+    "batch_philips_perron_test",
+    "batch_KPSS_test",
     "engle_granger_cointegration_test",
     "phillips_ouliaris_cointegration_test",
     "johansen_cointegration_test",
+    "batch_engle_granger_cointegration_test",
+    "batch_johansen_cointegration_test",
+    "gregory_hansen_cointegration_test",
+    "hatemi_j_cointegration_test",
+    "IncrementalEngleGranger",
+    "rolling_cointegration",
+    "CointegrationResult",
+    "enable_cointegration_store",
+    "disable_cointegration_store",
+    "cointegration_store_info",
 ]
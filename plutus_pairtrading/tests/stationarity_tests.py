@@ -4,17 +4,148 @@ This module tests for stationarity and order of integration which covers:
     * Augmented Dickey-Fuller test
     * Philips-Perron test
     * Kwiatkowski-Phillips-Schmidt-Shin (KPSS) test 
+
+Results can be cached across calls with `enable_stationarity_cache`. Each test also has a
+batched counterpart testing every column of a price matrix at once.
 """
 
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
+import numpy as np
 import pandas as pd
-from arch.unitroot import ADF, PhillipsPerron, KPSS
+from scipy import fft
+from arch.unitroot import ADF, KPSS
+from arch.unitroot.critical_values.kpss import kpss_critical_values
 
+from ..utils.cache import ResultCache, _fingerprint, _make_key
+from ..utils.critical_values import _critical_values, _rejections, _table_pvalues
+from ..utils.lag_selection import _select_lags
+from ..utils.parallel import _register_worker_state
 from ..utils.performance import _log_execution_time
+from ..utils.precision import _compute_dtype, _near_threshold
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache shared by the stationarity tests, disabled by default
+_STATIONARITY_CACHE: Optional[ResultCache] = None
+
+
+@_log_execution_time
+def enable_stationarity_cache(
+    max_size: int = 4096, path: Optional[str] = None
+) -> ResultCache:
+    """
+    Enables the result cache shared by the ADF, PP and KPSS tests.
+
+    Results are keyed by the content hash of the tested series, its first and last dates,
+    the test, the trend, the lag settings and the significance level.
+
+    The cache is rebuilt with the same settings in the worker processes of parallel
+    screenings. Each process has its own in-memory tier and hit/miss statistics, so only a
+    cache with a ``path`` shares results between the workers and the caller.
+
+    Args:
+        max_size (int, optional): Maximum number of results kept in the in-memory LRU tier. Defaults to 4096.
+        path (Optional[str], optional): SQLite file of the on-disk tier, shared across runs and processes.
+            Defaults to None (memory only).
+
+    Returns:
+        ResultCache: The enabled cache.
+    """
+    global _STATIONARITY_CACHE
+    _STATIONARITY_CACHE = ResultCache(max_size=max_size, path=path)
+    return _STATIONARITY_CACHE
+
+
+@_log_execution_time
+def disable_stationarity_cache() -> None:
+    """
+    Disables the result cache shared by the ADF, PP and KPSS tests.
+    """
+    global _STATIONARITY_CACHE
+    _STATIONARITY_CACHE = None
+
+
+@_log_execution_time
+def stationarity_cache_info() -> Dict[str, Any]:
+    """
+    Returns the hit/miss statistics of the stationarity cache.
+
+    The statistics are those of the current process; lookups made by the workers of a
+    parallel screening are not included.
+
+    Returns:
+        Dict[str, Any]: Cache statistics, empty if the cache is disabled.
+    """
+    if _STATIONARITY_CACHE is None:
+        return {}
+    return _STATIONARITY_CACHE.stats()
+
+
+def _restore_cache(settings: Optional[Tuple[Optional[str], int]]) -> None:
+    """
+    Restores the stationarity cache in a worker process.
+
+    Args:
+        settings (Optional[Tuple[Optional[str], int]]): Path and maximum size of the cache, or
+            None if it is disabled.
+    """
+    global _STATIONARITY_CACHE
+    if settings is None:
+        _STATIONARITY_CACHE = None
+        return
+    path, max_size = settings
+    # A forked worker already holds a copy of the cache
+    cache = _STATIONARITY_CACHE
+    if cache is None or (cache.path, cache.max_size) != (path, max_size):
+        _STATIONARITY_CACHE = ResultCache(max_size=max_size, path=path)
+
+
+def _cache_settings() -> Tuple[Callable[[Any], None], Any]:
+    """
+    Returns the restore function and settings of the stationarity cache for the workers.
+
+    Returns:
+        Tuple[Callable[[Any], None], Any]: ``_restore_cache`` and its settings.
+    """
+    if _STATIONARITY_CACHE is None:
+        return _restore_cache, None
+    return _restore_cache, (_STATIONARITY_CACHE.path, _STATIONARITY_CACHE.max_size)
+
+
+_register_worker_state(_cache_settings)
+
+
+def _cached_stationarity_test(
+    compute: Callable[[], dict], test: str, clean_data: pd.Series, *settings: Any
+) -> dict:
+    """
+    Runs a stationarity test through the stationarity cache, if enabled.
+
+    Args:
+        compute (Callable[[], dict]): Function running the test.
+        test (str): Name of the test.
+        clean_data (pd.Series): Tested series.
+        *settings (Any): Test settings that change the result.
+
+    Returns:
+        dict: Test results.
+    """
+    if _STATIONARITY_CACHE is None:
+        return compute()
+
+    bounds = (
+        (str(clean_data.index[0]), str(clean_data.index[-1]))
+        if len(clean_data)
+        else (None, None)
+    )
+    key = _make_key(test, _fingerprint(clean_data), *bounds, *settings)
+    result = _STATIONARITY_CACHE.get(key)
+    if result is None:
+        result = compute()
+        _STATIONARITY_CACHE.set(key, result)
+    return result
+
 
 @_log_execution_time
 def validate_trend(trend: str, allowed_trends: List[str]) -> str:
@@ -43,6 +174,28 @@ def validate_trend(trend: str, allowed_trends: List[str]) -> str:
     }[trend]
 
 
+def _validate_bandwidth(bandwidth: Optional[str]) -> Optional[str]:
+    """
+    Validates the automatic bandwidth selection of the Phillips-Perron test.
+
+    Args:
+        bandwidth (Optional[str]): Selection method provided by the user, or None.
+
+    Returns:
+        Optional[str]: Lowercase selection method, or None.
+
+    Raises:
+        ValueError: If the method is not supported.
+    """
+    if bandwidth is None:
+        return None
+    if bandwidth.lower() not in ("newey-west", "andrews"):
+        raise ValueError(
+            f"Invalid bandwidth: {bandwidth}. Allowed options are: Newey-West, Andrews"
+        )
+    return bandwidth.lower()
+
+
 @_log_execution_time
 def augmented_dickey_fuller_test(
     data: pd.DataFrame,
@@ -80,22 +233,50 @@ def augmented_dickey_fuller_test(
     # Adjust max_lag based on data length
     max_lag = min(max_lag_for_auto_detect, len(clean_data) - 1)
 
-    # Perform the ADF test
-    adf = ADF(
+    def compute():
+        lags = num_lags
+        if (
+            lags is None
+            and method.lower() in ("aic", "bic")
+            and _adf_feasible(len(clean_data), max_lag, adf_trend)
+        ):
+            # Shared lag search, so arch only fits the selected model. Infeasible
+            # searches are left to arch, which raises an informative error.
+            lags = int(
+                _adf_select_lags(
+                    clean_data.to_numpy(dtype=float)[:, None],
+                    max_lag,
+                    adf_trend,
+                    method.lower(),
+                )[0]
+            )
+        # Perform the ADF test
+        adf = ADF(
+            clean_data,
+            method=method.lower(),
+            lags=lags,
+            max_lags=max_lag,
+            trend=adf_trend,
+        )
+        return {
+            "Statistic": adf.stat,
+            "p-Value": adf.pvalue,
+            "Stationary": bool(adf.pvalue < significance_level),
+            "Lags": adf.lags,
+            "Trend": trend,
+            "Critical Values": adf.critical_values,
+        }
+
+    return _cached_stationarity_test(
+        compute,
+        "ADF",
         clean_data,
-        method=method.lower(),
-        lags=num_lags,
-        max_lags=max_lag,
-        trend=adf_trend,
+        trend,
+        method.lower(),
+        max_lag,
+        num_lags,
+        significance_level,
     )
-    return {
-        "Statistic": adf.stat,
-        "p-Value": adf.pvalue,
-        "Stationary": bool(adf.pvalue < significance_level),
-        "Lags": adf.lags,
-        "Trend": trend,
-        "Critical Values": adf.critical_values,
-    }
 
 
 @_log_execution_time
@@ -105,10 +286,14 @@ def philips_perron_test(
     lags: Optional[int] = None,
     trend: str = "constant",
     significance_level: float = 0.05,
+    bandwidth: Optional[str] = None,
 ) -> dict:
     """
     Tests for stationarity using the Phillips-Perron (PP) test.
 
+    The Newey-West long-run variance is computed from FFT autocovariances when the number of
+    lags is large, so the default of ``len(data) - 1`` lags stays practical on long intraday series.
+
     Args:
         data (pd.DataFrame): DataFrame containing the time series data.
         security (str): Name of the security column to test.
@@ -116,6 +301,9 @@ def philips_perron_test(
         trend (str, optional): Trend assumption. Options: "no deterministic term", "constant", "constant and time trend".
             Defaults to "constant".
         significance_level (float, optional): Significance level for the test. Defaults to 0.05.
+        bandwidth (Optional[str], optional): Automatic bandwidth selection used when lags is None. Options:
+            "Newey-West" (Newey and West, 1994), "Andrews" (Andrews, 1991). Defaults to None, which uses
+            the number of observations minus one.
 
     Returns:
         dict: Test results, including statistic, p-value, stationarity status, and critical values.
@@ -123,24 +311,40 @@ def philips_perron_test(
     pp_trend = validate_trend(
         trend, ["no deterministic term", "constant", "constant and time trend"]
     )
+    bandwidth = _validate_bandwidth(bandwidth)
 
     if security not in data.columns:
         raise ValueError(f"Security '{security}' not found in the DataFrame.")
     clean_data = data[security].dropna()
 
-    # Ensure lags are feasible
-    max_possible_lags = len(clean_data) - 1
-    lags = lags if lags is not None else max_possible_lags
+    def compute():
+        statistics, bandwidths = _phillips_perron_statistics(
+            clean_data.to_numpy(dtype=float)[:, None], pp_trend, lags, bandwidth
+        )
+        pvalue = float(_table_pvalues(statistics, "dickey-fuller", pp_trend)[0])
+        critical_values = _critical_values(
+            "dickey-fuller", pp_trend, len(clean_data) - 1
+        )
+        return {
+            "Statistic": float(statistics[0]),
+            "p-Value": pvalue,
+            "Stationary": bool(
+                _rejections(
+                    statistics[0], pvalue, "dickey-fuller", pp_trend, significance_level
+                )
+            ),
+            "Lags": int(bandwidths[0]),
+            "Trend": trend,
+            "Critical Values": {
+                "1%": critical_values[0],
+                "5%": critical_values[1],
+                "10%": critical_values[2],
+            },
+        }
 
-    pp = PhillipsPerron(clean_data, lags=lags, trend=pp_trend)
-    return {
-        "Statistic": pp.stat,
-        "p-Value": pp.pvalue,
-        "Stationary": bool(pp.pvalue < significance_level),
-        "Lags": pp.lags,
-        "Trend": trend,
-        "Critical Values": pp.critical_values,
-    }
+    return _cached_stationarity_test(
+        compute, "PP", clean_data, trend, lags, bandwidth, significance_level
+    )
 
 
 @_log_execution_time
@@ -170,12 +374,724 @@ def KPSS_test(
         raise ValueError(f"Security '{security}' not found in the DataFrame.")
     clean_data = data[security].dropna()
 
-    kpss = KPSS(clean_data, lags=lags, trend=kpss_trend)
-    return {
-        "Statistic": kpss.stat,
-        "p-Value": kpss.pvalue,
-        "Stationary": bool(kpss.pvalue >= significance_level),
-        "Lags": kpss.lags,
-        "Trend": trend,
-        "Critical Values": kpss.critical_values,
-    }
+    def compute():
+        kpss = KPSS(clean_data, lags=lags, trend=kpss_trend)
+        return {
+            "Statistic": kpss.stat,
+            "p-Value": kpss.pvalue,
+            "Stationary": bool(kpss.pvalue >= significance_level),
+            "Lags": kpss.lags,
+            "Trend": trend,
+            "Critical Values": kpss.critical_values,
+        }
+
+    return _cached_stationarity_test(
+        compute, "KPSS", clean_data, trend, lags, significance_level
+    )
+
+
+def _column_blocks(
+    data: pd.DataFrame,
+    securities: Optional[List[str]],
+    block_size: int,
+    dtype: type = np.float64,
+) -> List[Tuple[List[str], np.ndarray]]:
+    """
+    Splits the columns of a price matrix into blocks tested together.
+
+    Columns are grouped by their missing-value pattern, so every block is tested on the
+    same observations as the per-column tests (which drop missing values).
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]]): Columns to test. Defaults to all columns.
+        block_size (int): Maximum number of columns per block.
+        dtype (type, optional): Floating-point type of the values. Defaults to np.float64.
+
+    Returns:
+        List[Tuple[List[str], np.ndarray]]: Names and nobs x B values of every block.
+
+    Raises:
+        ValueError: If a security is missing or the block size is not positive.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+    securities = list(data.columns) if securities is None else list(securities)
+    missing = [security for security in securities if security not in data.columns]
+    if missing:
+        raise ValueError(f"Securities {missing} not found in the DataFrame.")
+
+    observed = data[securities].notna().to_numpy()
+    groups: Dict[bytes, List[int]] = {}
+    for column in range(len(securities)):
+        groups.setdefault(observed[:, column].tobytes(), []).append(column)
+
+    blocks = []
+    for columns in groups.values():
+        rows = observed[:, columns[0]]
+        for start in range(0, len(columns), block_size):
+            chunk = columns[start : start + block_size]
+            values = data[[securities[column] for column in chunk]].to_numpy(
+                dtype=dtype
+            )[rows]
+            blocks.append(([securities[column] for column in chunk], values))
+    return blocks
+
+
+def _trend_columns(nobs: int, trend: str) -> np.ndarray:
+    """
+    Deterministic regressors of a unit-root regression, centered and scaled.
+
+    The columns span the same space as arch's constant and time trend, which leaves the
+    residuals and the statistics unchanged while keeping the normal equations well conditioned.
+
+    Args:
+        nobs (int): Number of observations.
+        trend (str): Converted trend option ("n", "c" or "ct").
+
+    Returns:
+        np.ndarray: nobs x d matrix, with d the number of deterministic terms.
+    """
+    terms = [np.ones(nobs)] if trend in ("c", "ct") else []
+    if trend == "ct":
+        terms.append((np.arange(nobs) - (nobs - 1) / 2.0) / nobs)
+    return np.column_stack(terms) if terms else np.empty((nobs, 0))
+
+
+def _trend_residuals(values: np.ndarray, trend: str) -> np.ndarray:
+    """
+    Residuals of every column of a matrix on the deterministic terms.
+
+    Args:
+        values (np.ndarray): nobs x B matrix.
+        trend (str): Converted trend option ("n", "c" or "ct").
+
+    Returns:
+        np.ndarray: nobs x B residuals.
+    """
+    terms = _trend_columns(values.shape[0], trend).astype(values.dtype, copy=False)
+    if not terms.shape[1]:
+        return values
+    coef, *_ = np.linalg.lstsq(terms, values, rcond=None)
+    return values - terms @ coef
+
+
+def _autocovariances(residuals: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Sums of products u[t] * u[t - j] of many series for j = 0, ..., max_lag.
+
+    Short bandwidths use direct dot products, long ones the FFT, which costs
+    O(nobs log nobs) per series whatever the bandwidth.
+
+    Args:
+        residuals (np.ndarray): nobs x B matrix of series.
+        max_lag (int): Largest lag needed.
+
+    Returns:
+        np.ndarray: (max_lag + 1) x B autocovariance sums (not divided by nobs).
+    """
+    nobs = residuals.shape[0]
+    max_lag = min(max_lag, nobs - 1)
+    if max_lag < 2 * np.log2(nobs):
+        return np.stack(
+            [
+                np.einsum("tb,tb->b", residuals[lag:], residuals[: nobs - lag])
+                for lag in range(max_lag + 1)
+            ]
+        )
+    size = fft.next_fast_len(2 * nobs - 1, real=True)
+    spectrum = fft.rfft(residuals, size, axis=0)
+    acov = fft.irfft(spectrum.real**2 + spectrum.imag**2, size, axis=0)
+    return acov[: max_lag + 1]
+
+
+def _bartlett_long_run_variance(
+    acov: np.ndarray, lags: np.ndarray, nobs: int
+) -> np.ndarray:
+    """
+    Newey-West (Bartlett kernel) long-run variances of many series, as in arch's ``cov_nw``.
+
+    Args:
+        acov (np.ndarray): Output of ``_autocovariances``, with at least max(lags) + 1 rows
+            or all lags of the series.
+        lags (np.ndarray): Bandwidth of every series.
+        nobs (int): Number of observations.
+
+    Returns:
+        np.ndarray: Long-run variance of every series.
+    """
+    lag = np.arange(acov.shape[0])[:, None]
+    weights = np.clip(1.0 - lag / (np.asarray(lags)[None, :] + 1.0), 0.0, None)
+    weights[0] = 0.5
+    return 2.0 * np.einsum("jb,jb->b", weights, acov) / nobs
+
+
+def _automatic_bandwidth(residuals: np.ndarray, method: str) -> np.ndarray:
+    """
+    Data-driven Bartlett kernel bandwidths of many series.
+
+    "newey-west" is the nonparametric selection of Newey and West (1994) and "andrews" the
+    AR(1) plug-in selection of Andrews (1991). Both grow like nobs ** (1 / 3).
+
+    Args:
+        residuals (np.ndarray): nobs x B matrix of residuals.
+        method (str): Selection method, "newey-west" or "andrews".
+
+    Returns:
+        np.ndarray: Bandwidth (number of lags) of every series.
+    """
+    nobs = residuals.shape[0]
+    if method == "andrews":
+        rho = np.einsum("tb,tb->b", residuals[1:], residuals[:-1]) / np.einsum(
+            "tb,tb->b", residuals[:-1], residuals[:-1]
+        )
+        alpha = 4.0 * rho**2 / ((1.0 - rho) ** 2 * (1.0 + rho) ** 2)
+        gamma_hat = 1.1447 * np.power(alpha * nobs, 1.0 / 3.0)
+    else:
+        covlags = int(4.0 * np.power(nobs / 100.0, 2.0 / 9.0))
+        acov = _autocovariances(residuals, covlags)
+        s0 = acov[0] + 2.0 * acov[1:].sum(axis=0)
+        s1 = 2.0 * np.einsum("j,jb->b", np.arange(1.0, len(acov)), acov[1:])
+        gamma_hat = (
+            1.1447 * np.power((s1 / s0) ** 2, 1.0 / 3.0) * np.power(nobs, 1.0 / 3.0)
+        )
+    bandwidth = np.nan_to_num(gamma_hat, nan=0.0, posinf=nobs - 1.0)
+    return np.clip(bandwidth.astype(int), 0, nobs - 1)
+
+
+def _phillips_perron_statistics(
+    levels: np.ndarray,
+    trend: str,
+    lags: Optional[int] = None,
+    bandwidth: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Phillips-Perron tau statistics of many series.
+
+    The regressions are solved in batch and the Newey-West long-run variances come from
+    FFT autocovariances when the bandwidth is long, so even ``nobs - 1`` lags cost
+    O(nobs log nobs) per series instead of O(nobs ** 2).
+
+    Args:
+        levels (np.ndarray): nobs x B matrix of series.
+        trend (str): Converted trend option ("n", "c" or "ct").
+        lags (Optional[int], optional): Bandwidth of the long-run variance. Defaults to None.
+        bandwidth (Optional[str], optional): Automatic bandwidth selection used when ``lags`` is
+            None, "newey-west" or "andrews". Defaults to None (the number of observations minus one).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: tau statistics and bandwidths of every series.
+
+    Raises:
+        ValueError: If the series are too short.
+    """
+    nobs = levels.shape[0] - 1
+    num_terms = 1 + len(trend.strip("n"))
+    if nobs <= num_terms or (lags is not None and nobs < lags):
+        raise ValueError(
+            f"Too few observations ({nobs + 1}) for the Phillips-Perron test."
+        )
+
+    # Frisch-Waugh: regress the detrended y[t] on the detrended y[t - 1]
+    target = _trend_residuals(levels[1:], trend)
+    regressor = _trend_residuals(levels[:-1], trend)
+    sxx = np.einsum("tb,tb->b", regressor, regressor).astype(np.float64)
+    rho = np.einsum("tb,tb->b", regressor, target).astype(np.float64) / sxx
+    residuals = target - rho.astype(levels.dtype) * regressor
+
+    if lags is not None:
+        bandwidths = np.full(levels.shape[1], lags)
+    elif bandwidth is not None:
+        bandwidths = _automatic_bandwidth(residuals, bandwidth)
+    else:
+        bandwidths = np.full(levels.shape[1], nobs)
+
+    acov = _autocovariances(residuals, int(bandwidths.max())).astype(np.float64)
+    lam2 = _bartlett_long_run_variance(acov, bandwidths, nobs)
+    s2 = acov[0] / (nobs - num_terms)
+    gamma0 = acov[0] / nobs
+    sigma = np.sqrt(s2 / sxx)
+    tau = np.sqrt(gamma0 / lam2) * ((rho - 1) / sigma) - 0.5 * (
+        (lam2 - gamma0) / np.sqrt(lam2)
+    ) * (nobs * sigma / np.sqrt(s2))
+    return tau, bandwidths
+
+
+def _adf_design(
+    levels: np.ndarray, lags: int, start: int, trend: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stacked design matrices of the ADF regressions of many series.
+
+    Each regression explains d[j] by the deterministic terms, the level y[j] and
+    d[j - 1], ..., d[j - lags] over j = start, ..., where d are first differences,
+    so the first ``start`` differences are held back as in arch's lag search.
+
+    Args:
+        levels (np.ndarray): nobs x B matrix of series.
+        lags (int): Number of lagged differences.
+        start (int): First difference used as dependent variable, at least ``lags``.
+        trend (str): Converted trend option ("n", "c" or "ct").
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: B x m x k regressors, ordered as deterministic terms,
+            level and lagged differences, and B x m dependent variables.
+    """
+    nobs, n_series = levels.shape
+    delta = np.diff(levels, axis=0)
+    rows = nobs - 1 - start
+    terms = _trend_columns(rows, trend)
+    width = terms.shape[1]
+
+    design = np.empty((n_series, rows, width + 1 + lags), dtype=levels.dtype)
+    design[:, :, :width] = terms
+    level = levels[start : nobs - 1].T
+    # Centering the level is a reparameterization when a constant is included
+    design[:, :, width] = level - level.mean(axis=1, keepdims=True) if width else level
+    for lag in range(1, lags + 1):
+        design[:, :, width + lag] = delta[start - lag : nobs - 1 - lag].T
+    return design, np.ascontiguousarray(delta[start:].T)
+
+
+def _adf_feasible(nobs: int, lags: int, trend: str) -> bool:
+    """
+    Checks that an ADF regression with ``lags`` lagged differences can be estimated.
+
+    Args:
+        nobs (int): Number of observations of the series.
+        lags (int): Number of lagged differences, or the largest one of a lag search.
+        trend (str): Converted trend option ("n", "c" or "ct").
+
+    Returns:
+        bool: Whether more observations remain than regressors.
+    """
+    return nobs - 1 - lags > len(trend.strip("n")) + 1 + lags
+
+
+def _adf_select_lags(
+    levels: np.ndarray, max_lags: int, trend: str, method: str
+) -> np.ndarray:
+    """
+    Selects the ADF lag length of many series by information criterion in one pass.
+
+    All candidate models are fit on the common sample implied by ``max_lags`` from one
+    factorization of the cross-products of the stacked design, exactly like arch's ADF lag search.
+
+    Args:
+        levels (np.ndarray): nobs x B matrix of series.
+        max_lags (int): Largest lag length considered.
+        trend (str): Converted trend option ("n", "c" or "ct").
+        method (str): Information criterion, "aic" or "bic".
+
+    Returns:
+        np.ndarray: Selected lag length of every series.
+    """
+    design, target = _adf_design(levels, max_lags, max_lags, trend)
+    # The products run in the precision of the levels, the small solves in float64
+    xpx = np.matmul(design.transpose(0, 2, 1), design).astype(np.float64)
+    xpy = np.einsum("bmk,bm->bk", design, target).astype(np.float64)
+    ypy = np.einsum("bm,bm->b", target, target).astype(np.float64)
+    first = design.shape[2] - max_lags
+    return _select_lags(xpx, xpy, ypy, design.shape[1], first, method)
+
+
+def _adf_statistics(levels: np.ndarray, lags: int, trend: str) -> np.ndarray:
+    """
+    Computes the ADF t-statistics of many series with a common lag length.
+
+    Args:
+        levels (np.ndarray): nobs x B matrix of series.
+        lags (int): Number of lagged differences.
+        trend (str): Converted trend option ("n", "c" or "ct").
+
+    Returns:
+        np.ndarray: t-statistic of the lagged level of every series.
+    """
+    design, target = _adf_design(levels, lags, lags, trend)
+    rows, k = design.shape[1], design.shape[2]
+    width = k - 1 - lags
+    xpxi = np.linalg.inv(
+        np.matmul(design.transpose(0, 2, 1), design).astype(np.float64)
+    )
+    xpy = np.einsum("bmk,bm->bk", design, target).astype(np.float64)
+    params = np.einsum("bkl,bl->bk", xpxi, xpy)
+    s2 = (
+        np.einsum("bm,bm->b", target, target).astype(np.float64)
+        - np.einsum("bk,bk->b", params, xpy)
+    ) / (rows - k)
+    return params[:, width] / np.sqrt(s2 * xpxi[:, width, width])
+
+
+def _adf_blocks(
+    data: pd.DataFrame,
+    securities: Optional[List[str]],
+    trend: str,
+    method: str,
+    max_lag_for_auto_detect: int,
+    num_lags: Optional[int],
+    block_size: int,
+    dtype: type,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Computes the ADF statistics of the columns of a price matrix, block by block.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]]): Columns to test. Defaults to all columns.
+        trend (str): Converted trend option ("n", "c" or "ct").
+        method (str): Information criterion, "aic" or "bic".
+        max_lag_for_auto_detect (int): Maximum number of lags for automatic selection.
+        num_lags (Optional[int]): Fixed number of lags, skipping the lag search.
+        block_size (int): Number of columns solved together.
+        dtype (type): Floating-point type of the products.
+
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: Tested securities, in computation order,
+            with their statistics and lag lengths.
+
+    Raises:
+        ValueError: If a security is missing or a series is too short.
+    """
+    names, statistics, lags = [], [], []
+    for block, values in _column_blocks(data, securities, block_size, dtype):
+        nobs = values.shape[0]
+        max_lag = min(max_lag_for_auto_detect, nobs - 1)
+        needed = max_lag if num_lags is None else num_lags
+        if not _adf_feasible(nobs, needed, trend):
+            raise ValueError(
+                f"Too few observations ({nobs}) to test {block} with {needed} lags."
+            )
+
+        if num_lags is None:
+            block_lags = _adf_select_lags(values, max_lag, trend, method)
+        else:
+            block_lags = np.full(len(block), num_lags)
+        block_statistics = np.empty(len(block))
+        for lag in np.unique(block_lags):
+            members = np.flatnonzero(block_lags == lag)
+            block_statistics[members] = _adf_statistics(values[:, members], lag, trend)
+
+        names.extend(block)
+        statistics.append(block_statistics)
+        lags.append(block_lags)
+
+    if not names:
+        return names, np.empty(0), np.empty(0, dtype=int)
+    return names, np.concatenate(statistics), np.concatenate(lags)
+
+
+def _pp_blocks(
+    data: pd.DataFrame,
+    securities: Optional[List[str]],
+    trend: str,
+    lags: Optional[int],
+    bandwidth: Optional[str],
+    block_size: int,
+    dtype: type,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Computes the Phillips-Perron statistics of the columns of a price matrix, block by block.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]]): Columns to test. Defaults to all columns.
+        trend (str): Converted trend option ("n", "c" or "ct").
+        lags (Optional[int]): Bandwidth of the long-run variance.
+        bandwidth (Optional[str]): Automatic bandwidth selection used when ``lags`` is None.
+        block_size (int): Number of columns solved together.
+        dtype (type): Floating-point type of the products.
+
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: Tested securities, in computation order,
+            with their statistics and bandwidths.
+    """
+    names, statistics, block_lags = [], [], []
+    for block, values in _column_blocks(data, securities, block_size, dtype):
+        tau, bandwidths = _phillips_perron_statistics(values, trend, lags, bandwidth)
+        names.extend(block)
+        statistics.append(tau)
+        block_lags.append(bandwidths)
+
+    if not names:
+        return names, np.empty(0), np.empty(0, dtype=int)
+    return names, np.concatenate(statistics), np.concatenate(block_lags)
+
+
+def _reverify(
+    names: List[str],
+    statistics: np.ndarray,
+    lags: np.ndarray,
+    trend: str,
+    significance_level: float,
+    blocks: Callable[[List[str], type], Tuple[List[str], np.ndarray, np.ndarray]],
+) -> None:
+    """
+    Recomputes in float64 the statistics decided too close to the critical value.
+
+    Only does anything in float32 mode, see ``set_precision``.
+
+    Args:
+        names (List[str]): Tested securities, in computation order.
+        statistics (np.ndarray): Their Dickey-Fuller statistics, updated in place.
+        lags (np.ndarray): Their lag lengths, updated in place.
+        trend (str): Converted trend option ("n", "c" or "ct").
+        significance_level (float): Significance level of the test.
+        blocks (Callable): Function computing the names, statistics and lag lengths of some
+            securities at a given precision.
+    """
+    recheck = np.flatnonzero(
+        _near_threshold(statistics, "dickey-fuller", trend, significance_level)
+    )
+    if not len(recheck):
+        return
+    exact_names, exact_statistics, exact_lags = blocks(
+        [names[i] for i in recheck], np.float64
+    )
+    order = pd.Index(exact_names).get_indexer([names[i] for i in recheck])
+    statistics[recheck] = exact_statistics[order]
+    lags[recheck] = exact_lags[order]
+    logger.info(f"Re-verified {len(recheck)} series in float64.")
+
+
+def _stationarity_frame(
+    names: List[str],
+    statistics: np.ndarray,
+    pvalues: np.ndarray,
+    stationary: np.ndarray,
+    lags: np.ndarray,
+    trend: str,
+    securities: List[str],
+) -> pd.DataFrame:
+    """
+    Assembles the result table of the batched stationarity tests.
+
+    Args:
+        names (List[str]): Tested securities, in computation order.
+        statistics (np.ndarray): Test statistics.
+        pvalues (np.ndarray): p-values.
+        stationary (np.ndarray): Stationarity decisions.
+        lags (np.ndarray): Lag lengths.
+        trend (str): Trend argument provided by the user.
+        securities (List[str]): Securities in the requested order.
+
+    Returns:
+        pd.DataFrame: One row per security, indexed by security.
+    """
+    result = pd.DataFrame(
+        {
+            "Statistic": statistics,
+            "p-Value": pvalues,
+            "Stationary": np.asarray(stationary, dtype=bool),
+            "Lags": np.asarray(lags, dtype=int),
+            "Trend": trend,
+        },
+        index=pd.Index(names, name="security"),
+    )
+    return result.loc[securities]
+
+
+@_log_execution_time
+def batch_augmented_dickey_fuller_test(
+    data: pd.DataFrame,
+    securities: Optional[List[str]] = None,
+    trend: str = "constant",
+    method: str = "AIC",
+    max_lag_for_auto_detect: int = 20,
+    num_lags: Optional[int] = None,
+    significance_level: float = 0.05,
+    block_size: int = 64,
+) -> pd.DataFrame:
+    """
+    Tests every column of a price matrix for stationarity using the Augmented Dickey-Fuller test.
+
+    The lagged-difference design matrices of a block of columns are stacked and all regressions
+    are solved in batch, including the AIC/BIC lag search over every candidate lag length.
+    Results match ``augmented_dickey_fuller_test`` run column by column. With
+    ``set_precision("float32")`` the stacked products run in single precision and the series
+    decided within 0.05 of the critical value are recomputed in float64.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]], optional): Columns to test. Defaults to all columns.
+        trend (str, optional): Trend assumption. Options: "no deterministic term", "constant", "constant and time trend".
+            Defaults to "constant".
+        method (str, optional): Criterion for lag selection. Options: "AIC", "BIC". Defaults to "AIC".
+        max_lag_for_auto_detect (int, optional): Maximum number of lags for automatic selection. Defaults to 20.
+        num_lags (Optional[int], optional): Fixed number of lags to use. If None, lags are automatically selected.
+        significance_level (float, optional): Significance level for the test. Defaults to 0.05.
+        block_size (int, optional): Number of columns solved together, bounding memory use. Defaults to 64.
+
+    Returns:
+        pd.DataFrame: One row per security with "Statistic", "p-Value", "Stationary", "Lags" and "Trend".
+
+    Raises:
+        ValueError: If an option is invalid, a security is missing or a series is too short.
+    """
+    adf_trend = validate_trend(
+        trend, ["no deterministic term", "constant", "constant and time trend"]
+    )
+    method = method.lower()
+    if method not in ("aic", "bic"):
+        raise ValueError("Invalid method. Options are: 'AIC', 'BIC'.")
+
+    def blocks(tested, dtype):
+        return _adf_blocks(
+            data,
+            tested,
+            adf_trend,
+            method,
+            max_lag_for_auto_detect,
+            num_lags,
+            block_size,
+            dtype,
+        )
+
+    names, statistics, lags = blocks(securities, _compute_dtype())
+    _reverify(names, statistics, lags, adf_trend, significance_level, blocks)
+    pvalues = _table_pvalues(statistics, "dickey-fuller", adf_trend)
+    return _stationarity_frame(
+        names,
+        statistics,
+        pvalues,
+        _rejections(
+            statistics, pvalues, "dickey-fuller", adf_trend, significance_level
+        ),
+        lags,
+        trend,
+        list(data.columns) if securities is None else list(securities),
+    )
+
+
+@_log_execution_time
+def batch_philips_perron_test(
+    data: pd.DataFrame,
+    securities: Optional[List[str]] = None,
+    lags: Optional[int] = None,
+    trend: str = "constant",
+    significance_level: float = 0.05,
+    block_size: int = 256,
+    bandwidth: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Tests every column of a price matrix for stationarity using the Phillips-Perron test.
+
+    The regressions of a block of columns are solved in batch and the Newey-West long-run
+    variances come from FFT autocovariances, so the default bandwidth of ``len - 1`` lags
+    costs O(nobs log nobs) per series. Results match ``philips_perron_test`` run column by column.
+    With ``set_precision("float32")`` the regressions and autocovariances run in single precision
+    and the series decided within 0.05 of the critical value are recomputed in float64.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]], optional): Columns to test. Defaults to all columns.
+        lags (Optional[int], optional): Number of lags to use. If None, the number of observations minus one is used.
+            Defaults to None.
+        trend (str, optional): Trend assumption. Options: "no deterministic term", "constant", "constant and time trend".
+            Defaults to "constant".
+        significance_level (float, optional): Significance level for the test. Defaults to 0.05.
+        block_size (int, optional): Number of columns solved together, bounding memory use. Defaults to 256.
+        bandwidth (Optional[str], optional): Automatic bandwidth selection used when lags is None, see
+            ``philips_perron_test``. Defaults to None.
+
+    Returns:
+        pd.DataFrame: One row per security with "Statistic", "p-Value", "Stationary", "Lags" and "Trend".
+
+    Raises:
+        ValueError: If an option is invalid, a security is missing or a series is too short.
+    """
+    pp_trend = validate_trend(
+        trend, ["no deterministic term", "constant", "constant and time trend"]
+    )
+    bandwidth = _validate_bandwidth(bandwidth)
+
+    def blocks(tested, dtype):
+        return _pp_blocks(data, tested, pp_trend, lags, bandwidth, block_size, dtype)
+
+    names, statistics, bandwidths = blocks(securities, _compute_dtype())
+    _reverify(names, statistics, bandwidths, pp_trend, significance_level, blocks)
+    pvalues = _table_pvalues(statistics, "dickey-fuller", pp_trend)
+    return _stationarity_frame(
+        names,
+        statistics,
+        pvalues,
+        _rejections(statistics, pvalues, "dickey-fuller", pp_trend, significance_level),
+        bandwidths,
+        trend,
+        list(data.columns) if securities is None else list(securities),
+    )
+
+
+@_log_execution_time
+def batch_KPSS_test(
+    data: pd.DataFrame,
+    securities: Optional[List[str]] = None,
+    lags: Optional[int] = None,
+    trend: str = "constant",
+    significance_level: float = 0.05,
+    block_size: int = 256,
+) -> pd.DataFrame:
+    """
+    Tests every column of a price matrix for stationarity using the KPSS test.
+
+    The detrending regressions, the automatic (Hobijn et al.) bandwidths and the Newey-West
+    long-run variances of a block of columns are computed in batch. Results match ``KPSS_test``
+    run column by column.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the time series data.
+        securities (Optional[List[str]], optional): Columns to test. Defaults to all columns.
+        lags (Optional[int], optional): Number of lags to use. If None, automatic selection is performed. Defaults to None.
+        trend (str, optional): Trend assumption. Options: "constant", "constant and time trend". Defaults to "constant".
+        significance_level (float, optional): Significance level for the test. Defaults to 0.05.
+        block_size (int, optional): Number of columns solved together, bounding memory use. Defaults to 256.
+
+    Returns:
+        pd.DataFrame: One row per security with "Statistic", "p-Value", "Stationary", "Lags" and "Trend".
+
+    Raises:
+        ValueError: If an option is invalid, a security is missing or a series is too short.
+    """
+    kpss_trend = validate_trend(trend, ["constant", "constant and time trend"])
+    table = kpss_critical_values[kpss_trend]
+
+    names, statistics, block_lags = [], [], []
+    for block, values in _column_blocks(data, securities, block_size):
+        nobs = values.shape[0]
+        if nobs <= len(kpss_trend) or (lags is not None and nobs < lags):
+            raise ValueError(f"Too few observations ({nobs}) to test {block}.")
+
+        residuals = _trend_residuals(values, kpss_trend)
+        if lags is None:
+            # Hobijn, Franses and Ooms (2004) bandwidth, as in arch
+            covlags = int(np.power(nobs, 2.0 / 9.0))
+            acov = _autocovariances(residuals, covlags)
+            weights = np.arange(covlags + 1.0)
+            s0 = (acov[0] + 2.0 * acov[1:].sum(axis=0)) / nobs
+            s1 = 2.0 * np.einsum("j,jb->b", weights[1:], acov[1:]) / nobs
+            gamma_hat = 1.1447 * np.power((s1 / s0) ** 2, 1.0 / 3.0)
+            bandwidth = np.minimum(
+                nobs, (gamma_hat * np.power(nobs, 1.0 / 3.0)).astype(int)
+            )
+        else:
+            bandwidth = np.full(len(block), lags)
+
+        acov = _autocovariances(residuals, int(bandwidth.max()))
+        lam = _bartlett_long_run_variance(acov, bandwidth, nobs)
+        partial_sums = np.cumsum(residuals, axis=0)
+        names.extend(block)
+        statistics.append(
+            np.einsum("tb,tb->b", partial_sums, partial_sums) / nobs**2 / lam
+        )
+        block_lags.append(bandwidth)
+
+    statistics = np.concatenate(statistics) if names else np.empty(0)
+    pvalues = np.interp(statistics, table[:, 1], table[:, 0]) / 100.0
+    return _stationarity_frame(
+        names,
+        statistics,
+        pvalues,
+        pvalues >= significance_level,
+        np.concatenate(block_lags) if names else np.empty(0),
+        trend,
+        list(data.columns) if securities is None else list(securities),
+    )
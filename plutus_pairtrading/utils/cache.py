@@ -0,0 +1,299 @@
+"""
+This module provides a two-tier result cache used to avoid recomputing
+statistical tests on data that has already been tested.
+
+Results are stored under a string key, first in an in-memory LRU tier and,
+optionally, in an on-disk SQLite tier shared across runs and processes.
+Values are stored as JSON; NumPy scalars and arrays, pandas Series and
+DataFrames are tagged so they come back with their original type.
+
+Classes and Functions:
+    - ResultCache: Two-tier (memory LRU + optional SQLite) cache with hit/miss statistics.
+    - _fingerprint: Content hash of a pandas object (values and index).
+    - _make_key: Builds a cache key from its parts.
+    - _encode / _decode: JSON-compatible (de)serialization of test results.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(data: Any) -> str:
+    """
+    Computes a content hash of a pandas object or NumPy array.
+
+    Args:
+        data (Any): Series, DataFrame or array to hash. The index of pandas objects is part of the hash.
+
+    Returns:
+        str: Hexadecimal BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(list(data.columns)).encode())
+    else:
+        values = np.ascontiguousarray(data)
+        digest.update(str(values.dtype).encode())
+        digest.update(repr(values.shape).encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def _make_key(*parts: Any) -> str:
+    """
+    Builds a cache key from its parts.
+
+    Args:
+        *parts (Any): Hashable description of the cached computation (method, fingerprint, settings...).
+
+    Returns:
+        str: Cache key.
+    """
+    return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+
+def _encode_index(index: pd.Index) -> Dict[str, Any]:
+    """Encodes a pandas index into JSON-compatible values."""
+    if isinstance(index, pd.DatetimeIndex):
+        return {"values": index.astype(str).tolist(), "datetime": True}
+    if isinstance(index, pd.RangeIndex):
+        return {"range": [index.start, index.stop, index.step]}
+    return {"values": [_encode(value) for value in index], "datetime": False}
+
+
+def _decode_index(encoded: Dict[str, Any]) -> pd.Index:
+    """Decodes an index encoded by ``_encode_index``."""
+    if "range" in encoded:
+        return pd.RangeIndex(*encoded["range"])
+    if encoded["datetime"]:
+        return pd.DatetimeIndex(pd.to_datetime(encoded["values"]))
+    return pd.Index([_decode(value) for value in encoded["values"]])
+
+
+def _encode(value: Any) -> Any:
+    """
+    Converts a test result into JSON-compatible values.
+
+    Args:
+        value (Any): Result made of dicts, lists, scalars, NumPy and pandas objects.
+
+    Returns:
+        Any: JSON-compatible representation, decoded by ``_decode``.
+    """
+    if isinstance(value, dict):
+        return {"__dict__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, pd.Series):
+        return {
+            "__series__": {
+                "values": value.to_numpy(dtype=float).tolist(),
+                "index": _encode_index(value.index),
+                "name": _encode(value.name),
+            }
+        }
+    if isinstance(value, pd.DataFrame):
+        return {
+            "__frame__": {
+                "columns": {
+                    str(col): _encode(value[col].to_numpy()) for col in value.columns
+                },
+                "order": [str(col) for col in value.columns],
+                "index": _encode_index(value.index),
+            }
+        }
+    if isinstance(value, np.ndarray):
+        return {"__array__": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """
+    Rebuilds a value converted by ``_encode``.
+
+    Args:
+        value (Any): JSON-compatible representation.
+
+    Returns:
+        Any: Original result.
+    """
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__dict__" in value:
+        return {_decode(k): _decode(v) for k, v in value["__dict__"]}
+    if "__series__" in value:
+        encoded = value["__series__"]
+        return pd.Series(
+            encoded["values"],
+            index=_decode_index(encoded["index"]),
+            name=_decode(encoded["name"]),
+        )
+    if "__frame__" in value:
+        encoded = value["__frame__"]
+        return pd.DataFrame(
+            {col: _decode(encoded["columns"][col]) for col in encoded["order"]},
+            index=_decode_index(encoded["index"]),
+        )
+    if "__array__" in value:
+        return np.array(value["__array__"], dtype=value["dtype"])
+    return value
+
+
+class ResultCache:
+    """
+    Two-tier result cache with an in-memory LRU tier and an optional on-disk SQLite tier.
+
+    Args:
+        max_size (int, optional): Maximum number of results kept in memory. Defaults to 4096.
+        path (Optional[str], optional): SQLite file of the on-disk tier. Defaults to None (memory only).
+
+    Example:
+        cache = ResultCache(max_size=1024, path="data/cache/stationarity.sqlite")
+        cache.set(key, result)
+        cache.get(key)
+        cache.stats()
+    """
+
+    def __init__(self, max_size: int = 4096, path: Optional[str] = None) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self.path = path
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._disk()
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """Returns the SQLite connection of the current process, if any."""
+        if self.path is None:
+            return None
+        # SQLite connections must not be shared with forked workers
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.commit()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _remember(self, key: str, value: str) -> None:
+        """Stores a serialized value in the memory tier, evicting the least recently used one."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Looks a result up, first in memory then on disk.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Any]: Fresh copy of the cached result, or None on a miss.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return _decode(json.loads(self._memory[key]))
+
+            connection = self._disk()
+            if connection is not None:
+                row = connection.execute(
+                    "SELECT value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return _decode(json.loads(row[0]))
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a result in memory and, if configured, on disk.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Result, see ``_encode`` for the supported types.
+        """
+        serialized = json.dumps(_encode(value))
+        with self._lock:
+            self._remember(key, serialized)
+            connection = self._disk()
+            if connection is not None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, serialized),
+                )
+                connection.commit()
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Empties the memory tier and resets the statistics.
+
+        Args:
+            disk (bool, optional): If True, also empties the on-disk tier. Defaults to False.
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = 0
+            connection = self._disk()
+            if disk and connection is not None:
+                connection.execute("DELETE FROM results")
+                connection.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss statistics of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits (all tiers), disk hits, misses, hit rate and memory size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_size": len(self._memory),
+        }
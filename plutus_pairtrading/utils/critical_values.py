@@ -0,0 +1,334 @@
+"""
+This module provides the p-values and critical values of the Dickey-Fuller,
+Engle-Granger and Phillips-Ouliaris Zt statistics, and the critical values of the
+Johansen statistics, as lookup tables built once and reused by every test.
+
+The response surfaces are evaluated once on a dense grid of statistics per
+(test, trend, number of regressors), so the p-values of a whole batch come from
+one vectorized interpolation instead of a normal CDF per statistic. Critical
+values depend on the sample size as well and are memoized per (test, trend,
+nobs, number of regressors).
+
+Functions:
+    - _mackinnon_pvalues: Exact MacKinnon response-surface p-values.
+    - _pvalue_table: Grid of statistics and p-values of a test.
+    - _table_pvalues: Interpolated p-values of many statistics.
+    - _critical_statistic: Statistic whose p-value equals a significance level.
+    - _rejections: Rejections decided against the critical statistic.
+    - _critical_values: Finite-sample critical values at 1%, 5% and 10%.
+    - _johansen_critical_values: Johansen critical values at a significance level.
+"""
+
+import logging
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from arch.unitroot.critical_values import (
+    dickey_fuller,
+    engle_granger,
+    phillips_ouliaris,
+)
+from scipy import optimize, stats
+from statsmodels.tsa.coint_tables import c_sja, c_sjt
+
+logger = logging.getLogger(__name__)
+
+# Spacing of the statistics grid, keeping interpolated p-values within 1e-6 of the surface
+_GRID_STEP = 1e-3
+
+# Column of each significance level in the statsmodels Johansen tables
+_JOHANSEN_COLUMNS = {0.1: 0, 0.05: 1, 0.01: 2}
+
+
+def _surface(test: str, trend: str, num_x: int) -> Tuple[np.ndarray, ...]:
+    """
+    Response-surface parameters of a test.
+
+    Args:
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        num_x (int): Number of cross-sectional regressors (residual-based tests only).
+
+    Returns:
+        Tuple[np.ndarray, ...]: Small-p and large-p polynomial coefficients in increasing
+            order, switch point, smallest and largest statistics of the surface.
+
+    Raises:
+        ValueError: If the test is not supported.
+    """
+    if test == "dickey-fuller":
+        return (
+            dickey_fuller.tau_small_p[trend][0],
+            dickey_fuller.tau_large_p[trend][0],
+            dickey_fuller.tau_star[trend][0],
+            dickey_fuller.tau_min[trend][0],
+            dickey_fuller.tau_max[trend][0],
+        )
+    if test == "engle-granger":
+        key = (trend, num_x)
+        return (
+            engle_granger.SMALL_PARAMETERS[key],
+            engle_granger.LARGE_PARAMETERS[key],
+            engle_granger.TAU_STAR[key],
+            engle_granger.TAU_MIN[key],
+            engle_granger.TAU_MAX[key],
+        )
+    if test == "phillips-ouliaris":
+        # Zt statistic, with the number of stochastic trends of the system under the null
+        key = ("Zt", trend, num_x + 1)
+        return (
+            phillips_ouliaris.PVAL_SMALL_P[key],
+            phillips_ouliaris.PVAL_LARGE_P[key],
+            phillips_ouliaris.PVAL_TAU_STAR[key],
+            phillips_ouliaris.PVAL_TAU_MIN[key],
+            phillips_ouliaris.PVAL_TAU_MAX[key],
+        )
+    raise ValueError(
+        "Invalid test. Options are: 'dickey-fuller', 'engle-granger', 'phillips-ouliaris'."
+    )
+
+
+def _mackinnon_pvalues(
+    statistics: np.ndarray, test: str, trend: str, num_x: int = 1
+) -> np.ndarray:
+    """
+    Vectorized MacKinnon response-surface p-values, as in arch's ``mackinnonp``.
+
+    Args:
+        statistics (np.ndarray): Test statistics.
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        np.ndarray: Asymptotic p-values.
+    """
+    small, large, star, low, high = _surface(test, trend, num_x)
+    statistics = np.asarray(statistics, dtype=float)
+    pvalues = stats.norm.cdf(
+        np.where(
+            statistics <= star,
+            np.polynomial.polynomial.polyval(statistics, small),
+            np.polynomial.polynomial.polyval(statistics, large),
+        )
+    )
+    pvalues[statistics > high] = 1.0
+    pvalues[statistics < low] = 0.0
+    return pvalues
+
+
+@lru_cache(maxsize=None)
+def _pvalue_table(
+    test: str, trend: str, num_x: int = 1
+) -> Tuple[float, float, np.ndarray]:
+    """
+    Response surface of a test evaluated on a uniform grid of statistics.
+
+    Both polynomials of the surface are tabulated over the whole grid, so interpolation never
+    straddles the jump at the switch point.
+
+    Args:
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        Tuple[float, float, np.ndarray]: First statistic and spacing of the grid, and the
+            2 x G p-values of the small-p (row 0) and large-p (row 1) polynomials.
+    """
+    small, large, _, low, high = _surface(test, trend, num_x)
+    # The surface without deterministic terms has no upper bound, but is 1 well before 10
+    high = min(high, 10.0)
+    size = int(np.ceil((high - low) / _GRID_STEP)) + 1
+    grid = np.linspace(low, high, size)
+    table = stats.norm.cdf(
+        np.stack(
+            [
+                np.polynomial.polynomial.polyval(grid, small),
+                np.polynomial.polynomial.polyval(grid, large),
+            ]
+        )
+    )
+    table.setflags(write=False)
+    return low, (high - low) / (size - 1), table
+
+
+def _table_pvalues(
+    statistics: np.ndarray, test: str, trend: str, num_x: int = 1
+) -> np.ndarray:
+    """
+    p-values of many statistics, interpolated in the precomputed table of the test.
+
+    The grid is uniform, so each statistic finds its cell by arithmetic instead of a search.
+
+    Args:
+        statistics (np.ndarray): Test statistics.
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        np.ndarray: Asymptotic p-values, within 1e-6 of the response surface (NaN for
+            missing statistics).
+    """
+    _, _, star, low, high = _surface(test, trend, num_x)
+    first, step, table = _pvalue_table(test, trend, num_x)
+    statistics = np.asarray(statistics, dtype=float)
+    missing = np.isnan(statistics)
+    position = (
+        np.clip(np.where(missing, first, statistics), first, min(high, 10.0)) - first
+    ) / step
+    index = np.minimum(position.astype(np.intp), table.shape[1] - 2)
+    branch = (statistics > star).astype(np.intp)
+    lower, upper = table[branch, index], table[branch, index + 1]
+    pvalues = lower + (upper - lower) * (position - index)
+    pvalues[statistics > high] = 1.0
+    pvalues[statistics < low] = 0.0
+    pvalues[missing] = np.nan
+    return pvalues
+
+
+@lru_cache(maxsize=None)
+def _critical_statistic(
+    test: str, trend: str, significance_level: float, num_x: int = 1
+) -> Optional[float]:
+    """
+    Statistic whose MacKinnon p-value equals the significance level.
+
+    The response surface is increasing on both sides of its switch point, so when the
+    p-values at the switch point exceed the significance level, a p-value is below the
+    significance level exactly when the statistic is below this critical statistic.
+    Comparing statistics to it keeps decisions identical to arch's exact p-values.
+
+    Args:
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        significance_level (float): Significance level of the test.
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        Optional[float]: Critical statistic, or None if the significance level is too large
+            for the comparison to be exact.
+    """
+    small, _, star, low, _ = _surface(test, trend, num_x)
+    at_switch = _mackinnon_pvalues(np.array([star]), test, trend, num_x)[0]
+    if min(
+        at_switch, stats.norm.cdf(np.polynomial.polynomial.polyval(star, small))
+    ) <= (significance_level):
+        return None
+    return optimize.brentq(
+        lambda statistic: stats.norm.cdf(
+            np.polynomial.polynomial.polyval(statistic, small)
+        )
+        - significance_level,
+        low,
+        star,
+        xtol=1e-12,
+    )
+
+
+def _rejections(
+    statistics: np.ndarray,
+    pvalues: np.ndarray,
+    test: str,
+    trend: str,
+    significance_level: float,
+    num_x: int = 1,
+) -> np.ndarray:
+    """
+    Rejections of the unit-root null, decided as arch's exact p-values would.
+
+    Statistics are compared to the exact critical statistic when it exists, so the decision
+    never depends on the interpolation of the p-value tables.
+
+    Args:
+        statistics (np.ndarray): Test statistics.
+        pvalues (np.ndarray): Their p-values, used only without a critical statistic.
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        significance_level (float): Significance level of the test.
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        np.ndarray: Boolean rejections.
+    """
+    critical = _critical_statistic(test, trend, significance_level, num_x)
+    if critical is None:
+        return np.asarray(pvalues) < significance_level
+    return np.asarray(statistics) < critical
+
+
+@lru_cache(maxsize=None)
+def _critical_values(test: str, trend: str, nobs: int, num_x: int = 1) -> np.ndarray:
+    """
+    Finite-sample critical values of a test at 1%, 5% and 10%.
+
+    They are evaluated from the response surfaces in the public tables of
+    ``arch.unitroot.critical_values``, as arch's ``mackinnoncrit``, ``engle_granger_cv`` and
+    ``phillips_ouliaris_cv`` do.
+
+    Args:
+        test (str): "dickey-fuller", "engle-granger" or "phillips-ouliaris".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        nobs (int): Number of observations of the test regression.
+        num_x (int, optional): Number of cross-sectional regressors. Defaults to 1.
+
+    Returns:
+        np.ndarray: Critical values at 1%, 5% and 10%.
+
+    Raises:
+        ValueError: If the test is not supported.
+    """
+    # Each critical value is a polynomial in 1 / nobs
+    powers = 1.0 / float(nobs) ** np.arange(4.0)
+    if test == "dickey-fuller":
+        coefficients = np.asarray(dickey_fuller.tau_2010[trend][0])
+    elif test == "engle-granger":
+        table = engle_granger.CV_PARAMETERS[trend]
+        coefficients = np.array([table[size][num_x] for size in (1, 5, 10)])
+    elif test == "phillips-ouliaris":
+        table = phillips_ouliaris.CV_PARAMETERS[("Zt", trend, num_x + 1)]
+        coefficients = np.array([table[size] for size in (1, 5, 10)])
+    else:
+        raise ValueError(
+            "Invalid test. Options are: 'dickey-fuller', 'engle-granger', 'phillips-ouliaris'."
+        )
+    critical_values = np.asarray(coefficients, dtype=float) @ powers
+    critical_values.setflags(write=False)
+    return critical_values
+
+
+@lru_cache(maxsize=None)
+def _johansen_critical_values(
+    num_securities: int, det_order: int, statistic: str, significance_level: float
+) -> np.ndarray:
+    """
+    Critical values of the Johansen statistics of every null rank.
+
+    Args:
+        num_securities (int): Number of securities of the basket.
+        det_order (int): Deterministic order (-1, 0 or 1).
+        statistic (str): "trace" or "eigenvalue".
+        significance_level (float): Significance level, one of 0.1, 0.05 or 0.01.
+
+    Returns:
+        np.ndarray: Critical values of the null hypotheses r <= 0, ..., r <= k - 1.
+
+    Raises:
+        ValueError: If the significance level is not tabulated.
+    """
+    column = _JOHANSEN_COLUMNS.get(significance_level)
+    if column is None:
+        raise ValueError("Significance level must be one of 0.1, 0.05, or 0.01.")
+    table = c_sjt if statistic == "trace" else c_sja
+    critical_values = np.array(
+        [
+            table(num_securities - rank, det_order)[column]
+            for rank in range(num_securities)
+        ]
+    )
+    critical_values.setflags(write=False)
+    return critical_values
@@ -0,0 +1,38 @@
+"""
+This module provides the checks of the optional dependencies of the package.
+
+The Parquet and Feather (Arrow IPC) formats need pyarrow, which is installed with the
+``parquet`` extra (``pip install plutus-pairtrading[parquet]``).
+
+Functions:
+    - _require_pyarrow: Imports pyarrow, or raises an ImportError naming the extra.
+"""
+
+import logging
+
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+
+def _require_pyarrow(feature: str) -> ModuleType:
+    """
+    Imports pyarrow, which the Parquet and Feather formats need.
+
+    Args:
+        feature (str): Feature needing pyarrow, named in the error message.
+
+    Returns:
+        ModuleType: The pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires pyarrow. Install it with "
+            "`pip install plutus-pairtrading[parquet]` or `pip install pyarrow`."
+        ) from e
+    return pyarrow
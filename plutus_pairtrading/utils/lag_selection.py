@@ -0,0 +1,78 @@
+"""
+This module provides the lag-length search shared by the batched Dickey-Fuller
+regressions of the stationarity and cointegration tests.
+
+Candidate models add lagged differences one column at a time, so they are the
+leading blocks of the largest model. A single Cholesky factorization of the
+largest model's cross-products gives the residual variance of every nested
+model, instead of refitting each candidate lag length from scratch.
+
+Functions:
+    - _nested_residual_variances: Residual variances of all nested least-squares models.
+    - _select_lags: Lag length minimizing an information criterion.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _nested_residual_variances(
+    xpx: np.ndarray, xpy: np.ndarray, ypy: np.ndarray, nobs: int, first: int
+) -> np.ndarray:
+    """
+    Residual variances of the least-squares models using the leading columns of a design.
+
+    With X'X = LL', the fitted sum of squares of the model using the first k columns is the
+    sum of the first k squared entries of L^-1 X'y, so one factorization serves every model.
+
+    Args:
+        xpx (np.ndarray): B x K x K cross-products of the largest design.
+        xpy (np.ndarray): B x K cross-products of the design and the dependent variable.
+        ypy (np.ndarray): B sums of squares of the dependent variable.
+        nobs (int): Number of observations of the regressions.
+        first (int): Number of columns of the smallest model.
+
+    Returns:
+        np.ndarray: B x (K - first + 1) maximum-likelihood residual variances, the smallest
+            model first.
+    """
+    factor = np.linalg.cholesky(xpx)
+    projections = np.linalg.solve(factor, xpy[..., None])[..., 0]
+    fitted = np.cumsum(projections**2, axis=1)[:, first - 1 :]
+    return (ypy[:, None] - fitted) / nobs
+
+
+def _select_lags(
+    xpx: np.ndarray,
+    xpy: np.ndarray,
+    ypy: np.ndarray,
+    nobs: int,
+    first: int,
+    method: str,
+) -> np.ndarray:
+    """
+    Selects the lag length of many regressions by information criterion, as arch does.
+
+    The design holds ``first`` columns always included (deterministic terms and the lagged
+    level) followed by lagged differences 1, ..., max_lags, all on a common sample.
+
+    Args:
+        xpx (np.ndarray): B x K x K cross-products of the largest design.
+        xpy (np.ndarray): B x K cross-products of the design and the dependent variable.
+        ypy (np.ndarray): B sums of squares of the dependent variable.
+        nobs (int): Number of observations of the regressions.
+        first (int): Number of columns always included.
+        method (str): Information criterion, "aic" or "bic".
+
+    Returns:
+        np.ndarray: Selected lag length of every regression.
+    """
+    sigma2 = _nested_residual_variances(xpx, xpy, ypy, nobs, first)
+    max_lags = sigma2.shape[1] - 1
+    llf = -nobs / 2.0 * (np.log(2 * np.pi) + np.log(sigma2) + 1)
+    penalty = 2.0 if method == "aic" else np.log(nobs)
+    crit = -2 * llf + penalty * np.arange(max_lags + 1.0)
+    return np.argmin(crit, axis=1)
@@ -0,0 +1,161 @@
+"""
+This module provides the multiple-testing corrections of the pairs screening.
+
+Offline, the Benjamini-Hochberg (false discovery rate) and Holm (family-wise error
+rate) adjusted p-values of a screening come from one sort of its p-values. Adjusted
+p-values are never below the raw ones, so only the p-values below the significance
+level and the total number of tests are needed to decide every pair exactly.
+
+Online, the tests are decided one by one in screening order, without holding the
+other results: LOND (Javanmard and Montanari, 2018) controls the false discovery rate
+and alpha-spending the family-wise error rate. Both spend the significance level along
+the sequence gamma_j proportional to log(max(j, 2)) / (j * exp(sqrt(log(j)))).
+
+Classes and Functions:
+    - _validate_multiple_testing: Converts the multiple-testing option.
+    - _adjust_pvalues: Benjamini-Hochberg or Holm adjusted p-values.
+    - _OnlineTesting: Test levels of an online procedure, updated test by test.
+"""
+
+import logging
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MULTIPLE_TESTING_METHODS = {
+    "benjamini-hochberg": "benjamini-hochberg",
+    "bh": "benjamini-hochberg",
+    "holm": "holm",
+}
+
+# Constant of the gamma sequence used by Javanmard and Montanari (2018). The sequence then
+# sums to about 0.976 rather than one (the exact normalizer is about 0.0791), which keeps
+# the online procedures valid, only slightly conservative
+_GAMMA_CONSTANT = 0.07720838
+
+
+def _validate_multiple_testing(method: Optional[str]) -> Optional[str]:
+    """
+    Converts the multiple-testing option.
+
+    Args:
+        method (Optional[str]): "benjamini-hochberg" (or "bh"), "holm", or None.
+
+    Returns:
+        Optional[str]: "benjamini-hochberg", "holm", or None.
+
+    Raises:
+        ValueError: If the method is not supported.
+    """
+    if method is None:
+        return None
+    converted = MULTIPLE_TESTING_METHODS.get(method.lower())
+    if converted is None:
+        raise ValueError(
+            "Invalid multiple testing method. Options are: 'benjamini-hochberg', 'holm'."
+        )
+    return converted
+
+
+def _adjust_pvalues(pvalues: np.ndarray, num_tests: int, method: str) -> np.ndarray:
+    """
+    Benjamini-Hochberg or Holm adjusted p-values of a family of tests.
+
+    The p-values given must include every p-value of the family below the significance
+    level; the others only count in ``num_tests``. The adjusted p-values below the
+    significance level are then exact.
+
+    Args:
+        pvalues (np.ndarray): p-values, NaN for tests without a p-value.
+        num_tests (int): Number of tests of the family, at least the number of p-values.
+        method (str): "benjamini-hochberg" or "holm".
+
+    Returns:
+        np.ndarray: Adjusted p-values, capped at 1 (NaN where the p-value is NaN).
+    """
+    pvalues = np.asarray(pvalues, dtype=float)
+    adjusted = np.full(pvalues.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(pvalues))
+    order = valid[np.argsort(pvalues[valid], kind="stable")]
+    ranks = np.arange(1, len(order) + 1)
+
+    if method == "benjamini-hochberg":
+        scaled = pvalues[order] * num_tests / ranks
+        scaled = np.minimum.accumulate(scaled[::-1])[::-1]
+    else:
+        scaled = np.maximum.accumulate(pvalues[order] * (num_tests - ranks + 1))
+    adjusted[order] = np.minimum(scaled, 1.0)
+    return adjusted
+
+
+class _OnlineTesting:
+    """
+    Test levels of an online multiple-testing procedure.
+
+    With "benjamini-hochberg", the j-th test is run at the LOND level
+    significance_level * gamma_j * (discoveries + 1), capped at the significance level,
+    which controls the false discovery rate. With "holm", it is run at the alpha-spending
+    level significance_level * gamma_j, which controls the family-wise error rate.
+
+    Args:
+        method (str): "benjamini-hochberg" or "holm".
+        significance_level (float): Target error rate.
+        tests (int, optional): Number of tests already decided. Defaults to 0.
+        discoveries (int, optional): Number of rejections among them. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        significance_level: float,
+        tests: int = 0,
+        discoveries: int = 0,
+    ) -> None:
+        self.method = method
+        self.significance_level = significance_level
+        self.tests = tests
+        self.discoveries = discoveries
+
+    def level(self) -> float:
+        """
+        Significance level of the next test.
+
+        Returns:
+            float: Level the next p-value is compared to.
+        """
+        j = self.tests + 1
+        gamma = _GAMMA_CONSTANT * np.log(max(j, 2)) / (j * np.exp(np.sqrt(np.log(j))))
+        if self.method == "holm":
+            return self.significance_level * gamma
+        return min(
+            self.significance_level,
+            self.significance_level * gamma * (self.discoveries + 1),
+        )
+
+    def test(self, pvalue: float) -> Tuple[bool, float]:
+        """
+        Decides the next test.
+
+        Args:
+            pvalue (float): p-value of the test (NaN is never rejected).
+
+        Returns:
+            Tuple[bool, float]: Rejection, and the level the p-value was compared to.
+        """
+        level = self.level()
+        rejected = bool(pvalue <= level)
+        self.tests += 1
+        self.discoveries += rejected
+        return rejected, level
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Returns the counters needed to resume the procedure.
+
+        Returns:
+            Dict[str, Any]: Numbers of tests and discoveries.
+        """
+        return {"tests": self.tests, "discoveries": self.discoveries}
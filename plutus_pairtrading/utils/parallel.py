@@ -0,0 +1,269 @@
+"""
+This module provides the process-pool plumbing used to spread screening work
+across CPU cores.
+
+The price matrix is copied once into a shared memory block; every worker
+attaches to that block when it starts, so tasks only carry the (small) list of
+securities they have to test instead of a pickled DataFrame. Module-level settings
+registered with ``_register_worker_state`` (e.g. result stores) are restored in
+every worker as well, whatever the start method of the pool.
+
+Functions:
+    - _resolve_n_jobs: Translates an ``n_jobs`` argument into a worker count.
+    - _chunked: Splits a sequence into ordered chunks.
+    - _register_worker_state: Registers module settings restored in every worker.
+    - _share_dataframe: Copies a DataFrame into shared memory.
+    - _attach_dataframe: Worker initializer rebuilding the DataFrame from shared memory.
+    - _shared_dataframe: Returns the DataFrame attached in the current worker.
+    - _parallel_imap: Lazily maps a chunk function over a process pool, chunk by chunk.
+    - _parallel_map: Maps a chunk function over a process pool sharing one DataFrame.
+"""
+
+import os
+import sys
+import logging
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Shared memory handle and DataFrame view of the current worker process
+_WORKER_SHM: Optional[SharedMemory] = None
+_WORKER_FRAME: Optional[pd.DataFrame] = None
+
+# Functions returning the (restore function, settings) of module state forwarded to workers
+_WORKER_STATES: List[Callable[[], Tuple[Callable[[Any], None], Any]]] = []
+
+
+def _resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Translates an ``n_jobs`` argument into a number of worker processes.
+
+    Args:
+        n_jobs (Optional[int]): Requested number of workers. None or 1 means serial,
+            negative values count back from the number of CPUs (-1 uses all CPUs).
+
+    Returns:
+        int: Number of worker processes, at least 1.
+    """
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _chunked(items: Sequence[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Splits a sequence into consecutive chunks, preserving order.
+
+    Args:
+        items (Sequence[Any]): Items to split.
+        chunk_size (int): Maximum number of items per chunk.
+
+    Yields:
+        List[Any]: Consecutive chunks of ``items``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    for start in range(0, len(items), chunk_size):
+        yield list(items[start : start + chunk_size])
+
+
+def _register_worker_state(
+    export: Callable[[], Tuple[Callable[[Any], None], Any]],
+) -> None:
+    """
+    Registers module settings to restore in every worker of the process pools.
+
+    Workers started with ``spawn`` (the default on macOS and Windows) do not inherit module
+    globals, so ``export`` is called in the parent when a pool starts and the restore function
+    it returns is called with the settings in each worker. Both must be picklable, e.g.
+    module-level functions and plain values.
+
+    Args:
+        export (Callable[[], Tuple[Callable[[Any], None], Any]]): Function returning the restore
+            function and the current settings.
+    """
+    _WORKER_STATES.append(export)
+
+
+def _share_dataframe(data: pd.DataFrame) -> Tuple[SharedMemory, tuple]:
+    """
+    Copies the values of a numeric DataFrame into a shared memory block.
+
+    Args:
+        data (pd.DataFrame): Numeric DataFrame to share.
+
+    Returns:
+        Tuple[SharedMemory, tuple]: The shared memory block (owned by the caller, which must
+            close and unlink it) and the spec needed by ``_attach_dataframe``.
+    """
+    values = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+    shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+    spec = (shm.name, values.shape, values.dtype.str, data.index, data.columns)
+    return shm, spec
+
+
+def _attach_dataframe(
+    spec: tuple, states: Sequence[Tuple[Callable[[Any], None], Any]] = ()
+) -> None:
+    """
+    Worker initializer attaching to the shared price matrix and restoring the registered
+    module settings.
+
+    Args:
+        spec (tuple): Spec returned by ``_share_dataframe``.
+        states (Sequence[Tuple[Callable[[Any], None], Any]], optional): Restore functions and
+            settings of the registered module state. Defaults to ().
+    """
+    global _WORKER_SHM, _WORKER_FRAME
+
+    name, shape, dtype, index, columns = spec
+    if sys.version_info >= (3, 13):
+        shm = SharedMemory(name=name, track=False)
+    else:
+        # Pool workers share the parent's resource tracker, which already tracks the block
+        shm = SharedMemory(name=name)
+
+    values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    _WORKER_SHM = shm
+    _WORKER_FRAME = pd.DataFrame(values, index=index, columns=columns, copy=False)
+    for restore, settings in states:
+        restore(settings)
+
+
+def _shared_dataframe() -> pd.DataFrame:
+    """
+    Returns the DataFrame attached by ``_attach_dataframe`` in the current worker.
+
+    Returns:
+        pd.DataFrame: Shared price matrix.
+    """
+    if _WORKER_FRAME is None:
+        raise RuntimeError("No shared DataFrame attached to this process.")
+    return _WORKER_FRAME
+
+
+def _parallel_imap(
+    func: Callable[..., List[Any]],
+    data: pd.DataFrame,
+    items: Sequence[Any],
+    n_jobs: int,
+    chunk_size: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Tuple[List[Any], List[Any]]]:
+    """
+    Lazily maps a chunk function over ``items`` with a process pool sharing ``data``.
+
+    Chunks are yielded in the order of ``items`` as soon as they are done. At most two
+    chunks per worker are in flight, so memory stays bounded however long ``items`` is.
+
+    Args:
+        func (Callable[..., List[Any]]): Module-level function processing a chunk of items.
+        data (pd.DataFrame): Numeric DataFrame shared with the workers.
+        items (Sequence[Any]): Items to process.
+        n_jobs (int): Number of worker processes, see ``_resolve_n_jobs``.
+        chunk_size (Optional[int], optional): Items per task. Defaults to 1 when serial and to
+            an even split into four tasks per worker, capped at 64 items, otherwise.
+        **kwargs: Extra keyword arguments forwarded to ``func``.
+
+    Yields:
+        Tuple[List[Any], List[Any]]: Items of a chunk and their results.
+    """
+    n_workers = _resolve_n_jobs(n_jobs)
+    if chunk_size is None:
+        chunk_size = (
+            1 if n_workers == 1 else min(64, max(1, -(-len(items) // (n_workers * 4))))
+        )
+
+    if n_workers == 1 or len(items) <= 1:
+        for chunk in _chunked(items, chunk_size):
+            yield chunk, func(data, chunk, **kwargs)
+        return
+
+    states = [export() for export in _WORKER_STATES]
+    shm, spec = _share_dataframe(data)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_attach_dataframe,
+            initargs=(spec, states),
+        ) as executor:
+            pending = deque()
+            for chunk in _chunked(items, chunk_size):
+                pending.append(
+                    (chunk, executor.submit(_run_shared_chunk, func, chunk, kwargs))
+                )
+                if len(pending) >= 2 * n_workers:
+                    chunk, future = pending.popleft()
+                    yield chunk, future.result()
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _parallel_map(
+    func: Callable[..., List[Any]],
+    data: pd.DataFrame,
+    items: Sequence[Any],
+    n_jobs: int,
+    chunk_size: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    Maps a chunk function over ``items`` with a process pool sharing ``data``.
+
+    ``func`` is called as ``func(data, chunk, **kwargs)`` and must return a list. The
+    chunk results are concatenated in the order of ``items``, so the outcome is identical
+    to ``func(data, items, **kwargs)``.
+
+    Args:
+        func (Callable[..., List[Any]]): Module-level function processing a chunk of items.
+        data (pd.DataFrame): Numeric DataFrame shared with the workers.
+        items (Sequence[Any]): Items to process.
+        n_jobs (int): Number of worker processes, see ``_resolve_n_jobs``.
+        chunk_size (Optional[int], optional): Items per task. Defaults to the parallel default of
+            ``_parallel_imap``.
+        **kwargs: Extra keyword arguments forwarded to ``func``.
+
+    Returns:
+        List[Any]: Flattened results, in the order of ``items``.
+    """
+    n_workers = _resolve_n_jobs(n_jobs)
+    if n_workers == 1 or len(items) <= 1:
+        return func(data, list(items), **kwargs)
+
+    results = []
+    for _, chunk_results in _parallel_imap(
+        func, data, items, n_jobs, chunk_size, **kwargs
+    ):
+        results.extend(chunk_results)
+    return results
+
+
+def _run_shared_chunk(
+    func: Callable[..., List[Any]], chunk: List[Any], kwargs: dict
+) -> List[Any]:
+    """
+    Runs ``func`` on one chunk against the worker's shared DataFrame.
+
+    Args:
+        func (Callable[..., List[Any]]): Chunk function.
+        chunk (List[Any]): Items of the chunk.
+        kwargs (dict): Keyword arguments forwarded to ``func``.
+
+    Returns:
+        List[Any]: Results for the chunk.
+    """
+    return func(_shared_dataframe(), chunk, **kwargs)
@@ -0,0 +1,155 @@
+"""
+This module provides the package-level floating-point precision of the screening
+computations.
+
+In "float32" mode the correlation matrices, the batched hedge regressions and the
+batched residual statistics run their large products in single precision, which halves
+their memory and roughly doubles BLAS throughput. The small per-series solves stay in
+double precision, and every decision that lands close to its threshold is re-verified
+in float64, so the pairs passing a screen are the same as in "float64" mode. The
+precision also applies in the worker processes of parallel screenings.
+
+Functions:
+    - set_precision: Sets the precision of the screening computations.
+    - get_precision: Returns the precision of the screening computations.
+    - compute_precision: Context manager setting the precision temporarily.
+    - _compute_dtype: NumPy dtype of the current precision.
+    - _near_threshold: Statistics whose decision could flip within the reverification margin.
+"""
+
+import logging
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Tuple
+
+import numpy as np
+
+from .critical_values import _rejections, _table_pvalues
+from .parallel import _register_worker_state
+
+logger = logging.getLogger(__name__)
+
+_PRECISIONS = {"float64": np.float64, "float32": np.float32}
+
+# Precision of the screening computations
+_PRECISION = "float64"
+
+# Float32 statistics closer than this to their critical value are recomputed in float64
+_STATISTIC_MARGIN = 0.05
+
+# Float32 correlations closer than this to their threshold are recomputed in float64
+_CORRELATION_MARGIN = 1e-3
+
+
+def set_precision(precision: str = "float64") -> None:
+    """
+    Sets the floating-point precision of the screening computations.
+
+    The precision applies to the correlation matrices, ``batch_engle_granger_cointegration_test``,
+    ``batch_augmented_dickey_fuller_test`` and ``batch_philips_perron_test``. The single-pair
+    tests always run in float64.
+
+    Args:
+        precision (str, optional): "float64" or "float32". Defaults to "float64".
+
+    Raises:
+        ValueError: If the precision is not supported.
+    """
+    global _PRECISION
+    if precision not in _PRECISIONS:
+        raise ValueError("Invalid precision. Options are: 'float64', 'float32'.")
+    _PRECISION = precision
+    logger.info(f"Screening precision set to {precision}.")
+
+
+def get_precision() -> str:
+    """
+    Returns the floating-point precision of the screening computations.
+
+    Returns:
+        str: "float64" or "float32".
+    """
+    return _PRECISION
+
+
+@contextmanager
+def compute_precision(precision: str) -> Iterator[None]:
+    """
+    Sets the precision of the screening computations within a ``with`` block.
+
+    Args:
+        precision (str): "float64" or "float32".
+
+    Yields:
+        None
+    """
+    previous = _PRECISION
+    set_precision(precision)
+    try:
+        yield
+    finally:
+        set_precision(previous)
+
+
+def _restore_precision(precision: str) -> None:
+    """
+    Restores the precision in a worker process, without logging it again.
+
+    Args:
+        precision (str): "float64" or "float32".
+    """
+    global _PRECISION
+    _PRECISION = precision
+
+
+def _precision_settings() -> Tuple[Callable[[Any], None], Any]:
+    """
+    Returns the restore function and the current precision for the workers.
+
+    Returns:
+        Tuple[Callable[[Any], None], Any]: ``_restore_precision`` and the precision.
+    """
+    return _restore_precision, _PRECISION
+
+
+_register_worker_state(_precision_settings)
+
+
+def _compute_dtype() -> type:
+    """
+    NumPy dtype of the current precision.
+
+    Returns:
+        type: np.float64 or np.float32.
+    """
+    return _PRECISIONS[_PRECISION]
+
+
+def _near_threshold(
+    statistics: np.ndarray, test: str, trend: str, significance_level: float
+) -> np.ndarray:
+    """
+    Flags the statistics whose decision could change within the reverification margin.
+
+    A statistic is flagged when moving it by ``_STATISTIC_MARGIN`` in either direction changes
+    its rejection, so the check holds whether or not the test has a critical statistic.
+    Nothing is flagged in float64 mode.
+
+    Args:
+        statistics (np.ndarray): Test statistics.
+        test (str): "dickey-fuller" or "engle-granger".
+        trend (str): Converted trend option ("n", "c" or "ct").
+        significance_level (float): Significance level of the test.
+
+    Returns:
+        np.ndarray: Boolean mask of the statistics to recompute in float64.
+    """
+    statistics = np.asarray(statistics, dtype=float)
+    if _PRECISION == "float64":
+        return np.zeros(statistics.shape, dtype=bool)
+    lower, upper = statistics - _STATISTIC_MARGIN, statistics + _STATISTIC_MARGIN
+    return _rejections(
+        lower, _table_pvalues(lower, test, trend), test, trend, significance_level
+    ) != _rejections(
+        upper, _table_pvalues(upper, test, trend), test, trend, significance_level
+    )
@@ -0,0 +1,185 @@
+"""
+This module provides an append-only on-disk table used to stream screening
+results out of long runs, together with the checkpoint needed to resume them.
+
+Rows are appended to a CSV file or to a Parquet dataset (a directory holding one
+part file per flush, which needs the ``parquet`` extra). Values that are not scalars,
+such as cointegrating vectors, are stored as JSON text and come back with their
+original type.
+
+Classes:
+    - ResultSink: Append-only CSV/Parquet table with an atomic JSON checkpoint.
+"""
+
+import os
+import json
+import glob
+import logging
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cache import _encode, _decode
+from .dependencies import _require_pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink:
+    """
+    Append-only table of result rows on disk, with a checkpoint to resume from.
+
+    The checkpoint (``<path>.checkpoint.json``) is replaced atomically after every flush and
+    records the number of rows written, so rows written after the last checkpoint (e.g. by a
+    run interrupted mid-flush) are discarded by ``truncate`` on resume.
+
+    Args:
+        path (str): Path of a ``.csv`` file or of a ``.parquet`` dataset directory.
+
+    Raises:
+        ValueError: If the file format is not supported.
+        ImportError: If a Parquet sink is requested and pyarrow is not installed.
+
+    Example:
+        sink = ResultSink("data/screens/pairs.parquet")
+        sink.append([{"security_a": "AAPL", "security_b": "MSFT"}], state={"tested": 1})
+        sink.read()
+    """
+
+    def __init__(self, path: str) -> None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in (".csv", ".parquet"):
+            raise ValueError(
+                "Unsupported sink format. Options are: '.csv', '.parquet'."
+            )
+        if extension == ".parquet":
+            _require_pyarrow("Parquet sinks")
+        self.path = path
+        self.format = extension[1:]
+        self.checkpoint_path = f"{path}.checkpoint.json"
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads the last checkpoint.
+
+        Returns:
+            Optional[Dict[str, Any]]: Checkpoint with the number of rows written ("rows"), the
+                JSON-encoded columns ("encoded") and the caller's state ("state"), or None.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as file:
+            return json.load(file)
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Replaces the checkpoint atomically."""
+        temporary = f"{self.checkpoint_path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary, self.checkpoint_path)
+
+    def _parts(self) -> List[str]:
+        """Part files of a Parquet dataset, in write order."""
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def clear(self) -> None:
+        """
+        Deletes the stored rows and the checkpoint.
+        """
+        if self.format == "parquet":
+            for part in self._parts():
+                os.remove(part)
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def append(
+        self, rows: List[Dict[str, Any]], state: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Appends rows, then checkpoints the number of rows written and the caller's state.
+
+        Args:
+            rows (List[Dict[str, Any]]): Rows to append, all with the same keys.
+            state (Optional[Dict[str, Any]], optional): JSON-serializable progress of the caller,
+                returned by ``load_checkpoint`` on resume. Defaults to None.
+        """
+        checkpoint = self.load_checkpoint() or {"rows": 0, "encoded": [], "state": {}}
+        if rows:
+            frame = pd.DataFrame(rows)
+            for col in frame.columns:
+                if not frame[col].map(np.isscalar).all():
+                    frame[col] = frame[col].map(lambda v: json.dumps(_encode(v)))
+                    if col not in checkpoint["encoded"]:
+                        checkpoint["encoded"].append(col)
+
+            if self.format == "csv":
+                frame.to_csv(
+                    self.path,
+                    mode="a",
+                    header=not os.path.exists(self.path),
+                    index=False,
+                )
+            else:
+                os.makedirs(self.path, exist_ok=True)
+                part = os.path.join(self.path, f"part-{len(self._parts()):05d}.parquet")
+                frame.to_parquet(part, index=False)
+            checkpoint["rows"] += len(frame)
+
+        checkpoint["state"] = state or {}
+        self._save_checkpoint(checkpoint)
+
+    def _read_raw(self) -> pd.DataFrame:
+        """Reads the stored rows without decoding them."""
+        if self.format == "csv":
+            if not os.path.exists(self.path):
+                return pd.DataFrame()
+            return pd.read_csv(self.path)
+        parts = self._parts()
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+
+    def read(self) -> pd.DataFrame:
+        """
+        Reads the rows covered by the last checkpoint.
+
+        Returns:
+            pd.DataFrame: Stored rows, with JSON-encoded values decoded.
+        """
+        checkpoint = self.load_checkpoint()
+        if checkpoint is None:
+            return pd.DataFrame()
+        frame = self._read_raw().iloc[: checkpoint["rows"]].copy()
+        for col in checkpoint["encoded"]:
+            frame[col] = frame[col].map(lambda v: _decode(json.loads(v)))
+        return frame
+
+    def truncate(self) -> None:
+        """
+        Discards the rows written after the last checkpoint.
+        """
+        checkpoint = self.load_checkpoint()
+        rows = 0 if checkpoint is None else checkpoint["rows"]
+
+        if self.format == "csv":
+            frame = self._read_raw()
+            if len(frame) > rows:
+                logger.info(
+                    "Discarding %d rows past the checkpoint.", len(frame) - rows
+                )
+                frame.iloc[:rows].to_csv(self.path, index=False)
+            return
+
+        seen = 0
+        for part in self._parts():
+            if seen >= rows:
+                os.remove(part)
+                continue
+            frame = pd.read_parquet(part)
+            if seen + len(frame) > rows:
+                frame.iloc[: rows - seen].to_parquet(part, index=False)
+            seen += len(frame)
@@ -0,0 +1,87 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from plutus_pairtrading.utils.cache import (
+    ResultCache,
+    _fingerprint,
+    _make_key,
+    _encode,
+    _decode,
+)
+
+
+def test_fingerprint():
+    """Test content hashing of pandas objects."""
+    series = pd.Series([1.0, 2.0, 3.0], index=pd.date_range("2023-01-01", periods=3))
+    assert _fingerprint(series) == _fingerprint(series.copy())
+    assert _fingerprint(series) != _fingerprint(series * 2)
+    assert _fingerprint(series) != _fingerprint(series.reset_index(drop=True))
+    assert _fingerprint(np.arange(3.0)) != _fingerprint(np.arange(3))
+
+
+def test_make_key():
+    """Test cache keys depend on every part."""
+    assert _make_key("ADF", "abc", 0.05) == _make_key("ADF", "abc", 0.05)
+    assert _make_key("ADF", "abc", 0.05) != _make_key("ADF", "abc", 0.01)
+
+
+def test_encode_decode():
+    """Test results round-trip through their JSON representation."""
+    result = {
+        "Statistic": np.float64(-3.2),
+        "Lags": np.int64(2),
+        "Stationary": np.bool_(True),
+        "Critical Values": {"1%": -3.5, "5%": -2.9},
+        "Vector": pd.Series([1.0, -0.5], index=["X", "Y"], name="vector"),
+        "Spread": pd.Series(
+            [0.1, 0.2], index=pd.date_range("2023-01-01", periods=2), name="spread"
+        ),
+        "Table": pd.DataFrame({"Null": ["r<=0", "r<=1"], "Statistic": [12.0, 1.5]}),
+        "Eigenvectors": np.eye(2),
+    }
+    decoded = _decode(json.loads(json.dumps(_encode(result))))
+    assert decoded["Statistic"] == -3.2
+    assert decoded["Lags"] == 2
+    assert decoded["Stationary"] is True
+    assert decoded["Critical Values"] == {"1%": -3.5, "5%": -2.9}
+    pd.testing.assert_series_equal(decoded["Vector"], result["Vector"])
+    pd.testing.assert_series_equal(
+        decoded["Spread"], result["Spread"], check_freq=False
+    )
+    pd.testing.assert_frame_equal(decoded["Table"], result["Table"])
+    np.testing.assert_array_equal(decoded["Eigenvectors"], result["Eigenvectors"])
+
+
+def test_result_cache_lru():
+    """Test the in-memory LRU tier and statistics."""
+    cache = ResultCache(max_size=2)
+    cache.set("a", {"value": 1})
+    cache.set("b", {"value": 2})
+    assert cache.get("a") == {"value": 1}
+    cache.set("c", {"value": 3})  # evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("c") == {"value": 3}
+    assert cache.stats() == {
+        "hits": 2,
+        "disk_hits": 0,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "memory_size": 2,
+    }
+
+    with pytest.raises(ValueError):
+        ResultCache(max_size=0)
+
+
+def test_result_cache_disk(tmp_path):
+    """Test the on-disk tier."""
+    path = str(tmp_path / "cache" / "results.sqlite")
+    ResultCache(path=path).set("a", {"value": [1.0, 2.0]})
+
+    cache = ResultCache(path=path)
+    assert cache.get("a") == {"value": [1.0, 2.0]}
+    assert cache.stats()["disk_hits"] == 1
+
+    cache.clear(disk=True)
+    assert ResultCache(path=path).get("a") is None
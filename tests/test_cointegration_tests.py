@@ -1,12 +1,29 @@
 import pytest
 import pandas as pd
 import numpy as np
+from arch.unitroot import ADF
+from arch.unitroot.cointegration import engle_granger, phillips_ouliaris
 from plutus_pairtrading.tests.cointegration_tests import (
     engle_granger_cointegration_test,
     phillips_ouliaris_cointegration_test,
     johansen_cointegration_test,
+    batch_engle_granger_cointegration_test,
+    batch_johansen_cointegration_test,
+    gregory_hansen_cointegration_test,
+    hatemi_j_cointegration_test,
+    IncrementalEngleGranger,
+    CointegrationResult,
+    rolling_cointegration,
+    enable_cointegration_store,
+    disable_cointegration_store,
+    cointegration_store_info,
     validate_trend,
 )
+from plutus_pairtrading.tests import cointegration_tests
+from plutus_pairtrading.tests.cointegration_tests import (
+    _hedge_residuals,
+    _phillips_ouliaris_statistics,
+)
 
 
 @pytest.fixture
@@ -61,6 +78,30 @@ def test_engle_granger_cointegration_test(
     assert result["Cointegrated"] is False
 
 
+@pytest.mark.parametrize(
+    "trend", ["no deterministic term", "constant", "constant and time trend"]
+)
+def test_engle_granger_matches_arch(sample_cointegrated_data, trend):
+    """Test the Engle-Granger test agrees with arch's implementation."""
+    result = engle_granger_cointegration_test(
+        sample_cointegrated_data, ["Y", "X"], trend=trend
+    )
+    expected = engle_granger(
+        sample_cointegrated_data["Y"],
+        sample_cointegrated_data["X"],
+        trend=validate_trend(trend),
+    )
+    assert result["Statistic"] == pytest.approx(expected.stat, abs=1e-8)
+    assert result["p-Value"] == pytest.approx(expected.pvalue, abs=1e-6)
+    assert result["Critical Value"] == pytest.approx(expected.critical_values[5])
+    pd.testing.assert_series_equal(
+        result["Cointegrated Vector"], expected.cointegrating_vector, check_names=False
+    )
+    pd.testing.assert_series_equal(
+        result["spread_Y_X"], expected.resid, check_names=False
+    )
+
+
 def test_phillips_ouliaris_cointegration_test(
     sample_cointegrated_data, non_cointegrated_data
 ):
@@ -81,6 +122,68 @@ def test_phillips_ouliaris_cointegration_test(
     assert result["Cointegrated"] is False
 
 
+@pytest.mark.parametrize(
+    "trend", ["no deterministic term", "constant", "constant and time trend"]
+)
+def test_phillips_ouliaris_matches_arch(sample_cointegrated_data, trend):
+    """Test the Phillips-Ouliaris test agrees with arch's implementation."""
+    result = phillips_ouliaris_cointegration_test(
+        sample_cointegrated_data, ["Y", "X"], trend=trend
+    )
+    expected = phillips_ouliaris(
+        sample_cointegrated_data["Y"],
+        sample_cointegrated_data["X"],
+        trend=validate_trend(trend),
+    )
+    assert result["Statistic"] == pytest.approx(expected.stat, abs=1e-8)
+    assert result["p-Value"] == pytest.approx(expected.pvalue, abs=1e-6)
+    assert result["Critical Value"] == pytest.approx(expected.critical_values[5])
+    assert result["Cointegrated"] == (expected.pvalue < 0.05)
+    pd.testing.assert_series_equal(
+        result["Cointegrated Vector"], expected.cointegrating_vector, check_names=False
+    )
+    pd.testing.assert_series_equal(
+        result["spread_Y_X"], expected.resid, check_names=False
+    )
+
+
+@pytest.mark.parametrize("trend", ["n", "c", "ct"])
+def test_phillips_ouliaris_statistics_match_arch(sample_cointegrated_data, trend):
+    """Test the vectorized bootstrap Phillips-Ouliaris statistic agrees with arch."""
+    paths = sample_cointegrated_data[["Y", "X"]].to_numpy()[None]
+    statistic = _phillips_ouliaris_statistics(_hedge_residuals(paths, trend))[0]
+    expected = phillips_ouliaris(
+        sample_cointegrated_data["Y"], sample_cointegrated_data["X"], trend=trend
+    )
+    assert statistic == pytest.approx(expected.stat, abs=1e-10)
+
+
+@pytest.mark.parametrize(
+    "test", [engle_granger_cointegration_test, phillips_ouliaris_cointegration_test]
+)
+def test_bootstrap_pvalues(sample_cointegrated_data, non_cointegrated_data, test):
+    """Test block-bootstrap p-values are reproducible and independent of n_jobs."""
+    result = test(sample_cointegrated_data, ["Y", "X"], bootstrap_replicates=600)
+    asymptotic = test(sample_cointegrated_data, ["Y", "X"])
+    assert result["Asymptotic p-Value"] == asymptotic["p-Value"]
+    assert result["Bootstrap Replicates"] == 600
+    assert result["p-Value"] == pytest.approx(1 / 601)
+    assert result["Cointegrated"] is True
+
+    result = test(non_cointegrated_data, ["Y", "X"], bootstrap_replicates=600)
+    assert result["p-Value"] > 0.05
+    assert result["Cointegrated"] is False
+    assert result["Critical Value"] < result["Statistic"]
+
+    parallel = test(
+        non_cointegrated_data, ["Y", "X"], bootstrap_replicates=600, n_jobs=2
+    )
+    assert parallel["p-Value"] == result["p-Value"]
+    assert parallel["Critical Value"] == pytest.approx(result["Critical Value"])
+    reseeded = test(non_cointegrated_data, ["Y", "X"], bootstrap_replicates=600, seed=1)
+    assert reseeded["p-Value"] != result["p-Value"]
+
+
 def test_johansen_cointegration_test(sample_cointegrated_data, non_cointegrated_data):
     """Test Johansen cointegration test."""
     # Test with cointegrated data
@@ -110,3 +213,328 @@ def test_johansen_cointegration_test(sample_cointegrated_data, non_cointegrated_
         johansen_cointegration_test(
             sample_cointegrated_data, ["X", "Y"], trend="invalid", statistic="trace"
         )
+
+
+def test_batch_engle_granger_cointegration_test(
+    sample_cointegrated_data, non_cointegrated_data
+):
+    """Test batched Engle-Granger agrees with the per-pair test."""
+    data = sample_cointegrated_data.assign(Z=non_cointegrated_data["Y"])
+    result = batch_engle_granger_cointegration_test(
+        data, trend="constant", both_directions=True
+    )
+    assert list(zip(result["security_a"], result["security_b"])) == [
+        ("X", "Y"),
+        ("Y", "X"),
+        ("X", "Z"),
+        ("Z", "X"),
+        ("Y", "Z"),
+        ("Z", "Y"),
+    ]
+
+    for _, row in result.iterrows():
+        expected = engle_granger_cointegration_test(
+            data, [row["security_a"], row["security_b"]], trend="constant"
+        )
+        assert row["Statistic"] == pytest.approx(expected["Statistic"], abs=1e-6)
+        assert row["p-Value"] == pytest.approx(expected["p-Value"], abs=1e-6)
+        assert row["Hedge Ratio"] == pytest.approx(
+            -expected["Cointegrated Vector"].iloc[1], abs=1e-6
+        )
+        assert row["Cointegrated"] == expected["Cointegrated"]
+
+    with pytest.raises(ValueError):
+        batch_engle_granger_cointegration_test(data, selection_criterion="invalid")
+
+
+@pytest.mark.parametrize("trend", ["no deterministic term", "constant and time trend"])
+def test_batch_johansen_cointegration_test(sample_cointegrated_data, trend):
+    """Test batched Johansen agrees with the per-basket test."""
+    rng = np.random.default_rng(3)
+    data = sample_cointegrated_data.assign(
+        Z=np.cumsum(rng.normal(size=100)), W=np.cumsum(rng.normal(size=100))
+    )
+    result = batch_johansen_cointegration_test(
+        data, basket_size=3, trend=trend, num_lag_diff=2, block_size=3
+    )
+    assert result["Baskets"].shape == (4, 3)
+    assert result["Trace Statistics"].shape == (4, 3)
+
+    for i, basket in enumerate(result["Baskets"]):
+        expected = johansen_cointegration_test(
+            data, list(basket), trend=trend, num_lag_diff=2
+        )
+        assert result["Trace Statistics"][i] == pytest.approx(
+            expected["Statistics and Critical Values"]["Statistic"].to_numpy(),
+            abs=1e-6,
+        )
+        assert result["Eigenvalues"][i] == pytest.approx(
+            expected["Eigenvalues"], abs=1e-8
+        )
+        assert result["Cointegrated Vectors"][i] == pytest.approx(
+            expected["Cointegrated Vector"].to_numpy(), abs=1e-6
+        )
+        assert result["#Cointegrated Vectors"][i] == expected["#Cointegrated Vectors"]
+        assert result["Cointegrated"][i] == expected["Cointegrated"]
+
+    # Explicit baskets, tested with the maximum eigenvalue statistic
+    result = batch_johansen_cointegration_test(
+        data, baskets=[["X", "Y"], ["Z", "W"]], statistic="eigenvalue"
+    )
+    assert result["Cointegrated"].tolist() == [True, False]
+
+    with pytest.raises(ValueError, match="same number of securities"):
+        batch_johansen_cointegration_test(data, baskets=[["X", "Y"], ["X", "Y", "Z"]])
+    with pytest.raises(ValueError, match="missing values"):
+        batch_johansen_cointegration_test(data.shift(1), basket_size=2)
+
+
+@pytest.fixture
+def structural_break_data():
+    """Fixture to generate a cointegrated pair whose relation shifts mid-sample."""
+    rng = np.random.default_rng(7)
+    n = 160
+    x = np.cumsum(rng.normal(size=n)) + 50
+    y = 2 + 1.3 * x + rng.normal(0, 0.5, n)
+    y[100:] += 4 - 0.3 * x[100:]
+    return pd.DataFrame({"Y": y, "X": x}, index=pd.date_range("2023-01-01", periods=n))
+
+
+def _break_residuals(data, positions, switched, trend):
+    """Residuals of the cointegrating regression with breaks, fitted directly."""
+    n = len(data)
+    base = [np.ones(n)] + ([np.arange(1.0, n + 1)] if trend == "ct" else [])
+    base.append(data["X"].to_numpy())
+    columns = list(base)
+    for position in positions:
+        regime = np.arange(n) >= position
+        columns += [base[column] * regime for column in switched]
+    design = np.column_stack(columns)
+    coef, *_ = np.linalg.lstsq(design, data["Y"].to_numpy(), rcond=None)
+    return data["Y"].to_numpy() - design @ coef
+
+
+@pytest.mark.parametrize(
+    "model, trend, switched",
+    [
+        ("level shift", "constant", [0]),
+        ("level shift", "constant and time trend", [0]),
+        ("regime shift", "constant", [0, 1]),
+    ],
+)
+def test_gregory_hansen_cointegration_test(
+    structural_break_data, model, trend, switched
+):
+    """Test the Gregory-Hansen break search against regressions fitted at every break date."""
+    data = structural_break_data
+    result = gregory_hansen_cointegration_test(
+        data, ["Y", "X"], trend=trend, model=model
+    )
+
+    trend_code = validate_trend(trend)
+    expected = min(
+        ADF(
+            _break_residuals(data, [position], switched, trend_code),
+            trend="n",
+            method="aic",
+        ).stat
+        for position in range(24, 137)
+    )
+    assert result["Statistic"] == pytest.approx(expected, abs=1e-6)
+    assert result["Cointegrated"]
+    assert result["Break Dates"] == [data.index[result["Break Positions"][0]]]
+    assert result["spread_Y_X"].to_numpy() == pytest.approx(
+        _break_residuals(data, result["Break Positions"], switched, trend_code),
+        abs=1e-8,
+    )
+
+    with pytest.raises(ValueError, match="Invalid model"):
+        gregory_hansen_cointegration_test(
+            data, ["Y", "X"], trend="constant and time trend", model="regime shift"
+        )
+
+
+def test_structural_break_phillips_statistics(structural_break_data):
+    """Test the Zt and Z-alpha statistics of the break search."""
+    data = structural_break_data
+    result = gregory_hansen_cointegration_test(data, ["Y", "X"], statistic="Zt")
+    residuals = _break_residuals(data, result["Break Positions"], [0, 1], "c")
+
+    n = len(residuals) - 1
+    rho = residuals[1:] @ residuals[:-1] / (residuals[:-1] @ residuals[:-1])
+    v = residuals[1:] - rho * residuals[:-1]
+    bandwidth = int(4 * (n / 100) ** (2 / 9))
+    gamma = [v[j:] @ v[: len(v) - j] / n for j in range(bandwidth + 1)]
+    lam = sum((1 - j / (bandwidth + 1)) * gamma[j] for j in range(1, bandwidth + 1))
+    rho_star = (residuals[1:] @ residuals[:-1] - n * lam) / (
+        residuals[:-1] @ residuals[:-1]
+    )
+    zt = (rho_star - 1) * np.sqrt(
+        residuals[:-1] @ residuals[:-1] / (gamma[0] + 2 * lam)
+    )
+    assert result["Statistic"] == pytest.approx(zt, abs=1e-6)
+
+    za = gregory_hansen_cointegration_test(
+        data, ["Y", "X"], statistic="Za", return_spread=False
+    )
+    assert isinstance(za, CointegrationResult)
+    assert za["Critical Value"] == -47.04
+
+
+def test_hatemi_j_cointegration_test(structural_break_data):
+    """Test the Hatemi-J two-break search against a direct fit at the selected breaks."""
+    data = structural_break_data
+    result = hatemi_j_cointegration_test(data, ["Y", "X"], break_step=4, block_size=50)
+    first, second = result["Break Positions"]
+    assert second - first >= 24
+    expected = ADF(
+        _break_residuals(data, [first, second], [0, 1], "c"),
+        trend="n",
+        method="aic",
+    ).stat
+    assert result["Statistic"] == pytest.approx(expected, abs=1e-6)
+    assert result["Critical Value"] == -6.015
+    assert "X_break2" in result["Cointegrated Vector"].index
+
+    with pytest.raises(ValueError, match="constant trend"):
+        hatemi_j_cointegration_test(data, ["Y", "X"], trend="constant and time trend")
+    with pytest.raises(ValueError, match="Significance level"):
+        hatemi_j_cointegration_test(data, ["Y", "X"], significance_level=0.02)
+
+
+def test_lightweight_results(sample_cointegrated_data):
+    """Test results without the spread are lightweight records."""
+    for test in (
+        engle_granger_cointegration_test,
+        phillips_ouliaris_cointegration_test,
+    ):
+        expected = test(sample_cointegrated_data, ["X", "Y"])
+        result = test(sample_cointegrated_data, ["X", "Y"], return_spread=False)
+        assert isinstance(result, CointegrationResult)
+        assert not hasattr(result, "__dict__")
+        assert result.cointegrated == result["Cointegrated"] == expected["Cointegrated"]
+        assert result.statistic == pytest.approx(expected["Statistic"])
+        assert result.to_dict().keys() == expected.keys() - {"spread_X_Y"}
+        with pytest.raises(KeyError):
+            result["spread_X_Y"]
+        # The record reads like the result dict
+        assert "Cointegrated" in result and "spread_X_Y" not in result
+        assert result.get("spread_X_Y") is None
+        assert result.get("Trend") == expected["Trend"]
+        assert list(result) == list(result.to_dict())
+        assert len(result) == len(expected) - 1
+
+    result = johansen_cointegration_test(
+        sample_cointegrated_data, ["X", "Y"], return_spread=False
+    )
+    assert "Spread" not in result
+    assert result["Cointegrated"] == (result["#Cointegrated Vectors"] > 0)
+    assert list(result["Cointegrated Vector"].index) == ["X", "Y"]
+
+
+def test_batch_engle_granger_without_pvalues(
+    sample_cointegrated_data, non_cointegrated_data
+):
+    """Test omitting the p-values leaves the rejections unchanged."""
+    data = sample_cointegrated_data.assign(Z=non_cointegrated_data["Y"])
+    for level in (0.01, 0.05, 0.1):
+        expected = batch_engle_granger_cointegration_test(
+            data, both_directions=True, significance_level=level
+        )
+        result = batch_engle_granger_cointegration_test(
+            data, both_directions=True, significance_level=level, return_pvalues=False
+        )
+        assert "p-Value" not in result.columns
+        pd.testing.assert_frame_equal(result, expected.drop(columns="p-Value"))
+
+
+def test_incremental_engle_granger(sample_cointegrated_data, non_cointegrated_data):
+    """Test incremental screening agrees with a batch screen of the full history."""
+    data = sample_cointegrated_data.assign(Z=non_cointegrated_data["Y"])
+    for trend in ["no deterministic term", "constant", "constant and time trend"]:
+        screener = IncrementalEngleGranger(
+            data.iloc[:60], trend=trend, both_directions=True
+        )
+        for start in range(60, len(data), 10):
+            result = screener.update(data.iloc[start : start + 10])
+        expected = batch_engle_granger_cointegration_test(
+            data, trend=trend, both_directions=True
+        )
+        assert screener.nobs == len(data)
+        # The lag search range grows from 11 to 12 lags along the way
+        assert screener.refits == 1
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-8)
+
+    screener = IncrementalEngleGranger(data.iloc[:60], num_lags=2)
+    result = screener.update(data.iloc[60:])
+    expected = batch_engle_granger_cointegration_test(data, num_lags=2)
+    assert screener.refits == 0
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-8)
+
+    with pytest.raises(ValueError):
+        screener.update(data.iloc[-5:])
+
+
+def test_rolling_cointegration(sample_cointegrated_data):
+    """Test rolling cointegration agrees with the per-window test."""
+    result = rolling_cointegration(
+        sample_cointegrated_data, ["Y", "X"], window=60, step=10
+    )
+    assert list(result.index) == list(sample_cointegrated_data.index[59::10])
+
+    for end, row in result.iterrows():
+        window = sample_cointegrated_data.loc[:end].iloc[-60:]
+        expected = engle_granger_cointegration_test(window, ["Y", "X"])
+        assert row["Statistic"] == pytest.approx(expected["Statistic"], abs=1e-6)
+        assert row["p-Value"] == pytest.approx(expected["p-Value"], abs=1e-6)
+        assert row["Hedge Ratio"] == pytest.approx(
+            -expected["Cointegrated Vector"].iloc[1], abs=1e-6
+        )
+        assert row["Cointegrated"] == expected["Cointegrated"]
+
+    with pytest.raises(ValueError):
+        rolling_cointegration(sample_cointegrated_data, ["Y", "X"], window=200)
+    with pytest.raises(ValueError):
+        rolling_cointegration(sample_cointegrated_data, ["Y"], window=60)
+
+
+def test_cointegration_store(sample_cointegrated_data, tmp_path):
+    """Test cointegration results are memoized in a persistent store."""
+    path = str(tmp_path / "cointegration.sqlite")
+    enable_cointegration_store(path=path)
+    try:
+        for test in (
+            engle_granger_cointegration_test,
+            phillips_ouliaris_cointegration_test,
+        ):
+            expected = test(sample_cointegrated_data, ["X", "Y"])
+            result = test(sample_cointegrated_data, ["X", "Y"])
+            assert result["Statistic"] == pytest.approx(expected["Statistic"])
+            assert result["Cointegrated"] == expected["Cointegrated"]
+            pd.testing.assert_series_equal(
+                result["Cointegrated Vector"], expected["Cointegrated Vector"]
+            )
+            # The spread is not stored but rebuilt from the cointegrating vector
+            np.testing.assert_allclose(result["spread_X_Y"], expected["spread_X_Y"])
+
+        expected = johansen_cointegration_test(sample_cointegrated_data, ["X", "Y"])
+        result = johansen_cointegration_test(sample_cointegrated_data, ["X", "Y"])
+        pd.testing.assert_frame_equal(
+            result["Statistics and Critical Values"],
+            expected["Statistics and Critical Values"],
+        )
+        np.testing.assert_allclose(result["Spread"], expected["Spread"])
+        assert cointegration_store_info()["hits"] == 3
+
+        # Different data is a different entry
+        engle_granger_cointegration_test(sample_cointegrated_data.iloc[1:], ["X", "Y"])
+        assert cointegration_store_info()["misses"] == 4
+
+        # The on-disk tier survives a new store, spreads included on request
+        enable_cointegration_store(path=path, store_spread=True)
+        engle_granger_cointegration_test(sample_cointegrated_data, ["X", "Y"])
+        assert cointegration_store_info()["disk_hits"] == 1
+    finally:
+        disable_cointegration_store()
+    assert cointegration_store_info() == {}
+    assert not cointegration_tests._STORE_SPREAD
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from arch.unitroot._engle_granger import engle_granger_cv, engle_granger_pval
+from arch.unitroot._phillips_ouliaris import (
+    phillips_ouliaris_cv,
+    phillips_ouliaris_pval,
+)
+from arch.unitroot.unitroot import mackinnoncrit, mackinnonp
+from statsmodels.tsa.coint_tables import c_sja, c_sjt
+
+from plutus_pairtrading.utils.critical_values import (
+    _critical_statistic,
+    _critical_values,
+    _johansen_critical_values,
+    _rejections,
+    _table_pvalues,
+)
+
+
+@pytest.mark.parametrize("trend", ["n", "c", "ct"])
+def test_table_pvalues(trend):
+    """Test interpolated p-values stay within 1e-6 of arch's response surfaces."""
+    statistics = np.linspace(-25.0, 12.0, 2001)
+    pvalues = _table_pvalues(statistics, "dickey-fuller", trend)
+    expected = [mackinnonp(statistic, regression=trend) for statistic in statistics]
+    assert pvalues == pytest.approx(expected, abs=1e-6)
+
+    pvalues = _table_pvalues(statistics, "engle-granger", trend)
+    expected = [engle_granger_pval(statistic, trend, 1) for statistic in statistics]
+    assert pvalues == pytest.approx(expected, abs=1e-6)
+
+    pvalues = _table_pvalues(statistics, "phillips-ouliaris", trend)
+    expected = [
+        phillips_ouliaris_pval(statistic, "Zt", trend, 2) for statistic in statistics
+    ]
+    assert pvalues == pytest.approx(expected, abs=1e-6)
+
+    pvalues = _table_pvalues(
+        np.array([np.nan, -np.inf, np.inf]), "engle-granger", trend
+    )
+    assert np.isnan(pvalues[0])
+    assert pvalues[1:].tolist() == [0.0, 1.0]
+
+    with pytest.raises(ValueError, match="Invalid test"):
+        _table_pvalues(statistics, "invalid", trend)
+
+
+@pytest.mark.parametrize("level", [0.01, 0.05, 0.1])
+def test_rejections(level):
+    """Test decisions match the exact p-values, including next to the critical statistic."""
+    critical = _critical_statistic("engle-granger", "c", level)
+    statistics = critical + np.array([-1e-9, 1e-9, -2.0, 2.0])
+    pvalues = _table_pvalues(statistics, "engle-granger", "c")
+    expected = [engle_granger_pval(s, "c", 1) < level for s in statistics]
+    assert _rejections(statistics, pvalues, "engle-granger", "c", level).tolist() == (
+        expected
+    )
+
+
+def test_critical_values():
+    """Test the memoized critical values match arch and statsmodels."""
+    assert _critical_values("dickey-fuller", "c", 250) == pytest.approx(
+        mackinnoncrit(regression="c", nobs=250)
+    )
+    assert _critical_values("engle-granger", "ct", 250) == pytest.approx(
+        engle_granger_cv("ct", 1, 250)[[1, 5, 10]].to_numpy()
+    )
+    assert _critical_values("phillips-ouliaris", "c", 250) == pytest.approx(
+        phillips_ouliaris_cv("Zt", "c", 2, 250)[[1, 5, 10]].to_numpy()
+    )
+    assert _critical_values("dickey-fuller", "c", 250) is _critical_values(
+        "dickey-fuller", "c", 250
+    )
+
+    assert _johansen_critical_values(3, 0, "trace", 0.05) == pytest.approx(
+        [c_sjt(3 - rank, 0)[1] for rank in range(3)]
+    )
+    assert _johansen_critical_values(2, 1, "eigenvalue", 0.01) == pytest.approx(
+        [c_sja(2 - rank, 1)[2] for rank in range(2)]
+    )
+    with pytest.raises(ValueError, match="Significance level"):
+        _johansen_critical_values(2, 0, "trace", 0.02)
@@ -1,5 +1,9 @@
 import os
 import shutil
+import threading
+import time
+from functools import reduce
+import numpy as np
 import pandas as pd
 import pytest
 from plutus_pairtrading.data_acquisitions.data_acquisition import (
@@ -10,7 +14,10 @@ from plutus_pairtrading.data_acquisitions.data_acquisition import (
     combine_dataframes,
     fetch_and_store_tickers,
     read_and_combine_ticker_files,
+    load_data,
+    _RateLimiter,
 )
+from plutus_pairtrading.data_acquisitions.panel_store import PanelStore
 
 TEST_DATA_DIR = "data/unittest"
 
@@ -105,6 +112,65 @@ def test_combine_dataframes(setup_test_env):
     pd.testing.assert_frame_equal(combined, expected)
 
 
+@pytest.mark.parametrize("join_type", ["inner", "outer", "left", "right"])
+def test_combine_dataframes_single_pass(join_type, caplog):
+    """Test the single-pass combination matches successive joins."""
+    rng = np.random.default_rng(11)
+    dates = pd.date_range("2023-01-02", periods=30, freq="B", name="date")
+    dataframes = []
+    for i in range(6):
+        index = dates[np.sort(rng.choice(30, 20 + i, replace=False))]
+        # The first two DataFrames share columns, which get suffixes
+        prefix = "" if i < 2 else f"T{i}_"
+        dataframes.append(
+            pd.DataFrame(
+                {
+                    f"{prefix}close": rng.normal(size=len(index)),
+                    f"{prefix}volume": rng.integers(100, 200, size=len(index)),
+                    f"T{i}_open": rng.normal(size=len(index)),
+                },
+                index=index,
+            )
+        )
+    # Unordered and duplicated indexes
+    dataframes[2] = dataframes[2].iloc[::-1]
+    duplicated = pd.concat([dataframes[3], dataframes[3].iloc[:2]])
+
+    for frames in [dataframes, dataframes[:3] + [duplicated]]:
+        expected = reduce(
+            lambda left, right: left.join(
+                right, how=join_type, lsuffix="_left", rsuffix="_right"
+            ),
+            frames,
+        )
+        with caplog.at_level("INFO"):
+            combined = combine_dataframes(frames, join_type=join_type)
+        pd.testing.assert_frame_equal(combined, expected)
+
+    assert combined.columns[:3].tolist() == ["close_left", "volume_left", "T0_open"]
+    if join_type != "right":
+        assert "Combined 6 DataFrames" in caplog.text
+    with pytest.raises(ValueError, match="no suffix specified"):
+        combine_dataframes(dataframes, suffixes=("", ""))
+
+
+@pytest.mark.parametrize("join_type", ["outer", "left"])
+def test_combine_dataframes_empty(join_type):
+    """Test an empty DataFrame gets NaN columns in the single-pass combination."""
+    dates = pd.date_range("2023-01-02", periods=2, name="date")
+    full = pd.DataFrame({"A_close": [1.0, 2.0], "A_volume": [10, 20]}, index=dates)
+    empty = pd.DataFrame(
+        {"B_close": pd.Series(dtype=float), "B_volume": pd.Series(dtype=int)},
+        index=pd.DatetimeIndex([], name="date"),
+    )
+    for frames in [[full, empty], [full, empty, full.add_prefix("C")]]:
+        expected = reduce(lambda left, right: left.join(right, how=join_type), frames)
+        combined = combine_dataframes(frames, join_type=join_type)
+        pd.testing.assert_frame_equal(combined, expected)
+    assert combined["B_volume"].dtype == np.float64
+    assert combined["B_close"].isna().all()
+
+
 @pytest.mark.skip(
     reason="This test fetches live data; uncomment for integration testing."
 )
@@ -118,6 +184,210 @@ def test_fetch_and_store_tickers(setup_test_env):
     assert isinstance(failed_tickers, list)
 
 
+class FakeYahoo:
+    """Local stand-in for yf.download, with flaky and unknown tickers."""
+
+    def __init__(self, failures=None, latency=0.05, periods=5, adjustments=None):
+        self.dates = pd.date_range("2023-01-02", periods=periods, freq="B", name="Date")
+        self.failures = dict(failures or {})
+        self.adjustments = dict(adjustments or {})
+        self.latency = latency
+        self.calls = []
+        self.starts = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def prices(self, ticker):
+        base = 10.0 * (ord(ticker[0]) - 64)
+        close = (base + np.arange(len(self.dates))) * self.adjustments.get(ticker, 1.0)
+        return pd.DataFrame(
+            {"Close": close, "Open": close - 0.5, "Volume": 1000.0},
+            index=self.dates,
+        )
+
+    def __call__(self, tickers, start, end, progress, group_by, threads, **kwargs):
+        with self.lock:
+            self.calls.append((list(tickers), kwargs.get("timeout")))
+            self.starts.append((list(tickers), start))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+
+        frames = {}
+        for ticker in tickers:
+            if ticker.startswith("BAD"):
+                continue
+            if self.failures.get(ticker, 0):
+                self.failures[ticker] -= 1
+                if self.failures[ticker] >= 1:
+                    raise ConnectionError(f"{ticker} timed out")
+                continue
+            prices = self.prices(ticker)
+            frames[ticker] = prices[(prices.index >= start) & (prices.index < end)]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1).reindex(
+            columns=pd.MultiIndex.from_product([tickers, ["Close", "Open", "Volume"]])
+        )
+
+
+def test_fetch_and_store_tickers_concurrent(tmp_path):
+    """Test concurrent batched downloads keep the serial result and failure contract."""
+    tickers = ["AAA", "BBB", "BAD1", "CCC", "DDD"]
+    fake = FakeYahoo(failures={"CCC": 2})
+    combined, failed = fetch_and_store_tickers(
+        tickers,
+        str(tmp_path),
+        end_date="2023-02-01",
+        max_workers=3,
+        batch_size=2,
+        max_retries=2,
+        backoff=0.0,
+        timeout=5,
+        download=fake,
+    )
+
+    assert failed == ["BAD1"]
+    assert list(combined.columns) == [
+        f"{ticker}_{field}"
+        for ticker in ["AAA", "BBB", "CCC", "DDD"]
+        for field in ["close", "open", "volume"]
+    ]
+    assert combined.index.name == "date"
+    assert combined["CCC_close"].tolist() == [30.0, 31.0, 32.0, 33.0, 34.0]
+    stored = load_csv_data(str(tmp_path / "DDD.csv"))
+    pd.testing.assert_frame_equal(
+        stored, combined[["DDD_close", "DDD_open", "DDD_volume"]], check_freq=False
+    )
+    assert not os.path.exists(tmp_path / "BAD1.csv")
+
+    # Batches run concurrently, and only the missing tickers are retried
+    assert fake.max_active > 1
+    assert sorted(call[0] for call in fake.calls) == sorted(
+        [["AAA", "BBB"], ["BAD1", "CCC"], ["BAD1", "CCC"], ["BAD1", "CCC"]] + [["DDD"]]
+    )
+    assert {call[1] for call in fake.calls} == {5}
+
+    serial, serial_failed = fetch_and_store_tickers(
+        tickers, str(tmp_path), end_date="2023-02-01", download=FakeYahoo()
+    )
+    assert serial_failed == ["BAD1"]
+    pd.testing.assert_frame_equal(serial, combined)
+
+
+@pytest.mark.parametrize("storage_format", ["csv", "parquet"])
+def test_fetch_and_store_tickers_incremental(tmp_path, storage_format):
+    """Test incremental refreshes fetch the missing dates and refetch restated tickers."""
+    if storage_format == "parquet":
+        pytest.importorskip("pyarrow")
+    tickers = ["AAA", "BBB", "CCC"]
+    fetch_and_store_tickers(
+        tickers,
+        str(tmp_path),
+        start_date="2023-01-02",
+        end_date="2023-02-01",
+        download=FakeYahoo(latency=0.0),
+        storage_format=storage_format,
+    )
+
+    # Five more sessions, with BBB's history restated by a split adjustment
+    fake = FakeYahoo(latency=0.0, periods=10, adjustments={"BBB": 0.5})
+    combined, failed = fetch_and_store_tickers(
+        tickers + ["BAD1"],
+        str(tmp_path),
+        start_date="2023-01-02",
+        end_date="2023-02-01",
+        batch_size=4,
+        download=fake,
+        incremental=True,
+        storage_format=storage_format,
+    )
+
+    assert failed == ["BAD1"]
+    assert fake.starts == [
+        (["AAA", "BBB", "CCC"], "2023-01-05"),
+        (["BAD1"], "2023-01-02"),
+        (["BBB"], "2023-01-02"),
+    ]
+    expected, _ = fetch_and_store_tickers(
+        tickers,
+        str(tmp_path / "full"),
+        start_date="2023-01-02",
+        end_date="2023-02-01",
+        download=FakeYahoo(latency=0.0, periods=10, adjustments={"BBB": 0.5}),
+    )
+    pd.testing.assert_frame_equal(combined, expected, check_freq=False)
+    assert combined["BBB_close"].iloc[0] == 10.0
+    pd.testing.assert_frame_equal(
+        load_data(str(tmp_path / f"AAA.{storage_format}")),
+        expected[["AAA_close", "AAA_open", "AAA_volume"]],
+        check_freq=False,
+    )
+    assert sorted(os.listdir(tmp_path)) == [
+        f"{ticker}.{storage_format}" for ticker in tickers
+    ] + ["full"]
+
+
+def test_fetch_and_store_tickers_panel(tmp_path):
+    """Test panel storage refreshes incrementally and matches the per-ticker files."""
+    pytest.importorskip("pyarrow")
+    tickers = ["AAA", "BBB", "CCC"]
+    options = dict(start_date="2023-01-02", end_date="2023-02-01", join_type="outer")
+    fetch_and_store_tickers(
+        tickers, str(tmp_path), download=FakeYahoo(latency=0.0), panel=True, **options
+    )
+
+    fake = FakeYahoo(latency=0.0, periods=10, adjustments={"BBB": 0.5})
+    combined, failed = fetch_and_store_tickers(
+        tickers + ["BAD1"],
+        str(tmp_path),
+        batch_size=4,
+        download=fake,
+        incremental=True,
+        panel=True,
+        **options,
+    )
+
+    assert failed == ["BAD1"]
+    assert fake.starts == [
+        (["AAA", "BBB", "CCC"], "2023-01-05"),
+        (["BAD1"], "2023-01-02"),
+        (["BBB"], "2023-01-02"),
+    ]
+    expected, _ = fetch_and_store_tickers(
+        tickers,
+        str(tmp_path / "files"),
+        download=FakeYahoo(latency=0.0, periods=10, adjustments={"BBB": 0.5}),
+        **options,
+    )
+    pd.testing.assert_frame_equal(combined, expected, check_freq=False)
+    pd.testing.assert_frame_equal(
+        PanelStore(str(tmp_path)).read(["CCC"], fields=["close"]),
+        expected[["CCC_close"]],
+        check_freq=False,
+    )
+
+
+def test_rate_limiter():
+    """Test the rate limiter spaces requests across threads."""
+    limiter = _RateLimiter(50.0)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 5 / 50.0
+
+    unlimited = _RateLimiter(None)
+    start = time.monotonic()
+    unlimited.acquire(1000)
+    assert time.monotonic() - start < 0.05
+
+
 def test_read_and_combine_ticker_files(setup_test_env):
     """Test reading and combining ticker files."""
     _, _, _, test1_df, test2_df, combined_df = setup_test_env
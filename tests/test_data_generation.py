@@ -1,5 +1,8 @@
+import numpy as np
+import plutus_pairtrading.data_generations.data_generation as data_generation
 import pandas as pd
 import pytest
+from statsmodels.stats.multitest import multipletests
 from plutus_pairtrading.data_generations.data_generation import (
     validate_securities,
     compute_returns,
@@ -10,6 +13,15 @@ from plutus_pairtrading.data_generations.data_generation import (
     compute_correlation_dataframe,
     slice_data_with_dates,
     pairs_identification,
+    iter_pairs_identification,
+    basket_identification,
+    iter_basket_identification,
+    _enumerate_pairs,
+    _enumerate_baskets,
+    _correlation_candidates,
+)
+from plutus_pairtrading.tests.cointegration_tests import (
+    engle_granger_cointegration_test,
 )
 
 
@@ -92,16 +104,398 @@ def test_slice_data_with_dates(sample_data):
     assert sliced_data.index[-1] == pd.Timestamp("2023-01-05")
 
 
-@pytest.mark.skip(
-    reason="Stationarity and cointegration tests require more mock setup."
-)
-def test_pairs_identification(sample_data):
+@pytest.fixture
+def cointegrated_universe():
+    """Fixture to provide a small universe with one cointegrated pair."""
+    np.random.seed(42)
+    n = 250
+    x = np.cumsum(np.random.normal(0, 1, n)) + 50
+    y = 0.5 * x + np.random.normal(0, 0.5, n)
+    z = np.cumsum(np.random.normal(0, 1, n)) + 50
+    return pd.DataFrame(
+        {"X": x, "Y": y, "Z": z}, index=pd.date_range("2023-01-01", periods=n)
+    )
+
+
+def test_enumerate_pairs():
+    """Test each unordered combination is visited once."""
+    pairs = list(_enumerate_pairs(["A", "B", "C"]))
+    assert pairs == [(("A", "B"),), (("A", "C"),), (("B", "C"),)]
+
+    pairs = list(_enumerate_pairs(["A", "B"], both_directions=True))
+    assert pairs == [(("A", "B"), ("B", "A"))]
+
+
+def test_pairs_identification(cointegrated_universe):
     """Test pairs identification."""
     pairs = pairs_identification(
-        sample_data,
+        cointegrated_universe,
         stationarity_method="ADF",
         cointegration_method="phillips-ouliaris",
     )
     assert isinstance(pairs, pd.DataFrame)
     assert "security_a" in pairs.columns
     assert "security_b" in pairs.columns
+    assert list(zip(pairs["security_a"], pairs["security_b"])) == [("X", "Y")]
+
+    pairs = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        cointegration_method="phillips-ouliaris",
+        both_directions=True,
+    )
+    assert list(zip(pairs["security_a"], pairs["security_b"])) == [
+        ("X", "Y"),
+        ("Y", "X"),
+    ]
+
+
+def test_pairs_identification_johansen(cointegrated_universe):
+    """Test pairs identification with the Johansen test."""
+    pairs = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        cointegration_method="johansen",
+    )
+    assert ("X", "Y") in list(zip(pairs["security_a"], pairs["security_b"]))
+
+
+def test_pairs_identification_gregory_hansen(cointegrated_universe):
+    """Test pairs identification with the Gregory-Hansen structural-break test."""
+    pairs = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        cointegration_method="gregory-hansen",
+    )
+    assert ("X", "Y") in list(zip(pairs["security_a"], pairs["security_b"]))
+
+
+def test_pairs_identification_invalid_method(cointegrated_universe):
+    """Test unsupported methods are rejected."""
+    with pytest.raises(ValueError, match="Method of stationarity"):
+        pairs_identification(cointegrated_universe, stationarity_method="invalid")
+
+
+def test_pairs_identification_parallel(cointegrated_universe):
+    """Test the process pool gives the serial result."""
+    serial = pairs_identification(
+        cointegrated_universe, stationarity_method="ADF", both_directions=True
+    )
+    parallel = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        both_directions=True,
+        n_jobs=2,
+        chunk_size=1,
+    )
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_correlation_candidates(cointegrated_universe):
+    """Test the correlation pre-filter candidates."""
+    securities = ["X", "Y", "Z"]
+    corr = cointegrated_universe.corr(method="spearman").abs()
+
+    candidates = _correlation_candidates(
+        cointegrated_universe, securities, threshold=0.8
+    )
+    assert candidates[0, 1] and candidates[1, 0]
+    assert not candidates.diagonal().any()
+    assert candidates[0, 2] == (corr.loc["X", "Z"] >= 0.8)
+
+    candidates = _correlation_candidates(
+        cointegrated_universe, securities, threshold=None, top_k=1
+    )
+    assert candidates.sum(axis=1).min() >= 1
+
+
+def test_pairs_identification_correlation_prefilter(cointegrated_universe):
+    """Test the correlation pre-filter and screening report."""
+    pairs = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        correlation_method="pearson",
+        correlation_threshold=0.99,
+    )
+    assert pairs.empty
+    report = pairs.attrs["screening_report"]
+    assert report["candidate_pairs"] == 3
+    assert report["correlation_eliminated"] == 3 - report["stationarity_eliminated"]
+
+    pairs = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        correlation_method="pearson",
+        correlation_top_k=1,
+        correlation_threshold=None,
+    )
+    assert list(zip(pairs["security_a"], pairs["security_b"])) == [("X", "Y")]
+    assert pairs.attrs["screening_report"]["cointegrated_pairs"] == 1
+
+
+def test_iter_pairs_identification(cointegrated_universe):
+    """Test the streaming mode yields the pairs of pairs_identification."""
+    expected = pairs_identification(
+        cointegrated_universe, stationarity_method="ADF", both_directions=True
+    )
+    rows = iter_pairs_identification(
+        cointegrated_universe, stationarity_method="ADF", both_directions=True
+    )
+    assert next(rows)["security_a"] == "X"
+    pd.testing.assert_frame_equal(
+        pd.DataFrame([expected.iloc[0].to_dict(), *rows]), expected
+    )
+
+
+@pytest.mark.parametrize("sink_name", ["pairs.csv", "pairs.parquet"])
+def test_pairs_identification_sink_resume(
+    cointegrated_universe, tmp_path, monkeypatch, sink_name
+):
+    """Test pairs are written to a sink and an interrupted screening is resumed."""
+    if sink_name.endswith(".parquet"):
+        pytest.importorskip("pyarrow")
+    sink = str(tmp_path / sink_name)
+    expected = pairs_identification(
+        cointegrated_universe, stationarity_method="ADF", both_directions=True
+    )
+
+    # Interrupt the screening on its third combination
+    calls = []
+    interrupt_at = [3]
+    cointegration_chunk = data_generation._cointegration_chunk
+
+    def recorded_chunk(data, pairs, **kwargs):
+        calls.append(pairs)
+        if len(calls) == interrupt_at[0]:
+            raise KeyboardInterrupt
+        return cointegration_chunk(data, pairs, **kwargs)
+
+    monkeypatch.setattr(data_generation, "_cointegration_chunk", recorded_chunk)
+    with pytest.raises(KeyboardInterrupt):
+        pairs_identification(
+            cointegrated_universe,
+            stationarity_method="ADF",
+            both_directions=True,
+            sink=sink,
+            checkpoint_every=1,
+        )
+
+    # Only the remaining combination is tested on resume
+    calls.clear()
+    interrupt_at[0] = None
+    resumed = pairs_identification(
+        cointegrated_universe,
+        stationarity_method="ADF",
+        both_directions=True,
+        sink=sink,
+        resume=True,
+    )
+    assert calls == [[(("Y", "Z"), ("Z", "Y"))]]
+    assert list(zip(resumed["security_a"], resumed["security_b"])) == [
+        ("X", "Y"),
+        ("Y", "X"),
+    ]
+    for col in ["security_a", "security_b"]:
+        assert list(resumed[col]) == list(expected[col])
+    for found, vector in zip(resumed.iloc[:, 2], expected.iloc[:, 2]):
+        pd.testing.assert_series_equal(found, vector)
+    assert resumed.attrs["screening_report"] == expected.attrs["screening_report"]
+
+    with pytest.raises(ValueError, match="another screening"):
+        pairs_identification(
+            cointegrated_universe,
+            stationarity_method="ADF",
+            sink=sink,
+            resume=True,
+        )
+
+
+@pytest.fixture
+def pairs_universe():
+    """Fixture to provide a universe with cointegrated pairs of decreasing strength."""
+    rng = np.random.default_rng(4)
+    n = 250
+    walks = np.cumsum(rng.normal(0, 1, (n, 4)), axis=0) + 50
+    # AR(1) spreads, more persistent for each partner
+    phi = np.array([0.0, 0.85, 0.92, 0.96])
+    shocks = rng.normal(0, 1, (n, 4))
+    spreads = np.zeros((n, 4))
+    for t in range(1, n):
+        spreads[t] = phi * spreads[t - 1] + shocks[t]
+    return pd.DataFrame(
+        np.column_stack([walks, 0.8 * walks + spreads]),
+        columns=["A", "B", "C", "D", "A2", "B2", "C2", "D2"],
+        index=pd.date_range("2023-01-01", periods=n),
+    )
+
+
+@pytest.mark.parametrize(
+    "multiple_testing, reference", [("benjamini-hochberg", "fdr_bh"), ("holm", "holm")]
+)
+def test_pairs_identification_multiple_testing(
+    pairs_universe, multiple_testing, reference
+):
+    """Test the adjusted screening keeps the pairs significant after adjusting all p-values."""
+    settings = dict(
+        stationarity_method="ADF",
+        cointegration_method="engle-granger",
+        coint_significance_level=0.05,
+        both_directions=True,
+    )
+    raw = pairs_identification(pairs_universe, **settings)
+    pairs = pairs_identification(
+        pairs_universe, multiple_testing=multiple_testing, **settings
+    )
+
+    securities = list(pairs_universe.columns)
+    orientations = [
+        (a, b) for i, a in enumerate(securities) for b in securities[i + 1 :]
+    ]
+    orientations = [pair for a, b in orientations for pair in ((a, b), (b, a))]
+    pvalues = np.array(
+        [
+            engle_granger_cointegration_test(pairs_universe, list(pair))["p-Value"]
+            for pair in orientations
+        ]
+    )
+    rejected, adjusted = multipletests(pvalues, alpha=0.05, method=reference)[:2]
+    expected = [pair for pair, keep in zip(orientations, rejected) if keep]
+
+    assert list(zip(pairs["security_a"], pairs["security_b"])) == expected
+    assert 0 < len(pairs) < len(raw)
+    assert pairs["adjusted_p_value"].to_numpy() == pytest.approx(adjusted[rejected])
+    report = pairs.attrs["screening_report"]
+    assert report["cointegrated_pairs"] == len(pairs)
+    assert report["cointegration_eliminated"] == np.sum(pvalues >= 0.05)
+    assert report["multiple_testing_eliminated"] == np.sum(pvalues < 0.05) - len(pairs)
+    assert raw.attrs["screening_report"]["multiple_testing_eliminated"] == 0
+
+    with pytest.raises(ValueError, match="requires p-values"):
+        pairs_identification(
+            pairs_universe, cointegration_method="johansen", multiple_testing="bh"
+        )
+
+
+def test_iter_pairs_identification_online_fdr(pairs_universe, tmp_path):
+    """Test the streaming mode decides the pairs online and resumes its state from the sink."""
+    settings = dict(
+        stationarity_method="ADF",
+        cointegration_method="engle-granger",
+        coint_significance_level=0.05,
+        both_directions=True,
+        multiple_testing="bh",
+    )
+    rows = list(iter_pairs_identification(pairs_universe, **settings))
+    assert rows
+    assert all(row["p_value"] <= row["test_level"] <= 0.05 for row in rows)
+
+    sink = str(tmp_path / "pairs.csv")
+    pairs = pairs_identification(
+        pairs_universe, sink=sink, checkpoint_every=1, **settings
+    )
+    assert list(zip(pairs["security_a"], pairs["security_b"])) == [
+        (row["security_a"], row["security_b"]) for row in rows
+    ]
+    assert pairs["test_level"].to_numpy() == pytest.approx(
+        [row["test_level"] for row in rows]
+    )
+    report = pairs.attrs["screening_report"]
+    assert report["multiple_testing_eliminated"] > 0
+    assert (
+        report["cointegration_eliminated"]
+        + report["multiple_testing_eliminated"]
+        + len(pairs)
+        == report["candidate_pairs"] - report["stationarity_eliminated"]
+    )
+
+
+@pytest.fixture
+def basket_universe():
+    """Fixture to provide a universe with one cointegrated triplet."""
+    rng = np.random.default_rng(11)
+    n = 300
+    x = np.cumsum(rng.normal(0, 1, n)) + 50
+    y = np.cumsum(rng.normal(0, 1, n)) + 50
+    z = 0.6 * x + 0.4 * y + rng.normal(0, 0.5, n)
+    w = np.cumsum(rng.normal(0, 1, n)) + 50
+    v = np.cumsum(rng.normal(0, 1, n)) + 50
+    return pd.DataFrame(
+        {"X": x, "Y": y, "Z": z, "W": w, "V": v},
+        index=pd.date_range("2023-01-01", periods=n),
+    )
+
+
+def test_enumerate_baskets():
+    """Test baskets are cliques of the candidate pairs, visited once and capped per anchor."""
+    securities = ["A", "B", "C", "D"]
+    candidates = np.ones((4, 4), dtype=bool)
+    np.fill_diagonal(candidates, False)
+    assert list(_enumerate_baskets(securities, 3, candidates)) == [
+        ("A", "B", "C"),
+        ("A", "B", "D"),
+        ("A", "C", "D"),
+        ("B", "C", "D"),
+    ]
+
+    # C and D may not share a basket
+    candidates[2, 3] = candidates[3, 2] = False
+    assert list(_enumerate_baskets(securities, 3, candidates)) == [
+        ("A", "B", "C"),
+        ("A", "B", "D"),
+    ]
+
+    # Strongest partners first, at most one basket per anchor
+    strength = np.array(
+        [[0, 0.1, 0.9, 0.8], [0.1, 0, 0.5, 0.7], [0.9, 0.5, 0, 0], [0.8, 0.7, 0, 0]]
+    )
+    candidates[2, 3] = candidates[3, 2] = True
+    baskets = list(
+        _enumerate_baskets(
+            securities, 3, candidates, strength, max_baskets_per_anchor=1
+        )
+    )
+    assert baskets == [("A", "C", "D"), ("B", "D", "C")]
+
+
+def test_basket_identification(basket_universe):
+    """Test basket identification finds the cointegrated triplet."""
+    baskets = basket_identification(
+        basket_universe, basket_size=3, correlation_method=None
+    )
+    assert baskets.attrs["screening_report"]["tested_baskets"] == 10
+    members = [
+        set(row) for row in baskets[["security_a", "security_b", "security_c"]].values
+    ]
+    assert members[0] == {"X", "Y", "Z"}
+    assert list(baskets["Score"]) == sorted(baskets["Score"], reverse=True)
+
+    # The streaming version yields the same baskets
+    streamed = list(
+        iter_basket_identification(
+            basket_universe, basket_size=3, correlation_method=None, chunk_size=3
+        )
+    )
+    assert sorted(row["Score"] for row in streamed) == pytest.approx(
+        sorted(baskets["Score"])
+    )
+
+    # Parallel screening gives the same ranking
+    parallel = basket_identification(
+        basket_universe, basket_size=3, correlation_method=None, n_jobs=2, chunk_size=2
+    )
+    pd.testing.assert_frame_equal(
+        parallel.drop(columns="cointegration_vector_5perc"),
+        baskets.drop(columns="cointegration_vector_5perc"),
+    )
+
+    # Gates prune the tested baskets
+    gated = basket_identification(
+        basket_universe,
+        basket_size=3,
+        correlation_threshold=0.5,
+        max_baskets_per_anchor=1,
+    )
+    assert gated.attrs["screening_report"]["tested_baskets"] <= 3
+
+    with pytest.raises(ValueError, match="basket_size"):
+        basket_identification(basket_universe, basket_size=1)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from plutus_pairtrading.utils.lag_selection import (
+    _nested_residual_variances,
+    _select_lags,
+)
+
+
+@pytest.fixture
+def regressions():
+    """Fixture to provide stacked designs whose last columns are optional."""
+    rng = np.random.default_rng(5)
+    design = rng.normal(size=(4, 120, 6))
+    target = design[:, :, :3].sum(axis=2) + rng.normal(size=(4, 120))
+    return design, target
+
+
+def test_nested_residual_variances(regressions):
+    """Test one factorization gives the residual variances of every nested model."""
+    design, target = regressions
+    xpx = np.matmul(design.transpose(0, 2, 1), design)
+    xpy = np.einsum("bmk,bm->bk", design, target)
+    ypy = np.einsum("bm,bm->b", target, target)
+
+    sigma2 = _nested_residual_variances(xpx, xpy, ypy, design.shape[1], 2)
+    assert sigma2.shape == (4, 5)
+    for series in range(4):
+        for k in range(2, 7):
+            _, ssr, *_ = np.linalg.lstsq(
+                design[series, :, :k], target[series], rcond=None
+            )
+            assert sigma2[series, k - 2] == pytest.approx(ssr[0] / design.shape[1])
+
+
+def test_select_lags(regressions):
+    """Test the lag search picks the model with the smallest information criterion."""
+    design, target = regressions
+    xpx = np.matmul(design.transpose(0, 2, 1), design)
+    xpy = np.einsum("bmk,bm->bk", design, target)
+    ypy = np.einsum("bm,bm->b", target, target)
+
+    # The first three columns drive the target: one lag beyond the two fixed columns
+    assert list(_select_lags(xpx, xpy, ypy, design.shape[1], 2, "bic")) == [1] * 4
+    assert all(_select_lags(xpx, xpy, ypy, design.shape[1], 2, "aic") >= 1)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from statsmodels.stats.multitest import multipletests
+
+from plutus_pairtrading.utils.multiple_testing import (
+    _OnlineTesting,
+    _adjust_pvalues,
+    _validate_multiple_testing,
+)
+
+
+def test_validate_multiple_testing():
+    """Test the multiple-testing option is converted and validated."""
+    assert _validate_multiple_testing(None) is None
+    assert _validate_multiple_testing("BH") == "benjamini-hochberg"
+    assert _validate_multiple_testing("Holm") == "holm"
+    with pytest.raises(ValueError, match="Invalid multiple testing"):
+        _validate_multiple_testing("bonferroni")
+
+
+@pytest.mark.parametrize(
+    "method, reference", [("benjamini-hochberg", "fdr_bh"), ("holm", "holm")]
+)
+def test_adjust_pvalues(method, reference):
+    """Test adjusted p-values match statsmodels, also from the p-values below the level only."""
+    pvalues = np.random.default_rng(0).uniform(size=500) ** 4
+    expected = multipletests(pvalues, method=reference)[1]
+    assert _adjust_pvalues(pvalues, len(pvalues), method) == pytest.approx(expected)
+
+    kept = np.flatnonzero(pvalues < 0.05)
+    adjusted = _adjust_pvalues(pvalues[kept], len(pvalues), method)
+    assert (adjusted < 0.05).tolist() == (expected[kept] < 0.05).tolist()
+    assert adjusted[adjusted < 0.05] == pytest.approx(expected[kept][adjusted < 0.05])
+
+    adjusted = _adjust_pvalues(np.array([0.01, np.nan, 0.02]), 3, method)
+    assert np.isnan(adjusted[1]) and not np.isnan(adjusted[[0, 2]]).any()
+
+
+def test_online_testing():
+    """Test the online test levels and their resumable state."""
+    lond = _OnlineTesting("benjamini-hochberg", 0.05)
+    first = lond.level()
+    assert lond.test(first / 2) == (True, first)
+    # A discovery raises the next level, a non-discovery does not
+    assert lond.level() > _OnlineTesting("holm", 0.05, tests=1).level()
+    lond.test(1.0)
+    assert lond.state() == {"tests": 2, "discoveries": 1}
+    assert _OnlineTesting("benjamini-hochberg", 0.05, **lond.state()).level() == (
+        lond.level()
+    )
+    assert lond.test(np.nan)[0] is False
+
+    spending = _OnlineTesting("holm", 0.05)
+    levels = [spending.test(0.0)[1] for _ in range(1000)]
+    assert sum(levels) < 0.05
+    assert _OnlineTesting("benjamini-hochberg", 0.05, discoveries=10**6).level() == 0.05
@@ -0,0 +1,129 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plutus_pairtrading.data_acquisitions.panel_store import PanelStore
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def ticker_frames():
+    """Fixture to generate prefixed daily data of a few tickers."""
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2023-01-02", periods=40, freq="B", name="date")
+    return {
+        ticker: pd.DataFrame(
+            {
+                f"{ticker}_close": 100 + np.cumsum(rng.normal(size=len(dates))),
+                f"{ticker}_volume": rng.integers(1000, 2000, len(dates)).astype(float),
+            },
+            index=dates,
+        )
+        for ticker in ["MSFT", "AAPL", "GOOG", "AMZN"]
+    }
+
+
+def test_panel_store_read(tmp_path, ticker_frames):
+    """Test reads of ticker subsets and date windows match joining the ticker frames."""
+    panel = PanelStore(str(tmp_path / "panel"), row_group_size=50)
+    panel.append(ticker_frames)
+    assert panel.tickers() == ["AAPL", "AMZN", "GOOG", "MSFT"]
+
+    data = panel.read(
+        ["GOOG", "AAPL", "MISSING"], start_date="2023-01-16", end_date="2023-02-10"
+    )
+    expected = ticker_frames["GOOG"].join(ticker_frames["AAPL"])
+    pd.testing.assert_frame_equal(
+        data, expected.loc["2023-01-16":"2023-02-10"], check_freq=False
+    )
+
+    closes = panel.read(["MSFT", "AMZN"], fields=["close"], ticker_prefix=False)
+    assert list(closes.columns) == [("MSFT", "close"), ("AMZN", "close")]
+    np.testing.assert_array_equal(
+        closes[("AMZN", "close")].to_numpy(),
+        ticker_frames["AMZN"]["AMZN_close"].to_numpy(),
+    )
+
+    with pytest.raises(ValueError, match="Invalid join type"):
+        panel.read(join_type="left")
+
+
+def test_panel_store_append(tmp_path, ticker_frames):
+    """Test appended dates and restated values win over the stored ones."""
+    panel = PanelStore(str(tmp_path / "panel"))
+    panel.append({ticker: data.iloc[:30] for ticker, data in ticker_frames.items()})
+
+    # New dates for two tickers, with the last stored session restated
+    panel.append(
+        {ticker: ticker_frames[ticker].iloc[29:] for ticker in ["AAPL", "MSFT"]}
+    )
+    restated = ticker_frames["AAPL"].iloc[:5] * 0.5
+    panel.append({"AAPL": restated})
+
+    outer = panel.read(["AAPL", "GOOG"], fields=["close"])
+    assert len(outer) == 40
+    assert outer["GOOG_close"].iloc[30:].isna().all()
+    np.testing.assert_array_equal(
+        outer["AAPL_close"].to_numpy(),
+        np.concatenate(
+            [restated["AAPL_close"], ticker_frames["AAPL"]["AAPL_close"].iloc[5:]]
+        ),
+    )
+    inner = panel.read(["AAPL", "GOOG"], fields=["close"], join_type="inner")
+    pd.testing.assert_frame_equal(inner, outer.iloc[:30])
+
+    tails = panel.tails(["AAPL", "GOOG", "MISSING"])
+    assert list(tails) == ["AAPL", "GOOG"]
+    pd.testing.assert_frame_equal(
+        tails["GOOG"],
+        ticker_frames["GOOG"].iloc[28:30].set_axis(["close", "volume"], axis=1),
+        check_freq=False,
+        check_names=False,
+    )
+
+    expected = panel.read()
+    panel.compact()
+    assert len(os.listdir(tmp_path / "panel")) == 1
+    pd.testing.assert_frame_equal(panel.read(), expected)
+
+    # Appends after a compaction still win
+    panel.append({"GOOG": ticker_frames["GOOG"].iloc[:1] + 1000})
+    assert panel.read(["GOOG"])["GOOG_close"].iloc[0] > 1000
+
+
+def test_panel_store_replace(tmp_path, ticker_frames):
+    """Test a full history drops the ticker's stale rows and keeps the other tickers."""
+    panel = PanelStore(str(tmp_path / "panel"))
+    panel.append(ticker_frames)
+
+    # A restated history without its first ten sessions
+    restated = ticker_frames["MSFT"].iloc[10:] * 2
+    panel.append({"MSFT": restated}, replace=["MSFT"])
+    pd.testing.assert_frame_equal(panel.read(["MSFT"]), restated, check_freq=False)
+    pd.testing.assert_frame_equal(
+        panel.read(["AAPL"]), ticker_frames["AAPL"], check_freq=False
+    )
+
+
+def test_panel_store_concurrent_appends(tmp_path, ticker_frames):
+    """Test concurrent appends write distinct parts, read in append order."""
+    panel = PanelStore(str(tmp_path / "panel"))
+    threads = [
+        threading.Thread(target=panel.append, args=({ticker: data},))
+        for ticker, data in ticker_frames.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(panel._parts()) == 4
+    assert panel.tickers() == sorted(ticker_frames)
+
+    sequences = [panel._sequence(part) for part in panel._parts()]
+    assert sequences == sorted(sequences)
+    panel.append({"AAPL": ticker_frames["AAPL"] * 0})
+    assert (panel.read(["AAPL"]) == 0).all().all()
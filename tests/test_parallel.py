@@ -0,0 +1,166 @@
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+from plutus_pairtrading.data_generations.data_generation import pairs_identification
+from plutus_pairtrading.tests.cointegration_tests import (
+    cointegration_store_info,
+    disable_cointegration_store,
+    enable_cointegration_store,
+)
+from plutus_pairtrading.tests.stationarity_tests import (
+    disable_stationarity_cache,
+    enable_stationarity_cache,
+    stationarity_cache_info,
+)
+from plutus_pairtrading.utils import parallel
+from plutus_pairtrading.utils.precision import compute_precision, get_precision
+from plutus_pairtrading.utils.parallel import (
+    _resolve_n_jobs,
+    _chunked,
+    _shared_dataframe,
+    _parallel_imap,
+    _parallel_map,
+)
+
+
+@pytest.fixture
+def sample_data():
+    """Fixture to provide a small numeric DataFrame."""
+    return pd.DataFrame(
+        {"A": np.arange(5.0), "B": np.arange(5.0) * 2},
+        index=pd.date_range("2023-01-01", periods=5, name="date"),
+    )
+
+
+@pytest.fixture
+def spawn_pool(monkeypatch):
+    """Fixture starting the process pools with spawn, as on macOS and Windows."""
+    monkeypatch.setattr(
+        parallel,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+    )
+
+
+@pytest.fixture
+def random_walks():
+    """Fixture to provide a few independent random walks."""
+    rng = np.random.default_rng(3)
+    return pd.DataFrame(
+        np.cumsum(rng.normal(size=(150, 5)), axis=0),
+        index=pd.date_range("2023-01-01", periods=150, name="date"),
+        columns=list("ABCDE"),
+    )
+
+
+def _column_sums(data, columns):
+    """Chunk function used by the tests."""
+    return [float(data[col].sum()) for col in columns]
+
+
+def _worker_precisions(data, columns):
+    """Chunk function returning the precision of the worker."""
+    return [get_precision() for _ in columns]
+
+
+def test_resolve_n_jobs():
+    """Test translation of n_jobs into a worker count."""
+    assert _resolve_n_jobs(None) == 1
+    assert _resolve_n_jobs(1) == 1
+    assert _resolve_n_jobs(4) == 4
+    assert _resolve_n_jobs(-1) >= 1
+
+
+def test_chunked():
+    """Test ordered chunking."""
+    assert list(_chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    with pytest.raises(ValueError):
+        list(_chunked([1], 0))
+
+
+def _frame_rows(data, rows):
+    """Chunk function returning full rows of the shared DataFrame."""
+    return [data.iloc[row].tolist() for row in rows]
+
+
+def test_shared_dataframe_round_trip(sample_data):
+    """Test the workers see the DataFrame shared by the parent."""
+    result = _parallel_map(_frame_rows, sample_data, [0, 2, 4], n_jobs=2, chunk_size=1)
+    assert result == sample_data.iloc[[0, 2, 4]].values.tolist()
+
+    with pytest.raises(RuntimeError):
+        _shared_dataframe()
+
+
+def test_parallel_map(sample_data):
+    """Test the process pool returns the serial results in order."""
+    serial = _column_sums(sample_data, ["A", "B", "A"])
+    result = _parallel_map(
+        _column_sums, sample_data, ["A", "B", "A"], n_jobs=2, chunk_size=1
+    )
+    assert result == serial
+
+
+def test_parallel_imap(sample_data):
+    """Test chunks are yielded in order, serially and with a pool."""
+    for n_jobs in (1, 2):
+        chunks = list(
+            _parallel_imap(
+                _column_sums, sample_data, ["A", "B", "A"], n_jobs=n_jobs, chunk_size=2
+            )
+        )
+        assert chunks == [(["A", "B"], [10.0, 20.0]), (["A"], [10.0])]
+
+
+def test_workers_use_cointegration_store(spawn_pool, random_walks, tmp_path):
+    """Test spawned workers rebuild the cointegration store of the caller."""
+    path = str(tmp_path / "cointegration.sqlite")
+    enable_cointegration_store(path=path)
+    try:
+        expected = pairs_identification(
+            random_walks, cointegration_method="engle-granger", n_jobs=2
+        )
+        # The lookups were made by the workers
+        assert cointegration_store_info()["misses"] == 0
+
+        enable_cointegration_store(path=path)
+        result = pairs_identification(
+            random_walks, cointegration_method="engle-granger"
+        )
+        info = cointegration_store_info()
+        assert info["misses"] == 0
+        assert info["disk_hits"] == info["hits"] == 10
+        pd.testing.assert_frame_equal(result, expected)
+    finally:
+        disable_cointegration_store()
+
+
+def test_workers_use_stationarity_cache_and_precision(
+    spawn_pool, random_walks, tmp_path
+):
+    """Test spawned workers rebuild the stationarity cache and keep the precision."""
+    path = str(tmp_path / "stationarity.sqlite")
+    enable_stationarity_cache(path=path)
+    try:
+        pairs_identification(random_walks, n_jobs=2)
+        # The lookups were made by the workers
+        assert stationarity_cache_info()["misses"] == 0
+
+        enable_stationarity_cache(path=path)
+        pairs_identification(random_walks)
+        info = stationarity_cache_info()
+        assert info["misses"] == 0
+        assert info["disk_hits"] == info["hits"] == 5
+    finally:
+        disable_stationarity_cache()
+
+    with compute_precision("float32"):
+        precisions = _parallel_map(
+            _worker_precisions, random_walks, list(random_walks.columns), n_jobs=2
+        )
+    assert precisions == ["float32"] * 5
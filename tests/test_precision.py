@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import plutus_pairtrading.utils.precision as precision
+from plutus_pairtrading.data_generations.data_generation import (
+    compute_correlation_matrix,
+    compute_correlation_dataframe,
+)
+from plutus_pairtrading.tests.cointegration_tests import (
+    batch_engle_granger_cointegration_test,
+)
+from plutus_pairtrading.tests.stationarity_tests import (
+    batch_augmented_dickey_fuller_test,
+    batch_philips_perron_test,
+)
+from plutus_pairtrading.utils.critical_values import _critical_statistic
+from plutus_pairtrading.utils.precision import (
+    compute_precision,
+    get_precision,
+    set_precision,
+    _compute_dtype,
+    _near_threshold,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_precision():
+    """Fixture restoring the default precision after each test."""
+    yield
+    set_precision("float64")
+
+
+@pytest.fixture
+def factor_prices():
+    """Fixture to generate prices driven by common stochastic trends."""
+    rng = np.random.default_rng(7)
+    n, n_securities = 500, 12
+    factors = np.cumsum(rng.normal(size=(n, 3)), axis=0)
+    loadings = rng.normal(size=(3, n_securities))
+    scale = np.where(np.arange(n_securities) % 2 == 0, 0.05, 1.0)
+    noise = np.cumsum(rng.normal(size=(n, n_securities)) * scale, axis=0)
+    return pd.DataFrame(
+        100 + factors @ loadings + noise + rng.normal(size=(n, n_securities)),
+        columns=[f"S{i}" for i in range(n_securities)],
+    )
+
+
+def test_set_precision():
+    """Test the precision setting and its context manager."""
+    assert get_precision() == "float64"
+    assert _compute_dtype() == np.float64
+
+    with compute_precision("float32"):
+        assert get_precision() == "float32"
+        assert _compute_dtype() == np.float32
+    assert get_precision() == "float64"
+
+    with pytest.raises(ValueError, match="Invalid precision"):
+        set_precision("float16")
+
+
+def test_near_threshold():
+    """Test only the statistics within the margin of the critical value are flagged."""
+    critical = _critical_statistic("engle-granger", "c", 0.05)
+    statistics = critical + np.array([-1.0, -0.01, 0.01, 1.0])
+    assert not _near_threshold(statistics, "engle-granger", "c", 0.05).any()
+
+    set_precision("float32")
+    assert _near_threshold(statistics, "engle-granger", "c", 0.05).tolist() == [
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize("trend", ["constant", "constant and time trend"])
+def test_batch_engle_granger_float32(factor_prices, trend):
+    """Test float32 screening keeps the float64 decisions and re-verifies in float64."""
+    expected = batch_engle_granger_cointegration_test(factor_prices, trend=trend)
+
+    set_precision("float32")
+    result = batch_engle_granger_cointegration_test(factor_prices, trend=trend)
+    assert result["Cointegrated"].tolist() == expected["Cointegrated"].tolist()
+    assert result["Statistic"].to_numpy() == pytest.approx(
+        expected["Statistic"].to_numpy(), abs=1e-2
+    )
+
+    # With every pair re-verified, the results are the float64 ones
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(precision, "_STATISTIC_MARGIN", 100.0)
+        result = batch_engle_granger_cointegration_test(factor_prices, trend=trend)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "test", [batch_augmented_dickey_fuller_test, batch_philips_perron_test]
+)
+def test_batch_stationarity_float32(factor_prices, test):
+    """Test float32 batch stationarity tests keep the float64 decisions."""
+    expected = test(factor_prices)
+
+    set_precision("float32")
+    result = test(factor_prices)
+    assert result["Stationary"].tolist() == expected["Stationary"].tolist()
+    assert result["Statistic"].to_numpy() == pytest.approx(
+        expected["Statistic"].to_numpy(), abs=1e-2
+    )
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(precision, "_STATISTIC_MARGIN", 100.0)
+        result = test(factor_prices)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+def test_correlation_float32(factor_prices, method):
+    """Test float32 correlations agree with pandas and keep the filtered pairs."""
+    securities = list(factor_prices.columns)
+    expected = compute_correlation_matrix(factor_prices, securities, method)
+    expected_pairs, _ = compute_correlation_dataframe(
+        factor_prices, securities, method, 0.5, -0.5
+    )
+
+    set_precision("float32")
+    result = compute_correlation_matrix(factor_prices, securities, method)
+    assert result.to_numpy() == pytest.approx(expected.to_numpy(), abs=1e-5)
+    if method != "kendall":
+        assert (result.dtypes == np.float32).all()
+
+    pairs, _ = compute_correlation_dataframe(
+        factor_prices, securities, method, 0.5, -0.5
+    )
+    assert pairs[["level_0", "level_1"]].values.tolist() == (
+        expected_pairs[["level_0", "level_1"]].values.tolist()
+    )
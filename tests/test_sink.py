@@ -0,0 +1,63 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+from plutus_pairtrading.utils.sink import ResultSink
+
+
+@pytest.mark.parametrize("name", ["rows.csv", "rows.parquet"])
+def test_result_sink(tmp_path, name):
+    """Test rows are appended, checkpointed and read back."""
+    if name.endswith(".parquet"):
+        pytest.importorskip("pyarrow")
+    sink = ResultSink(str(tmp_path / name))
+    assert sink.read().empty
+    assert sink.load_checkpoint() is None
+
+    vector = pd.Series([1.0, -0.5], index=["A", "B"])
+    sink.append([{"security_a": "A", "security_b": "B", "vector": vector}])
+    sink.append([], state={"tested": 2})
+    sink.append([{"security_a": "A", "security_b": "C", "vector": vector * 2}])
+
+    rows = sink.read()
+    assert list(rows["security_b"]) == ["B", "C"]
+    pd.testing.assert_series_equal(rows["vector"].iloc[1], vector * 2)
+    assert sink.load_checkpoint()["rows"] == 2
+    assert sink.load_checkpoint()["state"] == {}
+
+    sink.clear()
+    assert sink.read().empty
+    assert not os.path.exists(sink.checkpoint_path)
+
+
+def test_result_sink_without_pyarrow(tmp_path, monkeypatch):
+    """Test a Parquet sink without pyarrow fails with a clear ImportError."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"plutus-pairtrading\[parquet\]"):
+        ResultSink(str(tmp_path / "rows.parquet"))
+
+
+@pytest.mark.parametrize("name", ["rows.csv", "rows.parquet"])
+def test_result_sink_truncate(tmp_path, name):
+    """Test rows written after the last checkpoint are discarded."""
+    if name.endswith(".parquet"):
+        pytest.importorskip("pyarrow")
+    sink = ResultSink(str(tmp_path / name))
+    sink.append([{"security_a": "A", "security_b": "B"}], state={"tested": 1})
+    checkpoint = sink.load_checkpoint()
+
+    # Rows of an interrupted flush, not covered by the checkpoint
+    sink.append([{"security_a": "A", "security_b": "C"}])
+    sink._save_checkpoint(checkpoint)
+
+    sink.truncate()
+    assert list(sink._read_raw()["security_b"]) == ["B"]
+    sink.append([{"security_a": "B", "security_b": "C"}])
+    assert list(sink.read()["security_b"]) == ["B", "C"]
+
+
+def test_result_sink_invalid_format(tmp_path):
+    """Test unsupported formats are rejected."""
+    with pytest.raises(ValueError):
+        ResultSink(str(tmp_path / "rows.xlsx"))
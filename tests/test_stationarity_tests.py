@@ -1,10 +1,19 @@
 import pytest
+import numpy as np
 import pandas as pd
+from arch.unitroot import PhillipsPerron
+from arch.utility.exceptions import InfeasibleTestException
 from plutus_pairtrading.tests.stationarity_tests import (
     validate_trend,
     augmented_dickey_fuller_test,
     philips_perron_test,
     KPSS_test,
+    enable_stationarity_cache,
+    disable_stationarity_cache,
+    stationarity_cache_info,
+    batch_augmented_dickey_fuller_test,
+    batch_philips_perron_test,
+    batch_KPSS_test,
 )
 
 from plutus_pairtrading.data_generations.data_generation import (
@@ -66,6 +75,14 @@ def test_augmented_dickey_fuller_test(sample_data):
         augmented_dickey_fuller_test(sample_data, security="MSFT")
 
 
+def test_augmented_dickey_fuller_test_infeasible_lag_search():
+    """Test that a lag search too long for the sample raises arch's error."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"A": rng.standard_normal(35).cumsum()})
+    with pytest.raises(InfeasibleTestException):
+        augmented_dickey_fuller_test(data, security="A", max_lag_for_auto_detect=20)
+
+
 def test_philips_perron_test(sample_data):
     """Test Phillips-Perron stationarity test."""
     result = philips_perron_test(
@@ -89,6 +106,42 @@ def test_philips_perron_test(sample_data):
         philips_perron_test(sample_data, security="GOOG")
 
 
+@pytest.mark.parametrize("lags", [None, 10])
+def test_philips_perron_matches_arch(sample_data, lags):
+    """Test the Phillips-Perron statistic matches arch, including the default bandwidth."""
+    result = philips_perron_test(sample_data, security="TICKER", lags=lags)
+    expected = PhillipsPerron(
+        sample_data["TICKER"].dropna(),
+        lags=lags if lags is not None else len(sample_data) - 1,
+        trend="c",
+    )
+    assert result["Statistic"] == pytest.approx(expected.stat, abs=1e-8)
+    # p-values come from the precomputed tables, within 1e-6 of arch's response surface
+    assert result["p-Value"] == pytest.approx(expected.pvalue, abs=1e-6)
+    assert result["Lags"] == expected.lags
+    assert result["Critical Values"] == pytest.approx(expected.critical_values)
+
+
+@pytest.mark.parametrize("bandwidth", ["Newey-West", "Andrews"])
+def test_philips_perron_automatic_bandwidth(sample_data, bandwidth):
+    """Test the data-driven Phillips-Perron bandwidths."""
+    result = philips_perron_test(sample_data, security="TICKER", bandwidth=bandwidth)
+    assert 0 <= result["Lags"] < len(sample_data) ** 0.5
+    expected = PhillipsPerron(sample_data["TICKER"], lags=result["Lags"], trend="c")
+    assert result["Statistic"] == pytest.approx(expected.stat, abs=1e-8)
+
+    # An explicit number of lags takes precedence
+    assert (
+        philips_perron_test(
+            sample_data, security="TICKER", lags=3, bandwidth=bandwidth
+        )["Lags"]
+        == 3
+    )
+
+    with pytest.raises(ValueError, match="Invalid bandwidth"):
+        philips_perron_test(sample_data, security="TICKER", bandwidth="parzen")
+
+
 def test_KPSS_test(sample_data):
     """Test KPSS stationarity test."""
     result = KPSS_test(
@@ -108,3 +161,90 @@ def test_KPSS_test(sample_data):
     # Invalid security
     with pytest.raises(ValueError, match="Security 'TSLA' not found in the DataFrame."):
         KPSS_test(sample_data, security="TSLA")
+
+
+def test_stationarity_cache(sample_data, tmp_path):
+    """Test stationarity results are cached across calls and tests."""
+    path = str(tmp_path / "stationarity.sqlite")
+    enable_stationarity_cache(path=path)
+    try:
+        first = augmented_dickey_fuller_test(sample_data, security="TICKER")
+        second = augmented_dickey_fuller_test(sample_data, security="TICKER")
+        assert second["Statistic"] == pytest.approx(first["Statistic"])
+        assert second["Stationary"] == first["Stationary"]
+
+        # A different test or setting is a different entry
+        KPSS_test(sample_data, security="TICKER", lags=5)
+        augmented_dickey_fuller_test(
+            sample_data, security="TICKER", significance_level=0.01
+        )
+        assert stationarity_cache_info()["hits"] == 1
+        assert stationarity_cache_info()["misses"] == 3
+
+        # The on-disk tier survives a new cache
+        enable_stationarity_cache(path=path)
+        augmented_dickey_fuller_test(sample_data, security="TICKER")
+        assert stationarity_cache_info()["disk_hits"] == 1
+    finally:
+        disable_stationarity_cache()
+    assert stationarity_cache_info() == {}
+
+
+@pytest.fixture
+def price_matrix():
+    """Fixture to provide a price matrix with stationary, trending and gappy columns."""
+    rng = np.random.default_rng(7)
+    nobs = 300
+    prices = pd.DataFrame(
+        np.cumsum(rng.normal(size=(nobs, 6)), axis=0) + 100,
+        index=pd.bdate_range("2020-01-01", periods=nobs),
+        columns=["A", "B", "C", "D", "E", "F"],
+    )
+    prices["C"] = 50 + rng.normal(size=nobs)
+    prices["D"] = 0.3 * np.arange(nobs) + rng.normal(size=nobs)
+    prices.iloc[:20, 4] = np.nan
+    prices.iloc[50, 5] = np.nan
+    return prices
+
+
+@pytest.mark.parametrize(
+    "trend", ["no deterministic term", "constant", "constant and time trend"]
+)
+def test_batch_stationarity_tests(price_matrix, trend):
+    """Test the batched stationarity tests match the per-column tests."""
+    tests = [
+        (batch_augmented_dickey_fuller_test, augmented_dickey_fuller_test, {}),
+        (
+            batch_augmented_dickey_fuller_test,
+            augmented_dickey_fuller_test,
+            {"method": "BIC", "num_lags": 2},
+        ),
+        (batch_philips_perron_test, philips_perron_test, {}),
+        (batch_philips_perron_test, philips_perron_test, {"lags": 4}),
+    ]
+    if trend != "no deterministic term":
+        tests += [
+            (batch_KPSS_test, KPSS_test, {}),
+            (batch_KPSS_test, KPSS_test, {"lags": 4}),
+        ]
+
+    for batch_test, test, kwargs in tests:
+        result = batch_test(price_matrix, trend=trend, block_size=4, **kwargs)
+        assert list(result.index) == list(price_matrix.columns)
+        for security in price_matrix.columns:
+            expected = test(price_matrix, security, trend=trend, **kwargs)
+            row = result.loc[security]
+            assert row["Statistic"] == pytest.approx(expected["Statistic"], abs=1e-6)
+            assert row["p-Value"] == pytest.approx(expected["p-Value"], abs=1e-6)
+            assert row["Stationary"] == expected["Stationary"]
+            assert row["Lags"] == expected["Lags"]
+            assert row["Trend"] == trend
+
+    # Subset of securities, in the requested order
+    result = batch_augmented_dickey_fuller_test(price_matrix, securities=["D", "A"])
+    assert list(result.index) == ["D", "A"]
+
+    with pytest.raises(ValueError, match="not found in the DataFrame"):
+        batch_philips_perron_test(price_matrix, securities=["TSLA"])
+    with pytest.raises(ValueError, match="Invalid method"):
+        batch_augmented_dickey_fuller_test(price_matrix, method="HQIC")
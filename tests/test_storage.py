@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plutus_pairtrading.data_acquisitions.data_acquisition import (
+    load_data,
+    store_data,
+    read_and_combine_ticker_files,
+)
+from plutus_pairtrading.data_acquisitions.storage import (
+    StorageBackend,
+    CSVStorage,
+    ParquetStorage,
+    get_storage_backend,
+    register_storage_backend,
+    _STORAGE_BACKENDS,
+)
+
+
+@pytest.fixture
+def ticker_data():
+    """Fixture to generate daily prices of a few tickers."""
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2023-01-02", periods=60, freq="B", name="date")
+    return {
+        ticker: pd.DataFrame(
+            {
+                "close": 100 + np.cumsum(rng.normal(size=len(dates))),
+                "open": 100 + np.cumsum(rng.normal(size=len(dates))),
+                "volume": rng.integers(1000, 2000, size=len(dates)).astype(float),
+            },
+            index=dates,
+        )
+        for ticker in ["AAA", "BBB", "CCC"]
+    }
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".feather"])
+def test_store_and_load_data(tmp_path, ticker_data, extension):
+    """Test every backend round-trips and applies projections and date windows."""
+    if extension != ".csv":
+        pytest.importorskip("pyarrow")
+    data = ticker_data["AAA"]
+    file_path = str(tmp_path / f"AAA{extension}")
+    store_data(data, file_path)
+
+    pd.testing.assert_frame_equal(load_data(file_path), data, check_freq=False)
+    window = load_data(
+        file_path,
+        columns=["volume", "close", "missing"],
+        start_date="2023-02-01",
+        end_date="2023-02-28",
+    )
+    pd.testing.assert_frame_equal(
+        window,
+        data.loc["2023-02-01":"2023-02-28", ["volume", "close"]],
+        check_freq=False,
+    )
+
+
+@pytest.mark.parametrize("storage_format", ["parquet", "feather"])
+def test_read_and_combine_columnar(tmp_path, ticker_data, storage_format):
+    """Test columnar ticker files combine to the CSV result."""
+    pytest.importorskip("pyarrow")
+    backend = get_storage_backend(storage_format)
+    for ticker, data in ticker_data.items():
+        store_data(data, str(tmp_path / f"{ticker}.csv"))
+        store_data(data, str(tmp_path / f"{ticker}{backend.extension}"))
+
+    options = dict(
+        column_mapping={"close": "close"},
+        join_type="outer",
+        start_date="2023-01-10",
+        end_date="2023-03-01",
+    )
+    expected = read_and_combine_ticker_files(
+        str(tmp_path), list(ticker_data), **options
+    )
+    combined = read_and_combine_ticker_files(
+        str(tmp_path), list(ticker_data), storage_format=storage_format, **options
+    )
+    pd.testing.assert_frame_equal(combined, expected)
+    assert expected.index[0] == pd.Timestamp("2023-01-10")
+    assert expected.index[-1] == pd.Timestamp("2023-03-01")
+
+
+def test_parquet_date_pushdown(tmp_path, ticker_data, caplog):
+    """Test Parquet reads only scan the row groups inside the date window."""
+    pytest.importorskip("pyarrow")
+    storage = ParquetStorage(row_group_size=10)
+    file_path = str(tmp_path / "AAA.parquet")
+    storage.write(ticker_data["AAA"], file_path)
+
+    with caplog.at_level(
+        "DEBUG", logger="plutus_pairtrading.data_acquisitions.storage"
+    ):
+        data = storage.read(file_path, columns=["close"], start_date="2023-03-01")
+    assert "Scanning 2 of 6 row groups" in caplog.text
+    pd.testing.assert_frame_equal(
+        data, ticker_data["AAA"].loc["2023-03-01":, ["close"]], check_freq=False
+    )
+
+
+def test_register_storage_backend(tmp_path, ticker_data):
+    """Test custom backends are resolved by name and invalid names are rejected."""
+
+    class PickleStorage(StorageBackend):
+        extension = ".pkl"
+
+        def write(self, data, file_path):
+            data.to_pickle(file_path)
+
+        def read(
+            self,
+            file_path,
+            columns=None,
+            start_date=None,
+            end_date=None,
+            date_column="date",
+        ):
+            data = pd.read_pickle(file_path)
+            return data if columns is None else data[columns]
+
+    register_storage_backend("pickle", PickleStorage())
+    try:
+        store_data(ticker_data["BBB"], str(tmp_path / "BBB.pkl"))
+        combined = read_and_combine_ticker_files(
+            str(tmp_path), ["BBB"], storage_format="pickle"
+        )
+        pd.testing.assert_frame_equal(combined, ticker_data["BBB"])
+    finally:
+        del _STORAGE_BACKENDS["pickle"]
+
+    class WriteOnlyStorage(StorageBackend):
+        extension = ".txt"
+
+        def write(self, data, file_path):
+            data.to_csv(file_path)
+
+    with pytest.raises(TypeError):
+        WriteOnlyStorage()
+
+    assert isinstance(get_storage_backend("CSV"), CSVStorage)
+    with pytest.raises(ValueError, match="Invalid storage format"):
+        get_storage_backend("hdf5")